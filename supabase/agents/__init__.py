@@ -5,12 +5,31 @@ This package contains agents for automated collection, validation,
 and integration of scientific research into the knowledge base.
 """
 
+import importlib
+from typing import Any
+
 from .base_agent import BaseAgent
-from .research_agent import ResearchAgent
-from .extraction_agent import ExtractionAgent
-from .validation_agent import ValidationAgent
-from .kb_agent import KnowledgeBaseAgent
-from .conflict_agent import ConflictAgent
+
+# Concrete agents are imported lazily (PEP 562): importing one agent module
+# shouldn't pull in the LLM and scraping dependencies of all the others
+_LAZY_EXPORTS = {
+    'ResearchAgent': '.research_agent',
+    'ExtractionAgent': '.extraction_agent',
+    'ValidationAgent': '.validation_agent',
+    'KnowledgeBaseAgent': '.kb_agent',
+    'ConflictAgent': '.conflict_agent',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported agent classes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'BaseAgent',
@@ -19,4 +38,4 @@ __all__ = [
     'ValidationAgent',
     'KnowledgeBaseAgent',
     'ConflictAgent',
-]
\ No newline at end of file
+]
@@ -110,28 +110,12 @@ class BaseAgent(ABC):
         
         try:
             while self.is_running and not self._shutdown_event.is_set():
-                try:
-                    iteration += 1
-                    if max_iterations and iteration > max_iterations:
-                        self.logger.info(f"[{self.name}] Max iterations reached, stopping")
-                        break
-                    
-                    await self.before_run()
-                    self.last_run = datetime.utcnow()
-                    
-                    # Track current task for graceful shutdown
-                    self._current_task = asyncio.create_task(self.process())
-                    result = await self._current_task
-                    self.processed_count += 1
-                    self._current_task = None
-                    
-                    await self.after_run(result)
-                    
-                except asyncio.CancelledError:
-                    self.logger.info(f"[{self.name}] Processing cancelled")
-                    raise
-                except Exception as e:
-                    await self.on_error(e)
+                iteration += 1
+                if max_iterations and iteration > max_iterations:
+                    self.logger.info(f"[{self.name}] Max iterations reached, stopping")
+                    break
+                
+                await self.run_iteration()
                 
                 if self.is_running and not self._shutdown_event.is_set():
                     self.logger.debug(f"[{self.name}] Sleeping for {interval_seconds}s")
@@ -149,6 +133,36 @@ class BaseAgent(ABC):
         finally:
             await self._perform_shutdown()
     
+    async def run_iteration(self) -> None:
+        """
+        Run a single process() iteration with the before/after/error hooks.
+        
+        Used by run() and by schedulers that own the timing between iterations.
+        """
+        try:
+            await self.before_run()
+            self.last_run = datetime.utcnow()
+            
+            # Track current task for graceful shutdown
+            self._current_task = asyncio.create_task(self.process())
+            result = await self._current_task
+            self.processed_count += 1
+            self._current_task = None
+            
+            await self.after_run(result)
+            
+        except asyncio.CancelledError:
+            self.logger.info(f"[{self.name}] Processing cancelled")
+            raise
+        except Exception as e:
+            await self.on_error(e)
+    
+    async def close(self) -> None:
+        """
+        Run the graceful shutdown for an agent driven through run_iteration().
+        """
+        await self._perform_shutdown()
+    
     async def _perform_shutdown(self) -> None:
         """Internal method to perform graceful shutdown."""
         self.logger.info(f"[{self.name}] Performing graceful shutdown...")
@@ -201,9 +215,10 @@ class BaseAgent(ABC):
         self.stop()
         
         # Wait for shutdown to complete
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         while self.is_running:
-            if asyncio.get_event_loop().time() - start_time > timeout:
+            if loop.time() - start_time > timeout:
                 self.logger.warning(f"[{self.name}] Shutdown timed out after {timeout}s")
                 return False
             await asyncio.sleep(0.1)
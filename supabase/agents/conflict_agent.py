@@ -2,12 +2,13 @@
 Conflict Agent (🔄) - Выявление и разрешение конфликтующих claims
 """
 
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Mapping, Set
 from dataclasses import dataclass
 from collections import defaultdict
+import asyncio
 
 from agents.base_agent import BaseAgent
-from services.supabase_client import SupabaseClient, ScientificClaim, KnowledgeRelationship
+from services.supabase_client import SupabaseClient, ScientificClaim, KnowledgeRelationship, SimilarClaim
 from services.llm_service import LLMService
 
 
@@ -152,7 +153,7 @@ class ConflictAgent(BaseAgent):
         
         return conflicts
     
-    async def _find_similar_claims(self, claim: ScientificClaim) -> List[Dict[str, Any]]:
+    async def _find_similar_claims(self, claim: ScientificClaim) -> List[SimilarClaim]:
         """Find claims similar to the given claim."""
         if not self.llm:
             return []
@@ -175,7 +176,7 @@ class ConflictAgent(BaseAgent):
     async def _analyze_conflict(
         self,
         claim: ScientificClaim,
-        other: Dict[str, Any]
+        other: Mapping[str, Any]
     ) -> bool:
         """
         Analyze if two claims actually conflict.
@@ -213,7 +214,7 @@ class ConflictAgent(BaseAgent):
     def _heuristic_conflict_check(
         self,
         claim: ScientificClaim,
-        other: Dict[str, Any]
+        other: Mapping[str, Any]
     ) -> bool:
         """
         Simple heuristic conflict detection.
@@ -389,12 +390,18 @@ class ConflictAgent(BaseAgent):
         # Build conflict graph
         conflict_graph = defaultdict(list)
         
-        for claim in claims:
-            if claim.conflicting_evidence:
-                relationships = await self.supabase.get_relationships_for_claim(claim.id or "")
-                for rel in relationships:
-                    if rel.relationship_type == 'contradicts':
-                        conflict_graph[claim.id].append(rel.target_claim_id)
+        # Lookups run concurrently so the client's batch loader can
+        # coalesce them into a few queries instead of one per claim
+        conflicting = [claim for claim in claims if claim.conflicting_evidence]
+        all_relationships = await asyncio.gather(*(
+            self.supabase.get_relationships_for_claim(claim.id or "")
+            for claim in conflicting
+        ))
+        
+        for claim, relationships in zip(conflicting, all_relationships):
+            for rel in relationships:
+                if rel.relationship_type == 'contradicts':
+                    conflict_graph[claim.id].append(rel.target_claim_id)
         
         # Calculate metrics
         total_conflicting = len(conflict_graph)
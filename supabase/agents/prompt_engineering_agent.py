@@ -8,7 +8,7 @@ Prompt Engineering Agent (📝) - Генерация системных пром
 - A/B тестирование промптов
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 import json
@@ -125,7 +125,7 @@ Core principles:
         self,
         supabase: SupabaseClient,
         llm_service: Optional[Any] = None,
-        categories: Optional[List[str]] = None
+        categories: Optional[Sequence[str]] = None
     ):
         super().__init__(name="PromptEngineeringAgent", supabase=supabase)
         self.llm = llm_service
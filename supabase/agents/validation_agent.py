@@ -7,14 +7,16 @@ Enhanced with:
 - Streamlined approval for authoritative sources
 """
 
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, FrozenSet, Set
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import re
 
 from agents.base_agent import BaseAgent
-from services.supabase_client import SupabaseClient, ScientificClaim
+from services.supabase_client import SupabaseClient, ScientificClaim, SimilarClaim
 from services.llm_service import LLMService
+from utils.dedup import cluster_near_duplicates
 
 
 @dataclass
@@ -29,6 +31,24 @@ class ValidationResult:
     auto_validated: bool = False  # True if auto-validated from trusted source
 
 
+@lru_cache(maxsize=4096)
+def _is_trusted_cached(normalized: str, trusted_journals: FrozenSet[str]) -> bool:
+    """
+    Match a normalized journal name against a trusted journals snapshot.
+
+    Claims in a batch often share a journal, so results are cached. The
+    snapshot is part of the key, so reloading journals invalidates entries.
+    """
+    # Check exact match
+    if normalized in trusted_journals:
+        return True
+    # Check partial match
+    for trusted in trusted_journals:
+        if trusted in normalized or normalized in trusted:
+            return True
+    return False
+
+
 class ValidationAgent(BaseAgent):
     """
     Validation Agent responsible for:
@@ -45,6 +65,18 @@ class ValidationAgent(BaseAgent):
     # Minimum evidence level for auto-validation
     AUTO_VALIDATE_MIN_EVIDENCE = 4
 
+    # Similarity above which a claim is treated as a duplicate
+    DUPLICATE_SIMILARITY = 0.95
+
+    # Search slightly below similarity_threshold to catch borderline claims
+    SEARCH_THRESHOLD_MARGIN = 0.1
+
+    # (minimum sample size, score bonus), checked in order
+    SAMPLE_SIZE_BONUSES = ((100, 0.1), (50, 0.05))
+
+    # Estimated Jaccard similarity for near-duplicate drafts within a batch
+    BATCH_DUPLICATE_THRESHOLD = 0.85
+
     def __init__(
         self,
         supabase: SupabaseClient,
@@ -58,6 +90,7 @@ class ValidationAgent(BaseAgent):
         self.llm = llm_service
         self.batch_size = batch_size
         self.similarity_threshold = similarity_threshold
+        self._search_threshold = similarity_threshold - self.SEARCH_THRESHOLD_MARGIN
         self.min_evidence_level = min_evidence_level
         self.enable_auto_validation = enable_auto_validation
         self.stats['claims_validated'] = 0
@@ -66,7 +99,7 @@ class ValidationAgent(BaseAgent):
         self.stats['claims_auto_validated'] = 0
 
         # Cached trusted journals (loaded from DB)
-        self._trusted_journals: Set[str] = set()
+        self._trusted_journals: FrozenSet[str] = frozenset()
         self._trusted_journals_loaded = False
     
     async def _load_trusted_journals(self) -> None:
@@ -76,19 +109,21 @@ class ValidationAgent(BaseAgent):
 
         try:
             journals = await self.supabase.get_trusted_journals()
+            names = set()
             for journal in journals:
                 # Add normalized name
                 name = journal.get('normalized_name', '').lower()
                 if name:
-                    self._trusted_journals.add(name)
+                    names.add(name)
                 # Add short name
                 short_name = journal.get('short_name', '')
                 if short_name:
-                    self._trusted_journals.add(short_name.lower())
+                    names.add(short_name.lower())
                 # Add full name
                 full_name = journal.get('name', '').lower()
                 if full_name:
-                    self._trusted_journals.add(full_name)
+                    names.add(full_name)
+            self._trusted_journals = frozenset(names)
 
             self._trusted_journals_loaded = True
             self.logger.info(f"Loaded {len(self._trusted_journals)} trusted journal names")
@@ -100,24 +135,16 @@ class ValidationAgent(BaseAgent):
         """Check if a journal is in the trusted list."""
         if not journal_name:
             return False
-        normalized = journal_name.lower().strip()
-        # Check exact match
-        if normalized in self._trusted_journals:
-            return True
-        # Check partial match
-        for trusted in self._trusted_journals:
-            if trusted in normalized or normalized in trusted:
-                return True
-        return False
+        return _is_trusted_cached(journal_name.lower().strip(), self._trusted_journals)
 
     def _is_auto_validatable(self, claim: ScientificClaim) -> bool:
         """
         Check if claim qualifies for auto-validation.
 
         Auto-validation criteria:
-        1. Has a DOI (verifiable source)
+        1. Study design is meta-analysis or systematic review
         2. High evidence level (4+)
-        3. Study design is meta-analysis or systematic review
+        3. Has a DOI (verifiable source)
         4. From a trusted journal
 
         Args:
@@ -129,16 +156,18 @@ class ValidationAgent(BaseAgent):
         if not self.enable_auto_validation:
             return False
 
-        # Must have DOI
-        if not claim.source_doi:
+        # Checks are ordered cheapest and most selective first: only a small
+        # share of drafts are meta-analyses/systematic reviews, so most claims
+        # return here before any journal matching is done.
+        if claim.study_design not in self.AUTO_VALIDATE_STUDY_DESIGNS:
             return False
 
         # Must have high evidence level
         if claim.evidence_level < self.AUTO_VALIDATE_MIN_EVIDENCE:
             return False
 
-        # Must be meta-analysis or systematic review
-        if claim.study_design not in self.AUTO_VALIDATE_STUDY_DESIGNS:
+        # Must have DOI
+        if not claim.source_doi:
             return False
 
         # Must be from trusted journal (check source_title or source_url for journal)
@@ -173,7 +202,7 @@ class ValidationAgent(BaseAgent):
 
         if not draft_claims:
             self.logger.info("No draft claims to validate")
-            return {'validated': 0, 'approved': 0, 'rejected': 0, 'auto_validated': 0}
+            return {'validated': 0, 'approved': 0, 'rejected': 0, 'auto_validated': 0, 'batch_duplicates': 0}
 
         self.logger.info(f"Found {len(draft_claims)} draft claims to validate")
 
@@ -182,10 +211,18 @@ class ValidationAgent(BaseAgent):
             'approved': 0,
             'rejected': 0,
             'auto_validated': 0,
+            'batch_duplicates': 0,
             'details': []
         }
 
+        # Near-duplicates within the batch skip validation (and LLM calls),
+        # but are only rejected once their canonical claim is approved
+        batch_duplicates = self._find_batch_duplicates(draft_claims)
+        approved_ids: Set[str] = set()
+
         for claim in draft_claims:
+            if claim.id in batch_duplicates:
+                continue
             try:
                 # Check if claim qualifies for auto-validation
                 if self._is_auto_validatable(claim):
@@ -199,6 +236,7 @@ class ValidationAgent(BaseAgent):
                         auto_validated=True
                     )
                     await self._approve_claim(claim, validation_result, auto_validated=True)
+                    approved_ids.add(validation_result.claim_id)
                     results['approved'] += 1
                     results['auto_validated'] += 1
                     results['details'].append({
@@ -217,6 +255,7 @@ class ValidationAgent(BaseAgent):
                     if validation_result.is_valid:
                         # Approve claim
                         await self._approve_claim(claim, validation_result)
+                        approved_ids.add(validation_result.claim_id)
                         results['approved'] += 1
                         results['details'].append({
                             'claim_id': claim.id,
@@ -242,6 +281,42 @@ class ValidationAgent(BaseAgent):
                 self.logger.error(f"Error validating claim {claim.id}: {e}")
                 continue
 
+        for claim in draft_claims:
+            canonical = batch_duplicates.get(claim.id)
+            if canonical is None:
+                continue
+            if canonical not in approved_ids:
+                # Left as a draft: the next run validates it on its own
+                # since the canonical claim is no longer a draft
+                self.logger.debug(
+                    f"Claim {claim.id} re-queued: canonical claim {canonical} was not approved"
+                )
+                continue
+            try:
+                validation_result = ValidationResult(
+                    claim_id=claim.id or "",
+                    is_valid=False,
+                    validation_score=0.0,
+                    rejection_reasons=[f"Duplicate of claim {canonical}"],
+                    duplicate_of=canonical,
+                    conflicts_with=[]
+                )
+                await self._reject_claim(claim, validation_result)
+                results['rejected'] += 1
+                results['batch_duplicates'] += 1
+                results['details'].append({
+                    'claim_id': claim.id,
+                    'action': 'rejected',
+                    'reasons': validation_result.rejection_reasons
+                })
+                self.stats['claims_rejected'] += 1
+                results['validated'] += 1
+                self.stats['claims_validated'] += 1
+
+            except Exception as e:
+                self.logger.error(f"Error validating claim {claim.id}: {e}")
+                continue
+
         self.logger.info(
             f"Validation complete. Validated {results['validated']} claims: "
             f"{results['approved']} approved ({results['auto_validated']} auto), "
@@ -250,6 +325,45 @@ class ValidationAgent(BaseAgent):
 
         return results
     
+    def _find_batch_duplicates(self, claims: List[ScientificClaim]) -> Dict[str, str]:
+        """
+        Find near-duplicate claims within a batch.
+
+        Claims are clustered by MinHash similarity of their text; the claim
+        with the highest evidence level in each cluster is kept.
+
+        Args:
+            claims: Draft claims to check
+
+        Returns:
+            Mapping of duplicate claim ID to the canonical claim ID
+        """
+        if len(claims) < 2:
+            return {}
+
+        clusters: Dict[int, List[ScientificClaim]] = {}
+        labels = cluster_near_duplicates(
+            [claim.claim for claim in claims],
+            threshold=self.BATCH_DUPLICATE_THRESHOLD
+        )
+        for claim, label in zip(claims, labels):
+            clusters.setdefault(label, []).append(claim)
+
+        duplicates: Dict[str, str] = {}
+        for members in clusters.values():
+            if len(members) < 2:
+                continue
+            canonical = max(members, key=lambda c: c.evidence_level)
+            if not canonical.id:
+                continue
+            for claim in members:
+                if claim is not canonical and claim.id:
+                    duplicates[claim.id] = canonical.id
+
+        if duplicates:
+            self.logger.info(f"Found {len(duplicates)} near-duplicate claims in batch")
+        return duplicates
+
     async def _get_draft_claims(self, limit: int = 10) -> List[ScientificClaim]:
         """Fetch draft claims from database."""
         # For now, we'll fetch all active claims and filter by status
@@ -272,7 +386,7 @@ class ValidationAgent(BaseAgent):
         """
         rejection_reasons = []
         duplicate_of = None
-        conflicts_with = []
+        conflicts_with: Dict[str, None] = {}  # Ordered set of claim IDs
         
         # 1. Check evidence level
         if claim.evidence_level < self.min_evidence_level:
@@ -282,19 +396,21 @@ class ValidationAgent(BaseAgent):
         
         # 2. Check for duplicates using embeddings
         similar_claims = await self._find_similar_claims(claim)
+        threshold = self.similarity_threshold
+        duplicate_similarity = self.DUPLICATE_SIMILARITY
         
         for similar in similar_claims:
-            similarity = similar.get('similarity', 0)
-            if similarity > 0.95:
+            similarity = similar['similarity']
+            if similarity > duplicate_similarity:
                 # High similarity - likely duplicate
-                duplicate_of = similar.get('id')
+                duplicate_of = similar['id']
                 rejection_reasons.append(f"Duplicate of claim {duplicate_of}")
                 break
-            elif similarity > self.similarity_threshold:
+            elif similarity > threshold:
                 # Moderate similarity - check for conflict
                 is_conflict = await self._check_conflict(claim, similar)
                 if is_conflict:
-                    conflicts_with.append(similar.get('id'))
+                    conflicts_with[similar['id']] = None
         
         # 3. Validate with LLM if available
         if self.llm and not duplicate_of:
@@ -316,7 +432,7 @@ class ValidationAgent(BaseAgent):
                 duplicate_of = llm_validation['duplicate_of']
                 rejection_reasons.append(f"Duplicate of claim {duplicate_of}")
             
-            conflicts_with.extend(llm_validation.get('conflicts_with', []))
+            conflicts_with.update(dict.fromkeys(llm_validation.get('conflicts_with', [])))
         
         # 4. Calculate validation score
         validation_score = self._calculate_validation_score(
@@ -336,10 +452,10 @@ class ValidationAgent(BaseAgent):
             validation_score=validation_score,
             rejection_reasons=rejection_reasons,
             duplicate_of=duplicate_of,
-            conflicts_with=list(set(conflicts_with))  # Remove duplicates
+            conflicts_with=list(conflicts_with)
         )
     
-    async def _find_similar_claims(self, claim: ScientificClaim) -> List[Dict[str, Any]]:
+    async def _find_similar_claims(self, claim: ScientificClaim) -> List[SimilarClaim]:
         """Find similar claims using semantic search."""
         # Generate embedding for the claim
         if not self.llm:
@@ -352,17 +468,18 @@ class ValidationAgent(BaseAgent):
         # Search for similar claims
         similar = await self.supabase.find_similar_claims(
             embedding=embedding,
-            threshold=self.similarity_threshold - 0.1,  # Slightly lower threshold for search
+            threshold=self._search_threshold,
             limit=5
         )
         
         # Filter out the claim itself
-        return [s for s in similar if s.get('id') != claim.id]
+        claim_id = claim.id
+        return [s for s in similar if s['id'] != claim_id]
     
     async def _check_conflict(
         self,
         claim: ScientificClaim,
-        other_claim: Dict[str, Any]
+        other_claim: SimilarClaim
     ) -> bool:
         """
         Check if two claims conflict.
@@ -376,7 +493,7 @@ class ValidationAgent(BaseAgent):
         """
         if not self.llm:
             # Simple heuristic: different evidence levels for same claim
-            other_evidence = other_claim.get('evidence_level', 3)
+            other_evidence = other_claim['evidence_level']
             if abs(claim.evidence_level - other_evidence) >= 2:
                 return True
             return False
@@ -386,9 +503,10 @@ class ValidationAgent(BaseAgent):
             claim_a=claim.claim,
             evidence_level_a=claim.evidence_level,
             study_design_a=claim.study_design or 'unknown',
-            claim_b=other_claim.get('claim', ''),
-            evidence_level_b=other_claim.get('evidence_level', 3),
-            study_design_b=other_claim.get('study_design', 'unknown')
+            claim_b=other_claim['claim'],
+            evidence_level_b=other_claim['evidence_level'],
+            # match_scientific_knowledge doesn't return the study design
+            study_design_b='unknown'
         )
         
         return conflict_result.get('conflict_detected', False)
@@ -397,7 +515,7 @@ class ValidationAgent(BaseAgent):
         self,
         claim: ScientificClaim,
         rejection_reasons: List[str],
-        similar_claims: List[Dict[str, Any]]
+        similar_claims: List[SimilarClaim]
     ) -> float:
         """
         Calculate overall validation score.
@@ -412,11 +530,12 @@ class ValidationAgent(BaseAgent):
         score += evidence_boost
         
         # Boost for sample size
-        if claim.sample_size:
-            if claim.sample_size >= 100:
-                score += 0.1
-            elif claim.sample_size >= 50:
-                score += 0.05
+        sample_size = claim.sample_size
+        if sample_size:
+            for min_size, bonus in self.SAMPLE_SIZE_BONUSES:
+                if sample_size >= min_size:
+                    score += bonus
+                    break
         
         # Penalty for rejection reasons
         score -= len(rejection_reasons) * 0.2
@@ -19,6 +19,7 @@ import os
 import sys
 import argparse
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # Try to load from .env file
 def load_env():
@@ -50,6 +51,29 @@ except ImportError:
     sys.exit(1)
 
 
+# Postgres SQLSTATE codes for objects that already exist
+SKIP_SQLSTATE_CODES = frozenset({
+    '42P07',  # duplicate_table
+    '42710',  # duplicate_object
+    '42P06',  # duplicate_schema
+    '42701',  # duplicate_column
+    '42723',  # duplicate_function
+    '23505',  # unique_violation
+})
+
+
+def is_already_exists_error(error: Exception) -> bool:
+    """Check if an error means the object already exists (safe to skip)."""
+    # postgrest APIError carries the SQLSTATE in .code
+    code = getattr(error, 'code', None)
+    if code:
+        return code in SKIP_SQLSTATE_CODES
+
+    # Fall back to message matching when no code is available
+    error_msg = str(error).lower()
+    return 'already exists' in error_msg or 'duplicate' in error_msg
+
+
 def find_migration_file(migration_number: str = None) -> Path:
     """Find migration file by number or return latest."""
     migrations_dir = Path(__file__).parent / 'migrations'
@@ -75,87 +99,90 @@ def find_migration_file(migration_number: str = None) -> Path:
         return latest
 
 
-def apply_migration(migration_path: Path):
-    """Apply the migration SQL file."""
-    if not migration_path.exists():
-        print(f"Error: Migration file not found: {migration_path}")
-        sys.exit(1)
-    
-    print(f"Reading migration file: {migration_path}")
-    with open(migration_path) as f:
-        sql = f.read()
-    
-    print(f"Connecting to Supabase: {SUPABASE_URL}")
-    supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
-    
-    # Split SQL into individual statements
-    # This is a simple split - for complex migrations consider using a proper SQL parser
-    statements = []
+def iter_statements(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Split SQL into individual statements, yielding each one as it completes.
+
+    This is a simple line-based split - for complex migrations consider
+    using a proper SQL parser.
+    """
     current_statement = []
     in_do_block = False
-    
-    for line in sql.split('\n'):
+
+    for line in lines:
+        line = line.rstrip('\n')
         stripped = line.strip()
-        
+
         # Skip comments and empty lines
         if not stripped or stripped.startswith('--'):
             continue
-        
+
         # Track DO blocks
         if stripped.upper().startswith('DO'):
             in_do_block = True
-        
+
         current_statement.append(line)
-        
+
         # Check if statement ends
         if in_do_block:
             # End of DO block (END; or END$$;)
             if stripped.upper() in ['END;', 'END$$;', 'END $$;'] or stripped == '$$;':
-                statements.append('\n'.join(current_statement))
+                yield '\n'.join(current_statement)
                 current_statement = []
                 in_do_block = False
         else:
             # Regular statement ending with semicolon
             if stripped.endswith(';') and not stripped.upper().startswith('DO'):
-                statements.append('\n'.join(current_statement))
+                yield '\n'.join(current_statement)
                 current_statement = []
-    
-    # Add any remaining statement
+
+    # Yield any remaining statement
     if current_statement:
-        statements.append('\n'.join(current_statement))
+        yield '\n'.join(current_statement)
+
+
+def apply_migration(migration_path: Path):
+    """Apply the migration SQL file."""
+    if not migration_path.exists():
+        print(f"Error: Migration file not found: {migration_path}")
+        sys.exit(1)
     
-    print(f"Found {len(statements)} SQL statements to execute")
+    print(f"Connecting to Supabase: {SUPABASE_URL}")
+    supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
     
-    # Execute each statement
+    # Execute each statement as it is read, so the file is never
+    # held in memory as a whole
+    print(f"Reading migration file: {migration_path}")
     success_count = 0
     error_count = 0
     skipped_count = 0
     
-    for i, statement in enumerate(statements, 1):
-        # Skip empty statements
-        if not statement.strip():
-            continue
-        
-        # Show first 50 chars of statement for context
-        preview = statement.strip()[:50].replace('\n', ' ')
-        if len(statement.strip()) > 50:
-            preview += "..."
-        
-        try:
-            # Use RPC to execute SQL
-            result = supabase.rpc('exec_sql', {'sql': statement}).execute()
-            print(f"  [{i}/{len(statements)}] ✓ Success: {preview}")
-            success_count += 1
-        except Exception as e:
-            error_msg = str(e)
-            # Check if it's a "relation already exists" or similar non-critical error
-            if any(x in error_msg.lower() for x in ['already exists', 'duplicate', 'exists']):
-                print(f"  [{i}/{len(statements)}] ℹ Already exists (skipped): {preview}")
-                skipped_count += 1
-            else:
-                print(f"  [{i}/{len(statements)}] ✗ Error: {error_msg[:100]}")
-                print(f"      Statement: {preview}")
-                error_count += 1
+    with open(migration_path) as f:
+        for i, statement in enumerate(iter_statements(f), 1):
+            # Skip empty statements
+            if not statement.strip():
+                continue
+            
+            # Show first 50 chars of statement for context
+            preview = statement.strip()[:50].replace('\n', ' ')
+            if len(statement.strip()) > 50:
+                preview += "..."
+            
+            try:
+                # Use RPC to execute SQL
+                result = supabase.rpc('exec_sql', {'sql': statement}).execute()
+                print(f"  [{i}] ✓ Success: {preview}")
+                success_count += 1
+            except Exception as e:
+                error_msg = str(e)
+                # Check if it's a "relation already exists" or similar non-critical error
+                if is_already_exists_error(e):
+                    print(f"  [{i}] ℹ Already exists (skipped): {preview}")
+                    skipped_count += 1
+                else:
+                    print(f"  [{i}] ✗ Error: {error_msg[:100]}")
+                    print(f"      Statement: {preview}")
+                    error_count += 1
     
     print(f"\n{'='*50}")
     print(f"Migration complete!")
@@ -1,14 +1,21 @@
 """Configuration management for Agent Swarm."""
 
-from .settings import Settings, get_settings, reload_settings
-from .environments import DevelopmentConfig, ProductionConfig, TestingConfig, get_config_for_environment
+from .settings import Settings, LLM_PROVIDER_PRIORITY, get_settings, reload_settings
+from .environments import (
+    DevelopmentConfig, ProductionConfig, TestingConfig,
+    get_config_for_environment, reload_config_for_environment
+)
+from .legacy import Config
 
 __all__ = [
     'Settings',
+    'LLM_PROVIDER_PRIORITY',
     'get_settings',
     'reload_settings',
     'DevelopmentConfig',
     'ProductionConfig',
     'TestingConfig',
     'get_config_for_environment',
+    'reload_config_for_environment',
+    'Config',
 ]
@@ -7,142 +7,189 @@ This module provides pre-configured settings for different environments:
 - Testing: Fast intervals for quick test execution
 """
 
-from .settings import Settings
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
+from .settings import Settings, _ENV_FILE, _LOG_DEBUG, _LOG_INFO
 
-class DevelopmentConfig(Settings):
-    """
-    Development environment configuration.
-    
-    Features:
-    - Debug logging for detailed output
-    - More frequent agent runs for faster iteration
-    - Shorter health check intervals
-    - Higher rate limits for testing
-    """
-    
+
+# Presets only list fields that differ from Settings defaults. All
+# environments share the single Settings schema instead of subclassing it.
+
+# Development:
+# - Debug logging for detailed output
+# - More frequent agent runs for faster iteration
+# - Shorter health check intervals
+# - Higher rate limits for testing
+_DEV_OVERRIDES: Dict[str, Any] = {
     # Logging
-    log_level: str = "DEBUG"
+    'log_level': _LOG_DEBUG,
     
     # Monitoring - more frequent for development
-    health_check_interval: int = 30
-    metrics_collection_interval: int = 60
+    'health_check_interval': 30,
+    'metrics_collection_interval': 60,
     
     # Agent Intervals - more frequent for development
-    research_interval: int = 3600      # 1 hour (vs 1 day)
-    extraction_interval: int = 300     # 5 min (vs 30 min)
-    validation_interval: int = 180     # 3 min (vs 15 min)
-    kb_interval: int = 120             # 2 min (vs 10 min)
-    conflict_interval: int = 600       # 10 min (vs 1 hour)
+    'research_interval': 3600,      # 1 hour (vs 1 day)
+    'extraction_interval': 300,     # 5 min (vs 30 min)
+    'validation_interval': 180,     # 3 min (vs 15 min)
+    'kb_interval': 120,             # 2 min (vs 10 min)
+    'conflict_interval': 600,       # 10 min (vs 1 hour)
     
     # Rate Limits - more permissive for development
-    pubmed_rate_limit: float = 5.0
-    crossref_rate_limit: float = 15.0
-    openai_rate_limit: float = 10.0
+    'pubmed_rate_limit': 5.0,
+    'crossref_rate_limit': 15.0,
+    'openai_rate_limit': 10.0,
     
     # Retry - faster retries
-    retry_backoff: float = 1.0
-    retry_max_wait: int = 5
-    
-    model_config = {"env_file": (".env", ".env.development"), "extra": "ignore"}
-
+    'retry_backoff': 1.0,
+    'retry_max_wait': 5,
+}
 
-class ProductionConfig(Settings):
-    """
-    Production environment configuration.
-    
-    Features:
-    - Info level logging (cleaner output)
-    - Conservative rate limits to avoid API quotas
-    - Longer intervals for stability
-    - Higher retry thresholds
-    """
-    
+# Production:
+# - Info level logging (cleaner output)
+# - Conservative rate limits to avoid API quotas
+# - Longer intervals for stability
+# - Higher retry thresholds
+_PROD_OVERRIDES: Dict[str, Any] = {
     # Logging
-    log_level: str = "INFO"
+    'log_level': _LOG_INFO,
     
     # Monitoring - standard intervals
-    health_check_interval: int = 60
-    metrics_collection_interval: int = 300
+    'health_check_interval': 60,
+    'metrics_collection_interval': 300,
     
     # Agent Intervals - conservative for stability
-    research_interval: int = 86400     # 1 day
-    extraction_interval: int = 1800    # 30 min
-    validation_interval: int = 900     # 15 min
-    kb_interval: int = 600             # 10 min
-    conflict_interval: int = 3600      # 1 hour
+    'research_interval': 86400,     # 1 day
+    'extraction_interval': 1800,    # 30 min
+    'validation_interval': 900,     # 15 min
+    'kb_interval': 600,             # 10 min
+    'conflict_interval': 3600,      # 1 hour
     
     # Rate Limits - conservative to avoid quotas
-    pubmed_rate_limit: float = 2.0
-    crossref_rate_limit: float = 5.0
-    openai_rate_limit: float = 3.0
-    rss_rate_limit: float = 1.0
+    'pubmed_rate_limit': 2.0,
+    'crossref_rate_limit': 5.0,
+    'openai_rate_limit': 3.0,
+    'rss_rate_limit': 1.0,
     
     # Circuit Breaker - more tolerant
-    circuit_breaker_fail_max: int = 10
-    circuit_breaker_reset_timeout: int = 120
+    'circuit_breaker_fail_max': 10,
+    'circuit_breaker_reset_timeout': 120,
     
     # Retry - more patient
-    max_retries: int = 5
-    retry_backoff: float = 2.0
-    retry_max_wait: int = 30
-    
-    model_config = {"env_file": (".env", ".env.production"), "extra": "ignore"}
-
+    'max_retries': 5,
+    'retry_backoff': 2.0,
+    'retry_max_wait': 30,
+}
 
-class TestingConfig(Settings):
-    """
-    Testing environment configuration.
-    
-    Features:
-    - Fast intervals for quick test execution
-    - Debug logging for troubleshooting
-    - Minimal retries for faster failure
-    """
-    
+# Testing:
+# - Fast intervals for quick test execution
+# - Debug logging for troubleshooting
+# - Minimal retries for faster failure
+_TEST_OVERRIDES: Dict[str, Any] = {
     # Logging
-    log_level: str = "DEBUG"
+    'log_level': _LOG_DEBUG,
     
     # Monitoring - minimal
-    health_check_interval: int = 10
-    metrics_collection_interval: int = 30
+    'health_check_interval': 10,
+    'metrics_collection_interval': 30,
     
     # Agent Intervals - very fast for tests
-    research_interval: int = 60        # 1 min
-    extraction_interval: int = 30      # 30 sec
-    validation_interval: int = 15      # 15 sec
-    kb_interval: int = 10              # 10 sec
-    conflict_interval: int = 20        # 20 sec
+    'research_interval': 60,        # 1 min
+    'extraction_interval': 30,      # 30 sec
+    'validation_interval': 15,      # 15 sec
+    'kb_interval': 10,              # 10 sec
+    'conflict_interval': 20,        # 20 sec
     
     # Batch Sizes - small for tests
-    research_batch_size: int = 5
-    extraction_batch_size: int = 2
-    validation_batch_size: int = 3
-    kb_batch_size: int = 3
-    conflict_batch_size: int = 3
+    'research_batch_size': 5,
+    'extraction_batch_size': 2,
+    'validation_batch_size': 3,
+    'kb_batch_size': 3,
+    'conflict_batch_size': 3,
     
     # Rate Limits - high for fast tests
-    pubmed_rate_limit: float = 100.0
-    crossref_rate_limit: float = 100.0
-    openai_rate_limit: float = 100.0
-    rss_rate_limit: float = 100.0
+    'pubmed_rate_limit': 100.0,
+    'crossref_rate_limit': 100.0,
+    'openai_rate_limit': 100.0,
+    'rss_rate_limit': 100.0,
     
     # Retry - minimal for fast failure
-    max_retries: int = 1
-    retry_backoff: float = 0.1
-    retry_max_wait: int = 1
+    'max_retries': 1,
+    'retry_backoff': 0.1,
+    'retry_max_wait': 1,
     
     # Circuit Breaker - very sensitive
-    circuit_breaker_fail_max: int = 2
-    circuit_breaker_reset_timeout: int = 5
+    'circuit_breaker_fail_max': 2,
+    'circuit_breaker_reset_timeout': 5,
+}
+
+# Environment name -> (preset overrides, env files)
+_ENVIRONMENT_PRESETS: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = {
+    'development': (_DEV_OVERRIDES, (_ENV_FILE, ".env.development")),
+    'production': (_PROD_OVERRIDES, (_ENV_FILE, ".env.production")),
+    'testing': (_TEST_OVERRIDES, (_ENV_FILE, ".env.testing")),
+}
+
+
+def _build_settings(environment: str, **values: Any) -> Settings:
+    """
+    Create Settings for an environment preset.
     
-    model_config = {"env_file": (".env", ".env.testing"), "extra": "ignore"}
+    Precedence matches pydantic-settings: explicit values, then environment
+    variables and env files, then the preset, then Settings defaults.
+    """
+    overrides, env_file = _ENVIRONMENT_PRESETS[environment]
+    settings = Settings(_env_file=env_file, **values)
+    # Fields not given explicitly or via environment fall back to the preset
+    preset = {
+        name: value for name, value in overrides.items()
+        if name not in settings.model_fields_set
+    }
+    return settings.model_copy(update=preset) if preset else settings
+
+
+# Preset constructors, kept callable under their former class names for
+# backward compatibility
+
+def DevelopmentConfig(**values: Any) -> Settings:  # noqa: N802
+    """Development environment configuration (frequent runs, debug logging)."""
+    return _build_settings('development', **values)
+
+
+def ProductionConfig(**values: Any) -> Settings:  # noqa: N802
+    """Production environment configuration (conservative limits, info logging)."""
+    return _build_settings('production', **values)
+
+
+def TestingConfig(**values: Any) -> Settings:  # noqa: N802
+    """Testing environment configuration (fast intervals, minimal retries)."""
+    return _build_settings('testing', **values)
+
+
+_ENVIRONMENT_CONFIGS = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+    'dev': DevelopmentConfig,
+    'prod': ProductionConfig,
+    'test': TestingConfig,
+}
+
+
+@lru_cache(maxsize=8)
+def _load_config(env_lower: str) -> Settings:
+    """Instantiate (and cache) the settings for a normalized environment name."""
+    return _ENVIRONMENT_CONFIGS[env_lower]()
 
 
 def get_config_for_environment(environment: str) -> Settings:
     """
     Get configuration for a specific environment.
     
+    Settings are created once per environment and cached; use
+    reload_config_for_environment() to pick up changes.
+    
     Args:
         environment: Environment name ('development', 'production', 'testing')
         
@@ -152,20 +199,27 @@ def get_config_for_environment(environment: str) -> Settings:
     Raises:
         ValueError: If environment is not recognized
     """
-    configs = {
-        'development': DevelopmentConfig,
-        'production': ProductionConfig,
-        'testing': TestingConfig,
-        'dev': DevelopmentConfig,
-        'prod': ProductionConfig,
-        'test': TestingConfig,
-    }
-    
     env_lower = environment.lower()
-    if env_lower not in configs:
+    if env_lower not in _ENVIRONMENT_CONFIGS:
         raise ValueError(
             f"Unknown environment: {environment}. "
-            f"Choose from: {', '.join(configs.keys())}"
+            f"Choose from: {', '.join(_ENVIRONMENT_CONFIGS.keys())}"
         )
     
-    return configs[env_lower]()
+    return _load_config(env_lower)
+
+
+def reload_config_for_environment(environment: str) -> Settings:
+    """
+    Reload configuration for an environment.
+    
+    Useful for testing or when environment variables change.
+    
+    Args:
+        environment: Environment name ('development', 'production', 'testing')
+        
+    Returns:
+        New Settings instance for the environment
+    """
+    _load_config.cache_clear()
+    return get_config_for_environment(environment)
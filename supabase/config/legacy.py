@@ -1,8 +1,9 @@
 """
 Configuration for Agent Swarm Knowledge System.
 
-This module provides backward compatibility with the old Config class.
-New code should use the config package directly.
+This module provides backward compatibility with the old Config class,
+which is re-exported from the config package. New code should use
+Settings directly.
 
 Example:
     # New way (recommended)
@@ -14,17 +15,34 @@ Example:
     config = Config.from_env()
 """
 
-import os
 import warnings
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Set
 from dataclasses import dataclass, field
 
-# Import new settings for backward compatibility
-from config.settings import Settings, get_settings
-from config.environments import DevelopmentConfig, ProductionConfig, TestingConfig
+if TYPE_CHECKING:
+    from .settings import Settings
 
 
-@dataclass
+# Deprecation messages already emitted in this process
+_emitted_warnings: Set[str] = set()
+
+
+def _warn_deprecated(message: str, stacklevel: int) -> None:
+    """
+    Emit a DeprecationWarning once per process for each message.
+    
+    Args:
+        message: Warning message
+        stacklevel: Frame to attribute the warning to, counted from the
+            caller of this function (1 = the caller itself)
+    """
+    if message in _emitted_warnings:
+        return
+    _emitted_warnings.add(message)
+    warnings.warn(message, DeprecationWarning, stacklevel=stacklevel + 1)
+
+
+@dataclass(slots=True, kw_only=True, repr=False, eq=False)
 class Config:
     """
     Application configuration (legacy class).
@@ -73,15 +91,12 @@ class Config:
     log_level: str = 'INFO'
     
     # Internal settings instance for delegation
-    _settings: Optional[Settings] = field(default=None, repr=False)
+    _settings: Optional['Settings'] = field(default=None, repr=False)
     
     def __post_init__(self):
-        """Initialize and show deprecation warning."""
-        warnings.warn(
-            "Config class is deprecated. Use Settings from config module instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        """Initialize and show deprecation warning (once per process)."""
+        # __post_init__ <- generated __init__ <- caller building Config
+        _warn_deprecated("Config class is deprecated. Use Settings from config module instead.", stacklevel=3)
     
     @classmethod
     def from_env(cls) -> 'Config':
@@ -91,11 +106,9 @@ class Config:
         Returns:
             Config instance
         """
-        warnings.warn(
-            "Config.from_env() is deprecated. Use get_settings() from config module instead.",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        _warn_deprecated("Config.from_env() is deprecated. Use get_settings() from config module instead.", stacklevel=2)
+        
+        from config.settings import get_settings, get_environ
         
         # Try to use new settings first
         try:
@@ -103,50 +116,45 @@ class Config:
             return cls.from_settings(settings)
         except Exception:
             # Fall back to direct environment loading
+            env = get_environ()
             return cls(
-                supabase_url=os.getenv('SUPABASE_URL', ''),
-                supabase_service_key=os.getenv('SUPABASE_SERVICE_KEY', ''),
-                openai_api_key=os.getenv('OPENAI_API_KEY'),
-                anthropic_api_key=os.getenv('ANTHROPIC_API_KEY'),
-                pubmed_api_key=os.getenv('PUBMED_API_KEY'),
-                log_level=os.getenv('LOG_LEVEL', 'INFO'),
+                supabase_url=env.get('SUPABASE_URL', ''),
+                supabase_service_key=env.get('SUPABASE_SERVICE_KEY', ''),
+                openai_api_key=env.get('OPENAI_API_KEY'),
+                anthropic_api_key=env.get('ANTHROPIC_API_KEY'),
+                pubmed_api_key=env.get('PUBMED_API_KEY'),
+                log_level=env.get('LOG_LEVEL', 'INFO'),
             )
     
     @classmethod
-    def from_settings(cls, settings: Settings) -> 'Config':
+    def from_settings(cls, settings: 'Settings') -> 'Config':
         """
         Create Config from Settings instance.
         
+        The returned Config is a view: fields are not copied but read
+        from the shared Settings instance on access.
+        
         Args:
             settings: Settings instance
             
         Returns:
             Config instance
         """
-        return cls(
-            supabase_url=settings.supabase_url,
-            supabase_service_key=settings.supabase_service_key,
-            openai_api_key=settings.openai_api_key,
-            openai_model=settings.openai_model,
-            embedding_model=settings.embedding_model,
-            anthropic_api_key=settings.anthropic_api_key,
-            anthropic_model=settings.anthropic_model,
-            pubmed_api_key=settings.pubmed_api_key,
-            research_interval=settings.research_interval,
-            extraction_interval=settings.extraction_interval,
-            validation_interval=settings.validation_interval,
-            kb_interval=settings.kb_interval,
-            conflict_interval=settings.conflict_interval,
-            research_batch_size=settings.research_batch_size,
-            extraction_batch_size=settings.extraction_batch_size,
-            validation_batch_size=settings.validation_batch_size,
-            kb_batch_size=settings.kb_batch_size,
-            conflict_batch_size=settings.conflict_batch_size,
-            similarity_threshold=settings.similarity_threshold,
-            min_evidence_level=settings.min_evidence_level,
-            log_level=settings.log_level,
-            _settings=settings,
-        )
+        _warn_deprecated("Config class is deprecated. Use Settings from config module instead.", stacklevel=2)
+        # Bypass __init__ so field slots stay unset and fall through to
+        # __getattr__, which delegates to the wrapped settings
+        config = object.__new__(cls)
+        config._settings = settings
+        return config
+    
+    def __getattr__(self, name: str):
+        """Read fields not set on this instance from the wrapped Settings."""
+        if name == '_settings':
+            raise AttributeError(name)
+        settings = self._settings
+        if settings is None:
+            raise AttributeError(name)
+        return getattr(settings, name)
     
     def validate(self) -> List[str]:
         """
@@ -168,7 +176,7 @@ class Config:
         
         return errors
     
-    def to_settings(self) -> Settings:
+    def to_settings(self) -> 'Settings':
         """
         Convert to Settings instance.
         
@@ -178,6 +186,8 @@ class Config:
         if self._settings is not None:
             return self._settings
         
+        from config.settings import Settings
+        
         # Create new settings from config values
         return Settings(
             supabase_url=self.supabase_url,
@@ -204,12 +214,4 @@ class Config:
         )
 
 
-# Re-export new classes for convenience
-__all__ = [
-    'Config',
-    'Settings',
-    'get_settings',
-    'DevelopmentConfig',
-    'ProductionConfig',
-    'TestingConfig',
-]
+__all__ = ['Config']
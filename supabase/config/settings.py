@@ -5,14 +5,37 @@ This module provides centralized configuration with validation,
 support for different environments, and type safety.
 """
 
-from typing import Optional
+from functools import cache, cached_property
+from types import MappingProxyType
+from typing import Annotated, Literal, Mapping, Optional
+import os
+import sys
 
 try:
     from pydantic_settings import BaseSettings
 except ImportError:
     from pydantic import BaseSettings
 
-from pydantic import Field, field_validator
+from pydantic import BeforeValidator, Field, PositiveFloat, PositiveInt
+
+# Default strings shared by Settings and the environment configs, interned
+# so every class body references the same objects
+_LOG_DEBUG = sys.intern('DEBUG')
+_LOG_INFO = sys.intern('INFO')
+_ENV_FILE = sys.intern('.env')
+
+# LLM providers in order of preference when several API keys are set
+LLM_PROVIDER_PRIORITY = ('deepseek', 'kimi', 'openai', 'anthropic')
+
+# Field constraints below are checked by pydantic-core rather than
+# Python-level validators. Empty API keys are allowed (treated as unset).
+SupabaseUrl = Annotated[str, Field(pattern=r'^https?://.*(\.supabase\.co|localhost)')]
+OpenAIKey = Annotated[str, Field(pattern=r'^(sk-|$)')]
+AnthropicKey = Annotated[str, Field(pattern=r'^(sk-ant-|$)')]
+LogLevel = Annotated[
+    Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+    BeforeValidator(lambda v: v.upper() if isinstance(v, str) else v)
+]
 
 
 class Settings(BaseSettings):
@@ -24,13 +47,13 @@ class Settings(BaseSettings):
     """
     
     # Supabase
-    supabase_url: str = Field(..., description="Supabase project URL")
+    supabase_url: SupabaseUrl = Field(..., description="Supabase project URL")
     supabase_service_key: str = Field(..., description="Supabase service role key")
     
     # API Keys
-    openai_api_key: Optional[str] = Field(None, description="OpenAI API key")
-    anthropic_api_key: Optional[str] = Field(None, description="Anthropic API key")
-    kimi_api_key: Optional[str] = Field(None, description="Kimi (Moonshot AI) API key")
+    openai_api_key: Optional[OpenAIKey] = Field(None, description="OpenAI API key")
+    anthropic_api_key: Optional[AnthropicKey] = Field(None, description="Anthropic API key")
+    kimi_api_key: Optional[OpenAIKey] = Field(None, description="Kimi (Moonshot AI) API key")
     deepseek_api_key: Optional[str] = Field(None, description="DeepSeek API key")
     pubmed_api_key: Optional[str] = Field(None, description="PubMed API key")
     perplexity_api_key: Optional[str] = Field(None, description="Perplexity API key for Sonar search")
@@ -43,11 +66,11 @@ class Settings(BaseSettings):
     deepseek_model: str = Field("deepseek-chat", description="DeepSeek model to use")
     
     # Agent Intervals (seconds)
-    research_interval: int = Field(86400, description="Research agent interval (seconds)")
-    extraction_interval: int = Field(1800, description="Extraction agent interval (seconds)")
-    validation_interval: int = Field(900, description="Validation agent interval (seconds)")
-    kb_interval: int = Field(600, description="KB agent interval (seconds)")
-    conflict_interval: int = Field(3600, description="Conflict agent interval (seconds)")
+    research_interval: PositiveInt = Field(86400, description="Research agent interval (seconds)")
+    extraction_interval: PositiveInt = Field(1800, description="Extraction agent interval (seconds)")
+    validation_interval: PositiveInt = Field(900, description="Validation agent interval (seconds)")
+    kb_interval: PositiveInt = Field(600, description="KB agent interval (seconds)")
+    conflict_interval: PositiveInt = Field(3600, description="Conflict agent interval (seconds)")
     prompt_engineering_interval: int = Field(86400, description="Prompt engineering agent interval (seconds)")
     
     # Agent Batch Sizes
@@ -58,10 +81,16 @@ class Settings(BaseSettings):
     conflict_batch_size: int = Field(10, description="Conflict agent batch size")
     
     # Rate Limits (requests per second)
-    pubmed_rate_limit: float = Field(3.0, description="PubMed rate limit (req/s)")
-    crossref_rate_limit: float = Field(10.0, description="CrossRef rate limit (req/s)")
-    openai_rate_limit: float = Field(5.0, description="OpenAI rate limit (req/s)")
-    rss_rate_limit: float = Field(2.0, description="RSS rate limit (req/s)")
+    pubmed_rate_limit: PositiveFloat = Field(3.0, description="PubMed rate limit (req/s)")
+    crossref_rate_limit: PositiveFloat = Field(10.0, description="CrossRef rate limit (req/s)")
+    openai_rate_limit: PositiveFloat = Field(5.0, description="OpenAI rate limit (req/s)")
+    rss_rate_limit: PositiveFloat = Field(2.0, description="RSS rate limit (req/s)")
+    llm_max_concurrency: PositiveInt = Field(4, description="Maximum concurrent LLM requests across all agents")
+    run_once_timeout: PositiveFloat = Field(600.0, description="Per-agent timeout for a single run_once pass (seconds)")
+
+    # CrossRef Response Cache
+    crossref_cache_path: Optional[str] = Field(None, description="SQLite file for cached CrossRef responses (disabled if unset)")
+    crossref_cache_ttl: PositiveFloat = Field(86400.0, description="Seconds a cached CrossRef response is used before revalidation")
 
     # Web Scraper Settings
     scraper_enabled: bool = Field(False, description="Enable web scraping for fitness sites (disabled until whitelist configured)")
@@ -100,80 +129,19 @@ class Settings(BaseSettings):
     alert_error_rate_threshold: float = Field(0.5, description="Error rate threshold to trigger alert (50%)")
     
     # Logging
-    log_level: str = Field("INFO", description="Logging level")
+    log_level: LogLevel = Field(_LOG_INFO, description="Logging level")
     log_format: str = Field(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log format string"
     )
     
     model_config = {
-        "env_file": ".env",
+        "env_file": _ENV_FILE,
         "env_file_encoding": "utf-8",
         "case_sensitive": False,
         "extra": "ignore"
     }
     
-    @field_validator('supabase_url')
-    @classmethod
-    def validate_supabase_url(cls, v: str) -> str:
-        """Validate Supabase URL format."""
-        if not v.startswith(('http://', 'https://')):
-            raise ValueError('supabase_url must start with http:// or https://')
-        if '.supabase.co' not in v and 'localhost' not in v:
-            raise ValueError('supabase_url must contain .supabase.co or localhost')
-        return v
-
-    @field_validator('openai_api_key')
-    @classmethod
-    def validate_openai_key_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate OpenAI API key format if provided."""
-        if v and not v.startswith('sk-'):
-            raise ValueError('openai_api_key must start with "sk-"')
-        return v
-    
-    @field_validator('kimi_api_key')
-    @classmethod
-    def validate_kimi_key_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate Kimi API key format if provided."""
-        if v and not v.startswith('sk-'):
-            raise ValueError('kimi_api_key must start with "sk-"')
-        return v
-
-    @field_validator('anthropic_api_key')
-    @classmethod
-    def validate_anthropic_key_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate Anthropic API key format if provided."""
-        if v and not v.startswith('sk-ant-'):
-            raise ValueError('anthropic_api_key must start with "sk-ant-"')
-        return v
-
-    @field_validator('research_interval', 'extraction_interval', 'validation_interval',
-                     'kb_interval', 'conflict_interval')
-    @classmethod
-    def validate_intervals(cls, v: int) -> int:
-        """Validate that intervals are positive."""
-        if v <= 0:
-            raise ValueError('interval must be positive')
-        return v
-
-    @field_validator('pubmed_rate_limit', 'crossref_rate_limit', 'openai_rate_limit', 'rss_rate_limit')
-    @classmethod
-    def validate_rate_limits(cls, v: float) -> float:
-        """Validate that rate limits are positive."""
-        if v <= 0:
-            raise ValueError('rate limit must be positive')
-        return v
-
-    @field_validator('log_level')
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f'log_level must be one of {valid_levels}')
-        return v_upper
-    
     def validate_api_keys(self) -> bool:
         """
         Check that at least one LLM API key is configured.
@@ -191,25 +159,18 @@ class Settings(BaseSettings):
             )
         return True
     
-    def get_llm_config(self) -> dict:
-        """
-        Get LLM configuration dictionary.
-        
-        Returns:
-            Dictionary with LLM configuration
-        """
-        # Determine default provider based on available keys
-        # Priority: DeepSeek > Kimi > OpenAI > Anthropic
-        if self.deepseek_api_key:
-            default_provider = 'deepseek'
-        elif self.kimi_api_key:
-            default_provider = 'kimi'
-        elif self.openai_api_key:
-            default_provider = 'openai'
-        else:
-            default_provider = 'anthropic'
-            
-        return {
+    # Derived views below are computed once per instance; reload_settings()
+    # creates a new instance, which naturally resets them.
+
+    @cached_property
+    def _llm_config(self) -> Mapping[str, Optional[str]]:
+        # Default provider is the first one in priority order with a key
+        default_provider = next(
+            (p for p in LLM_PROVIDER_PRIORITY if getattr(self, f'{p}_api_key')),
+            'anthropic'
+        )
+
+        return MappingProxyType({
             'openai_api_key': self.openai_api_key,
             'anthropic_api_key': self.anthropic_api_key,
             'kimi_api_key': self.kimi_api_key,
@@ -219,51 +180,72 @@ class Settings(BaseSettings):
             'anthropic_model': self.anthropic_model,
             'kimi_model': self.kimi_model,
             'deepseek_model': self.deepseek_model,
-        }
+        })
+
+    @cached_property
+    def _agent_intervals(self) -> Mapping[str, int]:
+        return MappingProxyType({
+            'research': self.research_interval,
+            'extraction': self.extraction_interval,
+            'validation': self.validation_interval,
+            'kb': self.kb_interval,
+            'conflict': self.conflict_interval,
+        })
+
+    @cached_property
+    def _agent_batch_sizes(self) -> Mapping[str, int]:
+        return MappingProxyType({
+            'research': self.research_batch_size,
+            'extraction': self.extraction_batch_size,
+            'validation': self.validation_batch_size,
+            'kb': self.kb_batch_size,
+            'conflict': self.conflict_batch_size,
+        })
+
+    @cached_property
+    def _rate_limits(self) -> Mapping[str, float]:
+        return MappingProxyType({
+            'pubmed': self.pubmed_rate_limit,
+            'crossref': self.crossref_rate_limit,
+            'openai': self.openai_rate_limit,
+            'rss': self.rss_rate_limit,
+        })
+
+    def get_llm_config(self) -> Mapping[str, Optional[str]]:
+        """
+        Get LLM configuration dictionary.
+        
+        Returns:
+            Read-only mapping with LLM configuration
+        """
+        return self._llm_config
     
-    def get_agent_intervals(self) -> dict:
+    def get_agent_intervals(self) -> Mapping[str, int]:
         """
         Get agent intervals as a dictionary.
         
         Returns:
-            Dictionary mapping agent names to intervals
+            Read-only mapping of agent names to intervals
         """
-        return {
-            'research': self.research_interval,
-            'extraction': self.extraction_interval,
-            'validation': self.validation_interval,
-            'kb': self.kb_interval,
-            'conflict': self.conflict_interval,
-        }
+        return self._agent_intervals
     
-    def get_agent_batch_sizes(self) -> dict:
+    def get_agent_batch_sizes(self) -> Mapping[str, int]:
         """
         Get agent batch sizes as a dictionary.
         
         Returns:
-            Dictionary mapping agent names to batch sizes
+            Read-only mapping of agent names to batch sizes
         """
-        return {
-            'research': self.research_batch_size,
-            'extraction': self.extraction_batch_size,
-            'validation': self.validation_batch_size,
-            'kb': self.kb_batch_size,
-            'conflict': self.conflict_batch_size,
-        }
+        return self._agent_batch_sizes
     
-    def get_rate_limits(self) -> dict:
+    def get_rate_limits(self) -> Mapping[str, float]:
         """
         Get rate limits as a dictionary.
 
         Returns:
-            Dictionary mapping service names to rate limits
+            Read-only mapping of service names to rate limits
         """
-        return {
-            'pubmed': self.pubmed_rate_limit,
-            'crossref': self.crossref_rate_limit,
-            'openai': self.openai_rate_limit,
-            'rss': self.rss_rate_limit,
-        }
+        return self._rate_limits
 
     def get_scraper_config(self) -> dict:
         """
@@ -309,10 +291,18 @@ class Settings(BaseSettings):
         }
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
+@cache
+def get_environ() -> Mapping[str, str]:
+    """
+    Get a read-only snapshot of os.environ, taken once per process.
+    
+    Returns:
+        Environment mapping (cached, reset by reload_settings)
+    """
+    return MappingProxyType(dict(os.environ))
 
 
+@cache
 def get_settings() -> Settings:
     """
     Get or create global settings instance.
@@ -320,10 +310,7 @@ def get_settings() -> Settings:
     Returns:
         Settings instance (cached)
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
@@ -335,6 +322,6 @@ def reload_settings() -> Settings:
     Returns:
         New Settings instance
     """
-    global _settings
-    _settings = Settings()
-    return _settings
+    get_environ.cache_clear()
+    get_settings.cache_clear()
+    return get_settings()
@@ -17,12 +17,73 @@ import os
 import sys
 import argparse
 import asyncio
-from typing import List, Optional
+import base64
+import hashlib
+import sqlite3
+import time
+from array import array
+from collections import Counter
+from typing import AsyncIterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 import httpx
-from openai import AsyncOpenAI
+import orjson
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    InternalServerError,
+    RateLimitError
+)
+
+
+def format_vector(embedding: List[float]) -> str:
+    """
+    Format an embedding as a pgvector literal.
+    
+    Six significant digits is well beyond the model's effective precision
+    and roughly halves the payload compared to full-precision JSON floats.
+    """
+    return '[' + ','.join([f'{v:.6g}' for v in embedding]) + ']'
+
+
+def decode_embedding(encoded: str) -> List[float]:
+    """Decode a base64 embedding (little-endian float32) from the OpenAI API."""
+    values = array('f', base64.b64decode(encoded))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+class TokenBucket:
+    """
+    Async token bucket limiting the request rate.
+    
+    Kept local (rather than utils.rate_limiter) so this script runs
+    standalone without importing the utils package.
+    """
+    
+    def __init__(self, requests_per_second: float, burst_size: int):
+        self.rate = requests_per_second
+        self.burst_size = burst_size
+        self.tokens = float(burst_size)
+        self.last_update = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst_size,
+                    self.tokens + (now - self.last_update) * self.rate
+                )
+                self.last_update = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
 
 @dataclass
@@ -47,91 +108,235 @@ class SupabaseClient:
             'Content-Type': 'application/json',
             'Prefer': 'return=minimal'
         }
+        # One pooled client for the whole run so requests reuse
+        # keep-alive connections instead of reconnecting each time;
+        # HTTP/2 multiplexes the concurrent updates over one connection
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+            http2=True
+        )
+        # Claim ids are UUIDs, so the filter is spliced into the URL
+        # directly instead of building query params for every update
+        self._update_path = "/rest/v1/scientific_knowledge?id=eq."
     
-    async def get_claims_without_embeddings(self, limit: int = 100) -> List[KnowledgeClaim]:
-        """Fetch claims that need embeddings generated."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={
-                    'select': 'id,claim,category,evidence_level,embedding',
-                    'embedding': 'is.null',
-                    'status': 'eq.active',
-                    'limit': limit
-                }
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+    
+    async def get_claims_without_embeddings(
+        self,
+        limit: int = 100,
+        after_id: Optional[str] = None
+    ) -> List[KnowledgeClaim]:
+        """
+        Fetch claims that need embeddings generated, ordered by id.
+        
+        Args:
+            limit: Maximum number of claims to return
+            after_id: Only return claims with an id greater than this (keyset page)
+        """
+        params = {
+            'select': 'id,claim,category,evidence_level',
+            'embedding': 'is.null',
+            'status': 'eq.active',
+            'order': 'id.asc',
+            'limit': limit
+        }
+        if after_id is not None:
+            params['id'] = f'gt.{after_id}'
+        
+        response = await self._client.get("/rest/v1/scientific_knowledge", params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        return [
+            KnowledgeClaim(
+                id=item['id'],
+                claim=item['claim'],
+                category=item['category'],
+                evidence_level=item['evidence_level'],
+                has_embedding=False
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            return [
-                KnowledgeClaim(
-                    id=item['id'],
-                    claim=item['claim'],
-                    category=item['category'],
-                    evidence_level=item['evidence_level'],
-                    has_embedding=item.get('embedding') is not None
+            for item in data
+        ]
+    
+    async def iter_claims_without_embeddings(
+        self,
+        page_size: int = 100
+    ) -> AsyncIterator[List[KnowledgeClaim]]:
+        """
+        Yield pages of claims that need embeddings.
+        
+        Pages are keyed on the last seen id rather than an offset, so rows
+        that get their embedding while iterating don't shift later pages.
+        The next page is fetched while the caller works on the current one.
+        """
+        next_page = asyncio.ensure_future(self.get_claims_without_embeddings(page_size))
+        try:
+            while True:
+                page = await next_page
+                if len(page) < page_size:
+                    if page:
+                        yield page
+                    return
+                next_page = asyncio.ensure_future(
+                    self.get_claims_without_embeddings(page_size, after_id=page[-1].id)
                 )
-                for item in data
-            ]
+                yield page
+        finally:
+            next_page.cancel()
     
     async def get_all_claims(self, limit: int = 1000) -> List[KnowledgeClaim]:
         """Fetch all claims."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={
-                    'select': 'id,claim,category,evidence_level,embedding',
-                    'limit': limit
-                }
+        response = await self._client.get(
+            "/rest/v1/scientific_knowledge",
+            params={
+                'select': 'id,claim,category,evidence_level,embedding',
+                'limit': limit
+            }
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        return [
+            KnowledgeClaim(
+                id=item['id'],
+                claim=item['claim'],
+                category=item['category'],
+                evidence_level=item['evidence_level'],
+                has_embedding=item.get('embedding') is not None
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            return [
-                KnowledgeClaim(
-                    id=item['id'],
-                    claim=item['claim'],
-                    category=item['category'],
-                    evidence_level=item['evidence_level'],
-                    has_embedding=item.get('embedding') is not None
-                )
-                for item in data
-            ]
+            for item in data
+        ]
     
     async def update_embedding(self, claim_id: str, embedding: List[float]) -> bool:
         """Update the embedding for a specific claim."""
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={'id': f'eq.{claim_id}'},
-                json={'embedding': embedding}
+        response = await self._client.patch(
+            self._update_path + claim_id,
+            content=orjson.dumps({'embedding': format_vector(embedding)})
+        )
+        
+        if response.status_code == 204:
+            return True
+        else:
+            print(f"Error updating claim {claim_id}: {response.status_code} - {response.text}")
+            return False
+    
+    async def bulk_update_embeddings(
+        self,
+        items: List[Tuple[str, List[float]]],
+        max_rows_per_request: int = 50
+    ) -> int:
+        """
+        Update embeddings for many claims via the bulk_update_embeddings RPC.
+        
+        Rows are sent in chunks so each request body stays well below
+        PostgREST's request size limit (~16KB per formatted embedding).
+        
+        Returns:
+            Number of rows updated
+        
+        Raises:
+            httpx.HTTPStatusError: If a request fails
+        """
+        updated = 0
+        for i in range(0, len(items), max_rows_per_request):
+            chunk = items[i:i + max_rows_per_request]
+            response = await self._client.post(
+                "/rest/v1/rpc/bulk_update_embeddings",
+                content=orjson.dumps({'p_updates': [
+                    {'id': claim_id, 'embedding': format_vector(embedding)}
+                    for claim_id, embedding in chunk
+                ]})
             )
-            
-            if response.status_code == 204:
-                return True
-            else:
-                print(f"Error updating claim {claim_id}: {response.status_code} - {response.text}")
-                return False
+            response.raise_for_status()
+            updated += orjson.loads(response.content) if response.content else len(chunk)
+        return updated
+    
+    async def search_knowledge(
+        self,
+        query_embedding: List[float],
+        match_threshold: float = 0.7,
+        match_count: int = 5
+    ) -> httpx.Response:
+        """Call the search_knowledge RPC."""
+        return await self._client.post(
+            "/rest/v1/rpc/search_knowledge",
+            content=orjson.dumps({
+                'query_embedding': format_vector(query_embedding),
+                'match_threshold': match_threshold,
+                'match_count': match_count,
+                'filter_category': None,
+                'min_evidence_level': 1
+            })
+        )
 
 
 class EmbeddingGenerator:
     """Generates embeddings using OpenAI API."""
     
-    def __init__(self, api_key: str, model: str = "text-embedding-3-small"):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        max_concurrent_batches: int = 5,
+        requests_per_minute: float = 3000,
+        max_retries: int = 5
+    ):
+        # Retries are handled in _create_embeddings so they share the
+        # rate limiter instead of stacking on top of the SDK's own
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0)
         self.model = model
+        self.max_concurrent_batches = max_concurrent_batches
+        self.max_retries = max_retries
+        self.rate_limiter = TokenBucket(
+            requests_per_second=requests_per_minute / 60,
+            burst_size=max_concurrent_batches
+        )
+    
+    async def _create_embeddings(self, input):
+        """
+        Call the embeddings endpoint under the rate limiter.
+        
+        On 429 responses, waits for the server's Retry-After (or an
+        exponential backoff when absent); connection errors, timeouts and
+        5xx responses back off exponentially. Either way it retries up to
+        max_retries times.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+            try:
+                # base64 float32 is much cheaper to decode than a JSON
+                # array of floats
+                return await self.client.embeddings.create(
+                    model=self.model,
+                    input=input,
+                    encoding_format="base64"
+                )
+            except RateLimitError as e:
+                if attempt == self.max_retries:
+                    raise
+                try:
+                    delay = float(e.response.headers.get('retry-after', 2 ** attempt))
+                except ValueError:
+                    delay = 2 ** attempt
+                print(f"Rate limited, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            except (APIConnectionError, InternalServerError) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = 2 ** attempt
+                print(f"Transient error ({e}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
     
     async def generate_embedding(self, text: str) -> Optional[List[float]]:
         """Generate embedding for a single text."""
         try:
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=text
-            )
-            return response.data[0].embedding
+            response = await self._create_embeddings(text)
+            return decode_embedding(response.data[0].embedding)
         except Exception as e:
             print(f"Error generating embedding: {e}")
             return None
@@ -141,45 +346,180 @@ class EmbeddingGenerator:
         texts: List[str], 
         batch_size: int = 100
     ) -> List[Optional[List[float]]]:
-        """Generate embeddings for multiple texts in batches."""
-        results = []
+        """
+        Generate embeddings for multiple texts in batches.
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            print(f"Processing batch {i//batch_size + 1}/{(len(texts) + batch_size - 1)//batch_size} ({len(batch)} items)")
+        Batches are sent concurrently (up to max_concurrent_batches at a
+        time); results are returned in input order.
+        """
+        chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        
+        async def embed_chunk(index: int, batch: List[str]) -> List[Optional[List[float]]]:
+            async with semaphore:
+                print(f"Processing batch {index + 1}/{len(chunks)} ({len(batch)} items)")
+                try:
+                    response = await self._create_embeddings(batch)
+                    return [decode_embedding(item.embedding) for item in response.data]
+                except Exception as e:
+                    print(f"Error processing batch: {e}")
+                    # Add None for each failed item in batch
+                    return [None] * len(batch)
+        
+        chunk_results = await asyncio.gather(
+            *(embed_chunk(i, batch) for i, batch in enumerate(chunks))
+        )
+        return [embedding for chunk in chunk_results for embedding in chunk]
+
+
+class CachedEmbeddingGenerator:
+    """
+    EmbeddingGenerator wrapper with a persistent on-disk cache.
+    
+    Vectors are stored in SQLite as float32 blobs keyed by
+    sha256(model + text), so re-runs skip texts embedded before. The least
+    recently used entries are evicted once max_entries is exceeded.
+    
+    Among cache misses, texts that are identical up to case and whitespace
+    share one OpenAI call. Near-duplicates are not merged: claims that
+    differ by a single word ("increases" / "does not increase") must keep
+    their own vectors.
+    """
+    
+    def __init__(
+        self,
+        generator: EmbeddingGenerator,
+        path: str,
+        max_entries: int = 100_000
+    ):
+        self.generator = generator
+        self.model = generator.model
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS emb ("
+            "key TEXT PRIMARY KEY, vec BLOB NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS emb_accessed_at ON emb(accessed_at)")
+        self._db.commit()
+    
+    def _key(self, text: str) -> str:
+        return hashlib.sha256((self.model + text).encode('utf-8')).hexdigest()
+    
+    def _lookup(self, keys: List[str]) -> dict:
+        """Fetch cached vectors for keys, refreshing their access time."""
+        found = {}
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._db.execute(
+                f"SELECT key, vec FROM emb WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = array('f', blob).tolist()
+        if found:
+            now = time.time()
+            self._db.executemany(
+                "UPDATE emb SET accessed_at = ? WHERE key = ?",
+                [(now, key) for key in found]
+            )
+            self._db.commit()
+        return found
+    
+    def _store(self, items: List[Tuple[str, List[float]]]) -> None:
+        """Store new vectors and evict least recently used entries."""
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO emb (key, vec, accessed_at) VALUES (?, ?, ?)",
+            [(key, array('f', vec).tobytes(), now) for key, vec in items]
+        )
+        self._db.execute(
+            "DELETE FROM emb WHERE key IN ("
+            "SELECT key FROM emb ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._db.commit()
+    
+    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+        """Generate embedding for a single text, using the cache."""
+        return (await self.generate_embeddings_batch([text]))[0]
+    
+    async def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 100
+    ) -> List[Optional[List[float]]]:
+        """Generate embeddings, calling OpenAI only for uncached texts."""
+        keys = [self._key(text) for text in texts]
+        cached = self._lookup(keys)
+        
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        if cached:
+            print(f"Embedding cache: {len(texts) - len(missing)}/{len(texts)} hits")
+        
+        results: List[Optional[List[float]]] = [cached.get(key) for key in keys]
+        if missing:
+            # Second tier: embed only one text per normalized duplicate group
+            first_seen = {}
+            clusters = [
+                first_seen.setdefault(' '.join(texts[i].lower().split()), position)
+                for position, i in enumerate(missing)
+            ]
+            representatives = sorted(set(clusters))
+            if len(representatives) < len(missing):
+                print(f"Duplicate reuse: {len(missing) - len(representatives)} texts")
             
-            try:
-                response = await self.client.embeddings.create(
-                    model=self.model,
-                    input=batch
-                )
-                batch_embeddings = [item.embedding for item in response.data]
-                results.extend(batch_embeddings)
-            except Exception as e:
-                print(f"Error processing batch: {e}")
-                # Add None for each failed item in batch
-                results.extend([None] * len(batch))
+            generated = await self.generator.generate_embeddings_batch(
+                [texts[missing[r]] for r in representatives], batch_size=batch_size
+            )
+            by_representative = dict(zip(representatives, generated))
+            
+            new_items = []
+            for position, i in enumerate(missing):
+                embedding = by_representative[clusters[position]]
+                results[i] = embedding
+                if embedding:
+                    new_items.append((keys[i], embedding))
+            if new_items:
+                self._store(new_items)
         
         return results
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        self._db.close()
 
 
 async def generate_embeddings_for_all(
     supabase: SupabaseClient,
     openai: EmbeddingGenerator,
     batch_size: int = 50,
-    dry_run: bool = False
+    dry_run: bool = False,
+    max_concurrent_updates: int = 20,
+    num_writers: int = 4,
+    max_pending_batches: int = 4,
+    embed_chunk_size: int = 10
 ):
-    """Generate embeddings for all claims without embeddings."""
-    print("Fetching claims without embeddings...")
-    claims = await supabase.get_claims_without_embeddings(limit=1000)
+    """
+    Generate embeddings for all claims without embeddings.
     
-    if not claims:
-        print("No claims found that need embeddings.")
-        return
+    Each page is split into chunks of embed_chunk_size texts, which the
+    generator sends to OpenAI concurrently.
     
-    print(f"Found {len(claims)} claims without embeddings")
+    Embedded batches are handed to a fixed pool of writer tasks through a
+    bounded queue, so database writes overlap with embedding generation
+    and a slow database throttles the embedder instead of piling up work.
+    """
+    print("Fetching claims without embeddings...")
+    pages = supabase.iter_claims_without_embeddings(page_size=batch_size)
     
     if dry_run:
+        claims = [claim async for page in pages for claim in page]
+        if not claims:
+            print("No claims found that need embeddings.")
+            return
+        print(f"Found {len(claims)} claims without embeddings")
         print("DRY RUN: Would process the following claims:")
         for claim in claims[:5]:
             print(f"  - {claim.claim[:80]}...")
@@ -187,36 +527,87 @@ async def generate_embeddings_for_all(
             print(f"  ... and {len(claims) - 5} more")
         return
     
-    # Process in batches
-    total_processed = 0
-    total_failed = 0
+    totals = {'processed': 0, 'failed': 0}
+    update_semaphore = asyncio.Semaphore(max_concurrent_updates)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending_batches)
     
-    for i in range(0, len(claims), batch_size):
-        batch = claims[i:i + batch_size]
-        print(f"\nProcessing batch {i//batch_size + 1}/{(len(claims) + batch_size - 1)//batch_size}")
+    async def update(claim: KnowledgeClaim, embedding: List[float]) -> bool:
+        async with update_semaphore:
+            return await supabase.update_embedding(claim.id, embedding)
+    
+    async def write_batch(to_update: List[Tuple[KnowledgeClaim, List[float]]]) -> None:
+        # Update database in one bulk request
+        try:
+            updated = await supabase.bulk_update_embeddings(
+                [(claim.id, embedding) for claim, embedding in to_update]
+            )
+        except httpx.HTTPError as e:
+            print(f"  ! Bulk update failed ({e}), falling back to per-claim updates")
+        else:
+            totals['processed'] += updated
+            totals['failed'] += len(to_update) - updated
+            print(f"  ✓ Updated {updated}/{len(to_update)} claims")
+            return
         
-        # Generate embeddings for batch
-        texts = [claim.claim for claim in batch]
-        embeddings = await openai.generate_embeddings_batch(texts, batch_size=len(batch))
+        # Fallback: update claims individually, concurrently
+        results = await asyncio.gather(
+            *(update(claim, embedding) for claim, embedding in to_update),
+            return_exceptions=True
+        )
         
-        # Update database
-        for claim, embedding in zip(batch, embeddings):
-            if embedding:
-                success = await supabase.update_embedding(claim.id, embedding)
-                if success:
-                    total_processed += 1
-                    print(f"  ✓ Updated: {claim.claim[:60]}...")
-                else:
-                    total_failed += 1
+        for (claim, _), result in zip(to_update, results):
+            if result is True:
+                totals['processed'] += 1
+                print(f"  ✓ Updated: {claim.claim[:60]}...")
             else:
-                total_failed += 1
-                print(f"  ✗ Failed: {claim.claim[:60]}...")
+                totals['failed'] += 1
+                if isinstance(result, Exception):
+                    print(f"  ✗ Error updating {claim.id}: {result}")
+    
+    async def writer() -> None:
+        while True:
+            to_update = await write_queue.get()
+            try:
+                await write_batch(to_update)
+            except Exception as e:
+                totals['failed'] += len(to_update)
+                print(f"  ✗ Error writing batch: {e}")
+            finally:
+                write_queue.task_done()
+    
+    writers = [asyncio.create_task(writer()) for _ in range(num_writers)]
+    try:
+        batch_number = 0
+        async for batch in pages:
+            batch_number += 1
+            print(f"\nProcessing batch {batch_number} ({len(batch)} claims)")
+            
+            # Generate embeddings for batch
+            texts = [claim.claim for claim in batch]
+            embeddings = await openai.generate_embeddings_batch(texts, batch_size=embed_chunk_size)
+            
+            to_update = [(claim, embedding) for claim, embedding in zip(batch, embeddings) if embedding]
+            for claim, embedding in zip(batch, embeddings):
+                if not embedding:
+                    totals['failed'] += 1
+                    print(f"  ✗ Failed: {claim.claim[:60]}...")
+            
+            # Blocks while max_pending_batches are waiting to be written
+            if to_update:
+                await write_queue.put(to_update)
         
-        # Small delay to avoid rate limits
-        await asyncio.sleep(0.5)
+        await write_queue.join()
+    finally:
+        for task in writers:
+            task.cancel()
+        await asyncio.gather(*writers, return_exceptions=True)
+    
+    if not batch_number:
+        print("No claims found that need embeddings.")
+        return
     
     print(f"\n{'='*50}")
-    print(f"Completed: {total_processed} processed, {total_failed} failed")
+    print(f"Completed: {totals['processed']} processed, {totals['failed']} failed")
 
 
 async def verify_embeddings(supabase: SupabaseClient):
@@ -234,19 +625,13 @@ async def verify_embeddings(supabase: SupabaseClient):
     print(f"Coverage: {with_embedding/len(claims)*100:.1f}%" if claims else "N/A")
     
     # Show category breakdown
-    categories = {}
-    for claim in claims:
-        cat = claim.category
-        if cat not in categories:
-            categories[cat] = {'total': 0, 'with_emb': 0}
-        categories[cat]['total'] += 1
-        if claim.has_embedding:
-            categories[cat]['with_emb'] += 1
+    totals = Counter(claim.category for claim in claims)
+    with_emb = Counter(claim.category for claim in claims if claim.has_embedding)
     
     print(f"\nBreakdown by category:")
-    for cat, stats in sorted(categories.items()):
-        pct = stats['with_emb']/stats['total']*100 if stats['total'] > 0 else 0
-        print(f"  {cat}: {stats['with_emb']}/{stats['total']} ({pct:.0f}%)")
+    for cat, total in sorted(totals.items()):
+        pct = with_emb[cat]/total*100
+        print(f"  {cat}: {with_emb[cat]}/{total} ({pct:.0f}%)")
 
 
 async def test_semantic_search(supabase: SupabaseClient, openai: EmbeddingGenerator, query: str):
@@ -260,31 +645,52 @@ async def test_semantic_search(supabase: SupabaseClient, openai: EmbeddingGenera
         return
     
     # Call search function via RPC
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{supabase.url}/rest/v1/rpc/search_knowledge",
-            headers=supabase.headers,
-            json={
-                'query_embedding': query_embedding,
-                'match_threshold': 0.7,
-                'match_count': 5,
-                'filter_category': None,
-                'min_evidence_level': 1
-            }
-        )
-        
-        if response.status_code == 200:
-            results = response.json()
-            print(f"\nFound {len(results)} results:")
-            for i, result in enumerate(results, 1):
-                similarity = result.get('similarity', 0)
-                claim = result.get('claim', '')
-                category = result.get('category', '')
-                evidence = result.get('evidence_level', 0)
-                print(f"\n{i}. [{category}] (similarity: {similarity:.3f}, evidence: {evidence}/5)")
-                print(f"   {claim[:100]}...")
+    response = await supabase.search_knowledge(query_embedding)
+    
+    if response.status_code == 200:
+        results = orjson.loads(response.content)
+        print(f"\nFound {len(results)} results:")
+        for i, result in enumerate(results, 1):
+            similarity = result.get('similarity', 0)
+            claim = result.get('claim', '')
+            category = result.get('category', '')
+            evidence = result.get('evidence_level', 0)
+            print(f"\n{i}. [{category}] (similarity: {similarity:.3f}, evidence: {evidence}/5)")
+            print(f"   {claim[:100]}...")
+    else:
+        print(f"Error: {response.status_code} - {response.text}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the selected command, sharing one HTTP client across it."""
+    supabase = SupabaseClient(args.supabase_url, args.supabase_key)
+    openai = EmbeddingGenerator(
+        args.openai_key,
+        requests_per_minute=args.requests_per_minute
+    )
+    if args.cache_path:
+        openai = CachedEmbeddingGenerator(openai, args.cache_path)
+    
+    try:
+        if args.verify:
+            await verify_embeddings(supabase)
+        elif args.test_search:
+            await test_semantic_search(supabase, openai, args.test_search)
         else:
-            print(f"Error: {response.status_code} - {response.text}")
+            await generate_embeddings_for_all(
+                supabase, 
+                openai, 
+                batch_size=args.batch_size,
+                dry_run=args.dry_run
+            )
+            
+            # Show verification after generation
+            if not args.dry_run:
+                await verify_embeddings(supabase)
+    finally:
+        await supabase.aclose()
+        if isinstance(openai, CachedEmbeddingGenerator):
+            openai.close()
 
 
 def main():
@@ -321,12 +727,23 @@ def main():
         metavar='QUERY',
         help='Test semantic search with a query'
     )
+    parser.add_argument(
+        '--cache-path',
+        default='.embedding_cache.sqlite3',
+        help='On-disk embedding cache file (default: .embedding_cache.sqlite3, empty to disable)'
+    )
     parser.add_argument(
         '--batch-size',
         type=int,
         default=50,
         help='Batch size for embedding generation (default: 50)'
     )
+    parser.add_argument(
+        '--requests-per-minute',
+        type=float,
+        default=3000,
+        help='OpenAI embedding requests per minute for your account tier (default: 3000)'
+    )
     
     args = parser.parse_args()
     
@@ -345,26 +762,8 @@ def main():
             print(f"  - {m}")
         sys.exit(1)
     
-    # Initialize clients
-    supabase = SupabaseClient(args.supabase_url, args.supabase_key)
-    openai = EmbeddingGenerator(args.openai_key)
-    
     # Run appropriate command
-    if args.verify:
-        asyncio.run(verify_embeddings(supabase))
-    elif args.test_search:
-        asyncio.run(test_semantic_search(supabase, openai, args.test_search))
-    else:
-        asyncio.run(generate_embeddings_for_all(
-            supabase, 
-            openai, 
-            batch_size=args.batch_size,
-            dry_run=args.dry_run
-        ))
-        
-        # Show verification after generation
-        if not args.dry_run:
-            asyncio.run(verify_embeddings(supabase))
+    asyncio.run(run(args))
 
 
 if __name__ == '__main__':
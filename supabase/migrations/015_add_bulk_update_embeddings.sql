@@ -0,0 +1,49 @@
+-- ============================================
+-- Migration: Add Bulk Embedding Update Function
+-- Date: 2026-10-15
+-- Description: Update embeddings for many claims in one RPC call
+--              instead of one PATCH request per claim
+-- ============================================
+
+-- ============================================
+-- 1. CREATE FUNCTION: bulk_update_embeddings
+-- ============================================
+
+-- Expects a JSON array of {"id": "<uuid>", "embedding": "[...]"} objects;
+-- the embedding may be a pgvector literal string or a JSON array.
+-- A plain upsert via PostgREST can't be used here: the proposed insert
+-- rows would violate NOT NULL constraints on claim/category.
+
+CREATE OR REPLACE FUNCTION bulk_update_embeddings(p_updates JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  updated_count INTEGER;
+BEGIN
+  UPDATE public.scientific_knowledge AS sk
+  SET embedding = u.embedding::VECTOR(1536)
+  FROM jsonb_to_recordset(p_updates) AS u(id UUID, embedding TEXT)
+  WHERE sk.id = u.id;
+  
+  GET DIAGNOSTICS updated_count = ROW_COUNT;
+  RETURN updated_count;
+END;
+$$;
+
+COMMENT ON FUNCTION bulk_update_embeddings(JSONB) IS 
+'Sets embeddings for a batch of claims. Used by generate_embeddings.py.';
+
+-- ============================================
+-- 2. PERMISSIONS
+-- ============================================
+
+-- SECURITY DEFINER bypasses RLS, so only the service role may call it
+REVOKE EXECUTE ON FUNCTION bulk_update_embeddings(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION bulk_update_embeddings(JSONB) TO service_role;
+
+-- ============================================
+-- Migration Complete
+-- ============================================
@@ -4,13 +4,15 @@ Agent Metrics Collection for Agent Swarm Knowledge System.
 Provides detailed metrics collection and reporting for all agents.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import deque
+from array import array
 import asyncio
 import logging
-import statistics
+import math
+import time
 
 
 @dataclass
@@ -35,6 +37,124 @@ class AgentMetricsSnapshot:
     recent_errors: List[str] = field(default_factory=list)
 
 
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert time.time_ns() to a naive UTC datetime."""
+    return datetime.utcfromtimestamp(timestamp_ns / 1e9)
+
+
+class _RingBuffer:
+    """
+    Fixed-capacity ring buffer of float values with running statistics.
+    
+    Values and their timestamps live in preallocated contiguous arrays
+    (struct-of-arrays), so recording a point allocates no objects; metadata
+    is kept in a sparse dict keyed by slot only when supplied. Mean and
+    variance are maintained with Welford's online algorithm (reversed for
+    the value that falls out of the window) and min/max with monotonic
+    deques, so summaries are O(1) regardless of history size.
+    """
+    
+    __slots__ = (
+        '_values', '_timestamps', '_metadata', '_capacity', '_head', '_len',
+        '_seq', '_mean', '_m2', '_min_q', '_max_q',
+    )
+    
+    def __init__(self, capacity: int):
+        self._values = array('d', bytes(8 * capacity))
+        # Nanoseconds since the epoch (time.time_ns)
+        self._timestamps = array('q', bytes(8 * capacity))
+        self._metadata: Dict[int, Dict[str, Any]] = {}
+        self._capacity = capacity
+        self._head = 0
+        self._len = 0
+        self._seq = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        # (sequence number, value) candidates for the window min/max
+        self._min_q: deque = deque()
+        self._max_q: deque = deque()
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def append(
+        self,
+        value: float,
+        timestamp_ns: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Write a value, overwriting the oldest one when full."""
+        value = float(value)
+        head = self._head
+        if self._len == self._capacity:
+            self._discard(self._values[head])
+            if self._metadata:
+                self._metadata.pop(head, None)
+        self._values[head] = value
+        self._timestamps[head] = timestamp_ns
+        if metadata:
+            self._metadata[head] = metadata
+        self._head = (head + 1) % self._capacity
+        self._len += 1
+        
+        delta = value - self._mean
+        self._mean += delta / self._len
+        self._m2 += delta * (value - self._mean)
+        
+        seq = self._seq
+        self._seq += 1
+        oldest = seq - self._capacity
+        for queue, worse in ((self._min_q, value.__le__), (self._max_q, value.__ge__)):
+            while queue and worse(queue[-1][1]):
+                queue.pop()
+            queue.append((seq, value))
+            if queue[0][0] <= oldest:
+                queue.popleft()
+    
+    def _discard(self, value: float) -> None:
+        """Remove an evicted value from the running mean/variance."""
+        self._len -= 1
+        if not self._len:
+            self._mean = self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._len
+        self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+    
+    def entries(self) -> List[AgentMetric]:
+        """Materialize the window as AgentMetric points, oldest first."""
+        start = (self._head - self._len) % self._capacity
+        points = []
+        for offset in range(self._len):
+            i = (start + offset) % self._capacity
+            points.append(AgentMetric(
+                timestamp=_ns_to_datetime(self._timestamps[i]),
+                value=self._values[i],
+                metadata=self._metadata.get(i, {})
+            ))
+        return points
+    
+    def last(self) -> float:
+        """Most recently written value."""
+        return self._values[self._head - 1]
+    
+    @property
+    def mean(self) -> float:
+        return self._mean
+    
+    @property
+    def min(self) -> float:
+        return self._min_q[0][1]
+    
+    @property
+    def max(self) -> float:
+        return self._max_q[0][1]
+    
+    def stdev(self) -> float:
+        """Sample standard deviation (requires at least two values)."""
+        return math.sqrt(self._m2 / (self._len - 1))
+
+
 class AgentMetricsCollector:
     """
     Collects and aggregates metrics for agents.
@@ -47,20 +167,31 @@ class AgentMetricsCollector:
     - error_rate: Percentage of errors
     """
     
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, metrics_cache_ttl: float = 0.5):
         """
         Initialize metrics collector.
         
         Args:
             max_history: Maximum number of historical data points to keep
+            metrics_cache_ttl: Seconds a get_metrics result is reused while
+                the agent records nothing new
         """
         self.max_history = max_history
+        self.metrics_cache_ttl = metrics_cache_ttl
         self.logger = logging.getLogger(__name__)
         
-        # Metrics storage per agent
-        self._metrics: Dict[str, Dict[str, deque]] = {}
+        # Metrics storage per agent: ring buffers of values for
+        # processing_time/queue_size, a deque of AgentMetric for errors
+        # (which carry metadata)
+        self._metrics: Dict[str, Dict[str, Any]] = {}
         self._counters: Dict[str, Dict[str, int]] = {}
-        self._last_updated: Dict[str, datetime] = {}
+        # Last 10 error messages per agent, for snapshots
+        self._recent_errors: Dict[str, deque] = {}
+        # Nanoseconds since the epoch (time.time_ns); converted to
+        # datetimes only when reported
+        self._last_updated: Dict[str, int] = {}
+        # agent -> (monotonic time computed, get_metrics result)
+        self._metrics_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     def register_agent(self, agent_name: str) -> None:
         """
@@ -71,15 +202,16 @@ class AgentMetricsCollector:
         """
         if agent_name not in self._metrics:
             self._metrics[agent_name] = {
-                'processing_time': deque(maxlen=self.max_history),
-                'queue_size': deque(maxlen=self.max_history),
+                'processing_time': _RingBuffer(self.max_history),
+                'queue_size': _RingBuffer(self.max_history),
                 'errors': deque(maxlen=self.max_history),
             }
             self._counters[agent_name] = {
                 'processed': 0,
                 'errors': 0,
             }
-            self._last_updated[agent_name] = datetime.utcnow()
+            self._recent_errors[agent_name] = deque(maxlen=10)
+            self._last_updated[agent_name] = time.time_ns()
             self.logger.info(f"Registered agent for metrics: {agent_name}")
     
     def record_processing(
@@ -98,25 +230,31 @@ class AgentMetricsCollector:
             success: Whether processing was successful
             metadata: Optional additional metadata
         """
-        self.register_agent(agent_name)
+        metrics = self._metrics.get(agent_name)
+        if metrics is None:
+            self.register_agent(agent_name)
+            metrics = self._metrics[agent_name]
         
-        timestamp = datetime.utcnow()
+        counters = self._counters[agent_name]
+        now = time.time_ns()
         duration_ms = duration_seconds * 1000
         
         # Record processing time
-        self._metrics[agent_name]['processing_time'].append(
-            AgentMetric(timestamp=timestamp, value=duration_ms, metadata=metadata or {})
-        )
+        metrics['processing_time'].append(duration_ms, now, metadata)
         
         # Update counters
-        self._counters[agent_name]['processed'] += 1
+        counters['processed'] += 1
         if not success:
-            self._counters[agent_name]['errors'] += 1
-            self._metrics[agent_name]['errors'].append(
-                AgentMetric(timestamp=timestamp, value=1.0, metadata=metadata or {})
+            counters['errors'] += 1
+            metrics['errors'].append(
+                AgentMetric(timestamp=_ns_to_datetime(now), value=1.0, metadata=metadata or {})
+            )
+            self._recent_errors[agent_name].append(
+                (metadata or {}).get('error', 'Unknown error')
             )
         
-        self._last_updated[agent_name] = timestamp
+        self._last_updated[agent_name] = now
+        self._metrics_cache.pop(agent_name, None)
     
     def record_error(
         self,
@@ -132,20 +270,25 @@ class AgentMetricsCollector:
             error_message: Error message or type
             metadata: Optional additional metadata
         """
-        self.register_agent(agent_name)
+        metrics = self._metrics.get(agent_name)
+        if metrics is None:
+            self.register_agent(agent_name)
+            metrics = self._metrics[agent_name]
         
-        timestamp = datetime.utcnow()
+        now = time.time_ns()
         
         self._counters[agent_name]['errors'] += 1
-        self._metrics[agent_name]['errors'].append(
+        metrics['errors'].append(
             AgentMetric(
-                timestamp=timestamp,
+                timestamp=_ns_to_datetime(now),
                 value=1.0,
                 metadata={'error': error_message, **(metadata or {})}
             )
         )
+        self._recent_errors[agent_name].append(error_message)
         
-        self._last_updated[agent_name] = timestamp
+        self._last_updated[agent_name] = now
+        self._metrics_cache.pop(agent_name, None)
     
     def record_queue_size(self, agent_name: str, queue_size: int) -> None:
         """
@@ -155,11 +298,13 @@ class AgentMetricsCollector:
             agent_name: Name of the agent
             queue_size: Current size of the queue
         """
-        self.register_agent(agent_name)
+        metrics = self._metrics.get(agent_name)
+        if metrics is None:
+            self.register_agent(agent_name)
+            metrics = self._metrics[agent_name]
         
-        self._metrics[agent_name]['queue_size'].append(
-            AgentMetric(timestamp=datetime.utcnow(), value=float(queue_size))
-        )
+        metrics['queue_size'].append(queue_size, time.time_ns())
+        self._metrics_cache.pop(agent_name, None)
     
     def get_metrics(self, agent_name: str) -> Dict[str, Any]:
         """
@@ -174,12 +319,16 @@ class AgentMetricsCollector:
         if agent_name not in self._metrics:
             return {}
         
+        now = time.monotonic()
+        cached = self._metrics_cache.get(agent_name)
+        if cached is not None and now - cached[0] < self.metrics_cache_ttl:
+            return cached[1]
+        
         counters = self._counters[agent_name]
         metrics = self._metrics[agent_name]
         
-        # Calculate statistics
-        processing_times = [m.value for m in metrics['processing_time']]
-        queue_sizes = [m.value for m in metrics['queue_size']]
+        processing_times = metrics['processing_time']
+        queue_sizes = metrics['queue_size']
         
         total_processed = counters['processed']
         total_errors = counters['errors']
@@ -187,36 +336,55 @@ class AgentMetricsCollector:
         
         result = {
             'agent_name': agent_name,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _ns_to_datetime(time.time_ns()).isoformat(),
             'counters': {
                 'processed_count': total_processed,
                 'error_count': total_errors,
             },
             'error_rate': error_rate,
-            'last_updated': self._last_updated[agent_name].isoformat(),
+            'last_updated': _ns_to_datetime(self._last_updated[agent_name]).isoformat(),
         }
         
         # Add processing time statistics
         if processing_times:
             result['processing_time'] = {
-                'avg_ms': statistics.mean(processing_times),
-                'min_ms': min(processing_times),
-                'max_ms': max(processing_times),
+                'avg_ms': processing_times.mean,
+                'min_ms': processing_times.min,
+                'max_ms': processing_times.max,
                 'count': len(processing_times),
             }
             if len(processing_times) > 1:
-                result['processing_time']['std_dev'] = statistics.stdev(processing_times)
+                result['processing_time']['std_dev'] = processing_times.stdev()
         
         # Add queue size statistics
         if queue_sizes:
             result['queue_size'] = {
-                'current': int(queue_sizes[-1]) if queue_sizes else 0,
-                'avg': statistics.mean(queue_sizes),
-                'max': max(queue_sizes),
+                'current': int(queue_sizes.last()),
+                'avg': queue_sizes.mean,
+                'max': queue_sizes.max,
             }
         
+        self._metrics_cache[agent_name] = (now, result)
         return result
     
+    def get_history(self, agent_name: str, metric: str) -> List[AgentMetric]:
+        """
+        Get the recorded data points of one metric for an agent.
+        
+        Args:
+            agent_name: Name of the agent
+            metric: 'processing_time', 'queue_size' or 'errors'
+            
+        Returns:
+            Data points, oldest first (empty if agent or metric not found)
+        """
+        history = self._metrics.get(agent_name, {}).get(metric)
+        if history is None:
+            return []
+        if isinstance(history, _RingBuffer):
+            return history.entries()
+        return list(history)
+    
     def get_snapshot(self, agent_name: str) -> Optional[AgentMetricsSnapshot]:
         """
         Get a snapshot of current metrics for an agent.
@@ -235,11 +403,7 @@ class AgentMetricsCollector:
         processing_time = metrics.get('processing_time', {})
         queue_size = metrics.get('queue_size', {})
         
-        # Get recent errors
-        recent_errors = [
-            m.metadata.get('error', 'Unknown error')
-            for m in self._metrics[agent_name]['errors']
-        ][-10:]  # Last 10 errors
+        recent_errors = list(self._recent_errors[agent_name])
         
         return AgentMetricsSnapshot(
             agent_name=agent_name,
@@ -315,18 +479,15 @@ class AgentMetricsCollector:
             })
         
         # Check if agent hasn't processed anything recently
-        last_updated_str = metrics.get('last_updated')
-        if last_updated_str:
-            last_updated = datetime.fromisoformat(last_updated_str)
-            time_since_update = datetime.utcnow() - last_updated
-            if time_since_update > timedelta(hours=1):
-                alerts.append({
-                    'type': 'stale_agent',
-                    'severity': 'warning',
-                    'message': f'No activity for {time_since_update}',
-                    'threshold': 3600,  # 1 hour in seconds
-                    'current_value': time_since_update.total_seconds(),
-                })
+        seconds_since_update = (time.time_ns() - self._last_updated[agent_name]) / 1e9
+        if seconds_since_update > 3600:
+            alerts.append({
+                'type': 'stale_agent',
+                'severity': 'warning',
+                'message': f'No activity for {timedelta(seconds=seconds_since_update)}',
+                'threshold': 3600,  # 1 hour in seconds
+                'current_value': seconds_since_update,
+            })
         
         return alerts
     
@@ -338,18 +499,15 @@ class AgentMetricsCollector:
             agent_name: Name of the agent, or None to reset all
         """
         if agent_name:
-            if agent_name in self._counters:
-                self._counters[agent_name] = {
-                    'processed': 0,
-                    'errors': 0,
-                }
+            counters = self._counters.get(agent_name)
+            if counters is not None:
+                counters['processed'] = counters['errors'] = 0
+                self._metrics_cache.pop(agent_name, None)
                 self.logger.info(f"Reset counters for agent: {agent_name}")
         else:
-            for name in self._counters:
-                self._counters[name] = {
-                    'processed': 0,
-                    'errors': 0,
-                }
+            for counters in self._counters.values():
+                counters['processed'] = counters['errors'] = 0
+            self._metrics_cache.clear()
             self.logger.info("Reset counters for all agents")
 
 
@@ -5,25 +5,51 @@ Sends alerts via Telegram and Slack when error rates exceed thresholds
 or system health degrades.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import asyncio
+import functools
+import hashlib
 import logging
+import time
 
 import httpx
+import orjson
 
 
-class AlertSeverity(Enum):
-    """Alert severity levels."""
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
-    CRITICAL = "critical"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Telegram rejects messages longer than this
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+TELEGRAM_BATCH_SEPARATOR = "\n\n----------\n\n"
+
 
+class AlertSeverity(Enum):
+    """
+    Alert severity levels.
 
-@dataclass
+    Each member's value is its name string; the members also carry their
+    rank (order), Telegram emoji, Slack color and display label.
+    """
+    INFO = ("info", 0, "i", "#36a64f")
+    WARNING = ("warning", 1, "!", "#ff9800")
+    ERROR = ("error", 2, "x", "#f44336")
+    CRITICAL = ("critical", 3, "X", "#9c27b0")
+
+    def __new__(cls, value: str, order: int, emoji: str, color: str):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.order = order
+        member.emoji = emoji
+        member.color = color
+        member.label = value.upper()
+        return member
+
+
+@dataclass(slots=True)
 class Alert:
     """Represents an alert."""
     severity: AlertSeverity
@@ -34,7 +60,85 @@ class Alert:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            self.timestamp = datetime.now(timezone.utc)
+
+
+# Formatting of everything but the timestamp is memoized, so repeats of
+# the same alert (the common case during incidents) reuse their payload.
+# details is passed as a tuple of items to be hashable.
+
+@functools.lru_cache(maxsize=256)
+def _telegram_body(
+    severity: AlertSeverity,
+    title: str,
+    message: str,
+    details: Optional[Tuple[Tuple[str, Any], ...]]
+) -> str:
+    """Telegram message text without the trailing timestamp."""
+    parts = [f"[{severity.emoji}] {severity.label}: {title}\n\n", message, "\n"]
+
+    if details:
+        parts.append("\nDetails:\n")
+        parts.extend(f"  - {key}: {value}\n" for key, value in details)
+
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _slack_blocks(
+    severity: AlertSeverity,
+    title: str,
+    message: str,
+    details: Optional[Tuple[Tuple[str, Any], ...]]
+) -> Tuple[Dict[str, Any], ...]:
+    """Slack blocks without the trailing timestamp context block."""
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": f"{severity.label}: {title}"
+            }
+        },
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": message
+            }
+        }
+    ]
+
+    if details:
+        detail_text = "\n".join([f"*{k}:* {v}" for k, v in details])
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": detail_text
+            }
+        })
+
+    return tuple(blocks)
+
+
+def _format_cached(formatter, alert: Alert):
+    """Call a memoized formatter, bypassing the cache for unhashable details."""
+    details = tuple(alert.details.items()) if alert.details else None
+    try:
+        return formatter(alert.severity, alert.title, alert.message, details)
+    except TypeError:
+        return formatter.__wrapped__(alert.severity, alert.title, alert.message, details)
+
+
+def _skip_if_unconfigured(method):
+    """Return early from an alert helper before building an Alert no channel would receive."""
+    @functools.wraps(method)
+    async def wrapper(self: "AlertService", *args, **kwargs) -> Dict[str, bool]:
+        if not self.is_configured():
+            return {'skipped': True}
+        return await method(self, *args, **kwargs)
+    return wrapper
 
 
 class AlertService:
@@ -57,7 +161,10 @@ class AlertService:
         telegram_chat_id: Optional[str] = None,
         slack_webhook_url: Optional[str] = None,
         min_severity: AlertSeverity = AlertSeverity.WARNING,
-        rate_limit_seconds: int = 60
+        rate_limit_seconds: int = 60,
+        max_tracked_alerts: int = 10_000,
+        batch_window_seconds: float = 0.5,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize alert service.
@@ -68,25 +175,87 @@ class AlertService:
             slack_webhook_url: Slack incoming webhook URL
             min_severity: Minimum severity level to send alerts
             rate_limit_seconds: Minimum time between duplicate alerts
+            max_tracked_alerts: Maximum number of alerts remembered for
+                rate limiting (oldest are forgotten first)
+            batch_window_seconds: How long to collect alerts before sending
+                them together (0 sends each alert immediately)
+            http_client: Shared HTTP client to use; one is created (and
+                owned) on first send if not given
         """
         self.telegram_bot_token = telegram_bot_token
         self.telegram_chat_id = telegram_chat_id
         self.slack_webhook_url = slack_webhook_url
         self.min_severity = min_severity
         self.rate_limit_seconds = rate_limit_seconds
+        self.max_tracked_alerts = max_tracked_alerts
+        self.batch_window_seconds = batch_window_seconds
 
         self.logger = logging.getLogger(__name__)
 
-        # Track last alert times for rate limiting
-        self._last_alerts: Dict[str, datetime] = {}
+        # Alert key -> monotonic time last sent, oldest first. Entries
+        # expire after rate_limit_seconds so the map stays bounded.
+        self._sent_alerts: "OrderedDict[bytes, float]" = OrderedDict()
+        # Entries dropped by the size cap before expiring; a rising count
+        # means max_tracked_alerts is too small to rate-limit everything
+        self._evicted_alerts = 0
+
+        # Shared HTTP client; if not injected it is created on first send
+        # so it binds to the running event loop and reuses keep-alive
+        # connections
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
+
+        # Alerts waiting for the current batch window, by alert key
+        self._pending: Dict[bytes, Tuple[Alert, asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it if needed."""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            # HTTP/2 multiplexes concurrent requests to the same host
+            # over one connection
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=15.0
+                ),
+                http2=True
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Send alerts still waiting for their batch window, then close the
+        HTTP client if this instance created it.
+        """
+        try:
+            task = self._flush_task
+            if task is not None:
+                # Take the queued alerts before cancelling so the flush
+                # task has nothing left to cancel
+                pending = self._take_pending()
+                task.cancel()
+                await asyncio.wait((task,))
+                await self._send_pending(pending)
+        finally:
+            if self._owns_client and self._client is not None:
+                await self._client.aclose()
+                self._client = None
+
+    @staticmethod
+    def _alert_key(alert: Alert) -> bytes:
+        """
+        Fixed-size key identifying duplicate alerts.
 
-        # Severity order for comparison
-        self._severity_order = {
-            AlertSeverity.INFO: 0,
-            AlertSeverity.WARNING: 1,
-            AlertSeverity.ERROR: 2,
-            AlertSeverity.CRITICAL: 3
-        }
+        Message and details are left out on purpose: they carry live values
+        (e.g. the current error rate) that would defeat rate limiting.
+        """
+        return hashlib.blake2b(
+            f"{alert.severity.value}|{alert.title}".encode(),
+            digest_size=16
+        ).digest()
 
     def _should_send_alert(self, alert: Alert) -> bool:
         """
@@ -99,88 +268,42 @@ class AlertService:
             True if alert should be sent
         """
         # Check severity threshold
-        if self._severity_order[alert.severity] < self._severity_order[self.min_severity]:
+        if alert.severity.order < self.min_severity.order:
             return False
 
         # Check rate limiting
-        alert_key = f"{alert.severity.value}:{alert.title}"
-        last_sent = self._last_alerts.get(alert_key)
+        last_sent = self._sent_alerts.get(self._alert_key(alert))
 
-        if last_sent:
-            elapsed = (datetime.utcnow() - last_sent).total_seconds()
-            if elapsed < self.rate_limit_seconds:
-                self.logger.debug(f"Rate limiting alert: {alert_key}")
+        if last_sent is not None:
+            if time.monotonic() - last_sent < self.rate_limit_seconds:
+                self.logger.debug(f"Rate limiting alert: {alert.severity.value}:{alert.title}")
                 return False
 
         return True
 
     def _record_alert_sent(self, alert: Alert) -> None:
         """Record that an alert was sent for rate limiting."""
-        alert_key = f"{alert.severity.value}:{alert.title}"
-        self._last_alerts[alert_key] = datetime.utcnow()
+        now = time.monotonic()
+        alert_key = self._alert_key(alert)
+        self._sent_alerts.pop(alert_key, None)
+        self._sent_alerts[alert_key] = now
+
+        # Drop expired entries (oldest first), then enforce the size cap
+        expired_before = now - self.rate_limit_seconds
+        while self._sent_alerts and next(iter(self._sent_alerts.values())) <= expired_before:
+            self._sent_alerts.popitem(last=False)
+        while len(self._sent_alerts) > self.max_tracked_alerts:
+            self._sent_alerts.popitem(last=False)
+            self._evicted_alerts += 1
 
     def _format_telegram_message(self, alert: Alert) -> str:
         """Format alert for Telegram."""
-        emoji_map = {
-            AlertSeverity.INFO: "i",
-            AlertSeverity.WARNING: "!",
-            AlertSeverity.ERROR: "x",
-            AlertSeverity.CRITICAL: "X"
-        }
-
-        emoji = emoji_map.get(alert.severity, "?")
-        severity_text = alert.severity.value.upper()
-
-        message = f"[{emoji}] {severity_text}: {alert.title}\n\n"
-        message += f"{alert.message}\n"
-
-        if alert.details:
-            message += "\nDetails:\n"
-            for key, value in alert.details.items():
-                message += f"  - {key}: {value}\n"
-
-        message += f"\nTime: {alert.timestamp.isoformat()}"
-
-        return message
+        body = _format_cached(_telegram_body, alert)
+        return f"{body}\nTime: {alert.timestamp.isoformat()}"
 
     def _format_slack_message(self, alert: Alert) -> Dict[str, Any]:
         """Format alert for Slack."""
-        color_map = {
-            AlertSeverity.INFO: "#36a64f",
-            AlertSeverity.WARNING: "#ff9800",
-            AlertSeverity.ERROR: "#f44336",
-            AlertSeverity.CRITICAL: "#9c27b0"
-        }
-
-        color = color_map.get(alert.severity, "#808080")
-
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{alert.severity.value.upper()}: {alert.title}"
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": alert.message
-                }
-            }
-        ]
-
-        if alert.details:
-            detail_text = "\n".join([f"*{k}:* {v}" for k, v in alert.details.items()])
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": detail_text
-                }
-            })
-
+        blocks = list(_format_cached(_slack_blocks, alert))
         blocks.append({
             "type": "context",
             "elements": [
@@ -194,12 +317,40 @@ class AlertService:
         return {
             "attachments": [
                 {
-                    "color": color,
+                    "color": alert.severity.color,
                     "blocks": blocks
                 }
             ]
         }
 
+    def _format_telegram_batch(self, alerts: List[Alert]) -> List[str]:
+        """
+        Format alerts as few Telegram messages as possible.
+
+        Alerts are joined with a separator and split only where a message
+        would exceed Telegram's length limit.
+        """
+        messages = []
+        current = ""
+        for text in (self._format_telegram_message(alert) for alert in alerts):
+            if current and len(current) + len(TELEGRAM_BATCH_SEPARATOR) + len(text) > TELEGRAM_MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = ""
+            current = f"{current}{TELEGRAM_BATCH_SEPARATOR}{text}" if current else text
+        if current:
+            messages.append(current)
+        return messages
+
+    def _format_slack_batch(self, alerts: List[Alert]) -> Dict[str, Any]:
+        """Format alerts as one Slack payload with an attachment per alert."""
+        return {
+            "attachments": [
+                attachment
+                for alert in alerts
+                for attachment in self._format_slack_message(alert)["attachments"]
+            ]
+        }
+
     async def send_telegram(self, alert: Alert) -> bool:
         """
         Send alert via Telegram.
@@ -210,26 +361,38 @@ class AlertService:
         Returns:
             True if sent successfully
         """
+        return await self.send_telegram_batch([alert])
+
+    async def send_telegram_batch(self, alerts: List[Alert]) -> bool:
+        """
+        Send several alerts via Telegram in as few messages as possible.
+
+        Args:
+            alerts: Alerts to send
+
+        Returns:
+            True if all messages were sent successfully
+        """
         if not self.telegram_bot_token or not self.telegram_chat_id:
             return False
 
         url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
-        message = self._format_telegram_message(alert)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            for message in self._format_telegram_batch(alerts):
+                response = await self._get_client().post(
                     url,
-                    json={
+                    content=orjson.dumps({
                         "chat_id": self.telegram_chat_id,
                         "text": message,
                         "parse_mode": "HTML"
-                    },
+                    }),
+                    headers=_JSON_HEADERS,
                     timeout=10.0
                 )
                 response.raise_for_status()
-                self.logger.info(f"Telegram alert sent: {alert.title}")
-                return True
+            self.logger.info(f"Telegram alert sent: {self._describe(alerts)}")
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to send Telegram alert: {e}")
@@ -242,58 +405,151 @@ class AlertService:
         Args:
             alert: Alert to send
 
+        Returns:
+            True if sent successfully
+        """
+        return await self.send_slack_batch([alert])
+
+    async def send_slack_batch(self, alerts: List[Alert]) -> bool:
+        """
+        Send several alerts via Slack webhook in one request.
+
+        Args:
+            alerts: Alerts to send
+
         Returns:
             True if sent successfully
         """
         if not self.slack_webhook_url:
             return False
 
-        payload = self._format_slack_message(alert)
+        payload = self._format_slack_batch(alerts)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.slack_webhook_url,
-                    json=payload,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                self.logger.info(f"Slack alert sent: {alert.title}")
-                return True
+            response = await self._get_client().post(
+                self.slack_webhook_url,
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            self.logger.info(f"Slack alert sent: {self._describe(alerts)}")
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to send Slack alert: {e}")
             return False
 
+    @staticmethod
+    def _describe(alerts: List[Alert]) -> str:
+        """Short description of alerts for log messages."""
+        if len(alerts) == 1:
+            return alerts[0].title
+        return f"{len(alerts)} alerts"
+
     async def send_alert(self, alert: Alert) -> Dict[str, bool]:
         """
         Send alert via all configured channels.
 
+        Alerts arriving within batch_window_seconds of each other are
+        coalesced into one request per channel.
+
         Args:
             alert: Alert to send
 
         Returns:
             Dictionary with send status for each channel
         """
-        if not self._should_send_alert(alert):
+        if not self.is_configured() or not self._should_send_alert(alert):
             return {'skipped': True}
 
-        results = {}
+        if self.batch_window_seconds <= 0:
+            return await self._dispatch([alert])
+
+        # An identical alert is already waiting in this window
+        alert_key = self._alert_key(alert)
+        if alert_key in self._pending:
+            return {'skipped': True}
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[alert_key] = (alert, future)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the batch window, then send everything queued in it."""
+        try:
+            await asyncio.sleep(self.batch_window_seconds)
+        except BaseException as e:
+            # Don't leave callers of send_alert waiting forever
+            self._fail_pending(self._take_pending(), e)
+            raise
+        await self._send_pending(self._take_pending())
+
+    def _take_pending(self) -> List[Tuple[Alert, asyncio.Future]]:
+        """Remove and return the alerts queued in the current window."""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        self._flush_task = None
+        return pending
+
+    async def _send_pending(self, pending: List[Tuple[Alert, asyncio.Future]]) -> None:
+        """Send queued alerts and resolve their send_alert futures."""
+        if not pending:
+            return
+        try:
+            results = await self._dispatch([alert for alert, _ in pending])
+        except BaseException as e:
+            self._fail_pending(pending, e)
+            raise
+
+        for _, future in pending:
+            if not future.done():
+                future.set_result(dict(results))
+
+    @staticmethod
+    def _fail_pending(pending: List[Tuple[Alert, asyncio.Future]], error: BaseException) -> None:
+        """Propagate an error (or cancellation) to waiting send_alert callers."""
+        for _, future in pending:
+            if future.done():
+                continue
+            if isinstance(error, Exception):
+                future.set_exception(error)
+            else:
+                future.cancel()
+
+    async def _dispatch(self, alerts: List[Alert]) -> Dict[str, bool]:
+        """Send alerts via all configured channels and record them."""
+        channels = []
+        sends = []
 
         # Send via Telegram
         if self.telegram_bot_token and self.telegram_chat_id:
-            results['telegram'] = await self.send_telegram(alert)
+            channels.append('telegram')
+            sends.append(self.send_telegram_batch(alerts))
 
         # Send via Slack
         if self.slack_webhook_url:
-            results['slack'] = await self.send_slack(alert)
+            channels.append('slack')
+            sends.append(self.send_slack_batch(alerts))
+
+        # Channels are independent, so send concurrently
+        outcomes = await asyncio.gather(*sends, return_exceptions=True)
+        results = {
+            channel: outcome is True
+            for channel, outcome in zip(channels, outcomes)
+        }
 
-        # Record that alert was sent
+        # Record that alerts were sent
         if any(results.values()):
-            self._record_alert_sent(alert)
+            for alert in alerts:
+                self._record_alert_sent(alert)
 
         return results
 
+    @_skip_if_unconfigured
     async def alert_high_error_rate(
         self,
         error_rate: float,
@@ -330,6 +586,7 @@ class AlertService:
 
         return await self.send_alert(alert)
 
+    @_skip_if_unconfigured
     async def alert_scheduler_stopped(self, reason: Optional[str] = None) -> Dict[str, bool]:
         """
         Send alert when scheduler stops unexpectedly.
@@ -351,6 +608,7 @@ class AlertService:
 
         return await self.send_alert(alert)
 
+    @_skip_if_unconfigured
     async def alert_agent_unhealthy(
         self,
         agent_name: str,
@@ -375,6 +633,7 @@ class AlertService:
 
         return await self.send_alert(alert)
 
+    @_skip_if_unconfigured
     async def alert_database_issue(
         self,
         error_message: str,
@@ -402,6 +661,7 @@ class AlertService:
 
         return await self.send_alert(alert)
 
+    @_skip_if_unconfigured
     async def alert_api_limit_reached(
         self,
         api_name: str,
@@ -443,5 +703,6 @@ class AlertService:
             'slack_configured': bool(self.slack_webhook_url),
             'min_severity': self.min_severity.value,
             'rate_limit_seconds': self.rate_limit_seconds,
-            'recent_alerts': len(self._last_alerts)
+            'recent_alerts': len(self._sent_alerts),
+            'recent_alerts_evicted': self._evicted_alerts
         }
@@ -4,19 +4,35 @@ Health Check System for Agent Swarm Knowledge System.
 Provides comprehensive health monitoring for all system components.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import asyncio
 import logging
+import random
+import time
 import httpx
+import orjson
 
 from services.supabase_client import SupabaseClient
 from services.pubmed_service import PubMedService
 from services.crossref_service import CrossRefService
 
 
+# Component names, in the order check_all runs the checks
+CHECK_NAMES = ("supabase", "pubmed_api", "crossref_api", "openai_api", "agents")
+
+
+# Lightweight authenticated OpenAI endpoint used to probe availability
+OPENAI_PROBE_URL = "https://api.openai.com/v1/models/text-embedding-3-small"
+
+
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class HealthStatusEnum(Enum):
     """Health status levels."""
     HEALTHY = "healthy"
@@ -25,7 +41,7 @@ class HealthStatusEnum(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentHealth:
     """Health status of a single component."""
     name: str
@@ -33,10 +49,10 @@ class ComponentHealth:
     response_time_ms: float
     message: str = ""
     details: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Overall system health status."""
     status: HealthStatusEnum
@@ -44,6 +60,16 @@ class HealthStatus:
     components: Dict[str, ComponentHealth]
     overall_response_time_ms: float
     
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON bytes, in the same shape as to_dict().
+        
+        orjson walks the dataclasses, enums and datetimes directly, so no
+        intermediate dict tree is built; other detail values fall back to str()
+        and non-string detail keys are written as strings.
+        """
+        return orjson.dumps(self, default=str, option=orjson.OPT_NON_STR_KEYS)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -101,8 +127,48 @@ class HealthChecker:
         # Timeout for health checks (seconds)
         self.check_timeout = 10.0
         
+        # How long a check_all result is reused (seconds)
+        self.result_ttl = 5.0
+        self._last_result: Optional[HealthStatus] = None
+        self._last_result_time = 0.0
+        self._inflight: Optional[asyncio.Task] = None
+        
         # Store agent references for agent health checks
         self.agents: Dict[str, Any] = {}
+        # name -> (health probe, stats getter), resolved once per agent
+        self._agent_probes: Dict[str, Tuple[Callable[[], bool], Callable[[], dict]]] = {}
+        
+        # Shared HTTP client, created on first check so it binds to the
+        # running event loop and reuses keep-alive connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Running periodic-check callbacks (kept referenced until done);
+        # at most max_concurrent_callbacks run at once, the rest wait
+        self.max_concurrent_callbacks = 4
+        self._callback_tasks: Set[asyncio.Task] = set()
+        self._callback_semaphore = asyncio.Semaphore(self.max_concurrent_callbacks)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent requests to the same host
+            # over one connection
+            self._client = httpx.AsyncClient(
+                timeout=self.check_timeout,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=15.0
+                ),
+                http2=True
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def register_agents(self, agents: Dict[str, Any]) -> None:
         """
@@ -112,16 +178,56 @@ class HealthChecker:
             agents: Dictionary of agent instances
         """
         self.agents = agents
+        self._agent_probes = {
+            name: self._resolve_agent_probes(agent)
+            for name, agent in agents.items()
+        }
+    
+    @staticmethod
+    def _resolve_agent_probes(agent: Any) -> Tuple[Callable[[], bool], Callable[[], dict]]:
+        """Look up an agent's health and stats callables once, with fallbacks."""
+        if hasattr(agent, 'is_healthy'):
+            health_fn = agent.is_healthy
+        else:
+            # Fallback: check if running
+            health_fn = lambda: getattr(agent, 'is_running', False)
+        stats_fn = getattr(agent, 'get_stats', None) or dict
+        return health_fn, stats_fn
     
     async def check_all(self) -> HealthStatus:
         """
         Run all health checks and return overall status.
         
+        Results are reused for result_ttl seconds, and concurrent callers
+        share a single in-flight run, so several pollers cause one round
+        of upstream requests.
+        
         Returns:
             HealthStatus with all component statuses
         """
-        start_time = datetime.utcnow()
+        if (
+            self._last_result is not None
+            and time.monotonic() - self._last_result_time < self.result_ttl
+        ):
+            return self._last_result
+        
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._run_all_checks())
+        inflight = self._inflight
+        
+        try:
+            # Shielded so one cancelled caller doesn't cancel the others' run
+            result = await asyncio.shield(inflight)
+        finally:
+            if inflight.done() and self._inflight is inflight:
+                self._inflight = None
         
+        self._last_result = result
+        self._last_result_time = time.monotonic()
+        return result
+    
+    async def _run_all_checks(self) -> HealthStatus:
+        """Run every health check once, uncached."""
         # Run all checks concurrently
         checks = await asyncio.gather(
             self.check_supabase(),
@@ -132,11 +238,18 @@ class HealthChecker:
             return_exceptions=True
         )
         
+        # A check that raised still gets a component, so it can't be
+        # silently left out of the overall status
         components = {}
-        for check in checks:
+        for name, check in zip(CHECK_NAMES, checks):
             if isinstance(check, Exception):
                 self.logger.error(f"Health check failed: {check}")
-                continue
+                check = ComponentHealth(
+                    name=name,
+                    status=HealthStatusEnum.UNHEALTHY,
+                    response_time_ms=0,
+                    message=f"Health check raised: {check}"
+                )
             components[check.name] = check
         
         # Calculate overall status
@@ -147,7 +260,7 @@ class HealthChecker:
         
         return HealthStatus(
             status=overall_status,
-            timestamp=datetime.utcnow(),
+            timestamp=_utcnow(),
             components=components,
             overall_response_time_ms=total_time
         )
@@ -163,49 +276,50 @@ class HealthChecker:
         - Any UNHEALTHY -> UNHEALTHY
         - Any DEGRADED -> DEGRADED
         - All HEALTHY -> HEALTHY
+        - Otherwise -> UNKNOWN
         """
-        statuses = [comp.status for comp in components.values()]
-        
-        if HealthStatusEnum.UNHEALTHY in statuses:
-            return HealthStatusEnum.UNHEALTHY
-        elif HealthStatusEnum.DEGRADED in statuses:
-            return HealthStatusEnum.DEGRADED
-        elif all(s == HealthStatusEnum.HEALTHY for s in statuses):
-            return HealthStatusEnum.HEALTHY
-        else:
-            return HealthStatusEnum.UNKNOWN
+        worst = HealthStatusEnum.HEALTHY
+        for comp in components.values():
+            status = comp.status
+            if status is HealthStatusEnum.UNHEALTHY:
+                return HealthStatusEnum.UNHEALTHY
+            if status is HealthStatusEnum.DEGRADED:
+                worst = HealthStatusEnum.DEGRADED
+            elif status is HealthStatusEnum.UNKNOWN and worst is HealthStatusEnum.HEALTHY:
+                worst = HealthStatusEnum.UNKNOWN
+        return worst
     
     async def check_supabase(self) -> ComponentHealth:
         """Check Supabase database connectivity."""
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.supabase.url}/rest/v1/",
-                    headers=self.supabase.headers,
-                    timeout=self.check_timeout
+            # HEAD skips the OpenAPI schema body; the status is enough
+            response = await self._get_client().head(
+                f"{self.supabase.url}/rest/v1/",
+                headers=self.supabase.headers,
+                timeout=self.check_timeout
+            )
+            
+            response_time = (time.monotonic() - start_time) * 1000
+            
+            if response.status_code == 200:
+                return ComponentHealth(
+                    name="supabase",
+                    status=HealthStatusEnum.HEALTHY,
+                    response_time_ms=response_time,
+                    message="Database connection successful"
+                )
+            else:
+                return ComponentHealth(
+                    name="supabase",
+                    status=HealthStatusEnum.UNHEALTHY,
+                    response_time_ms=response_time,
+                    message=f"Unexpected status code: {response.status_code}"
                 )
-                
-                response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-                
-                if response.status_code == 200:
-                    return ComponentHealth(
-                        name="supabase",
-                        status=HealthStatusEnum.HEALTHY,
-                        response_time_ms=response_time,
-                        message="Database connection successful"
-                    )
-                else:
-                    return ComponentHealth(
-                        name="supabase",
-                        status=HealthStatusEnum.UNHEALTHY,
-                        response_time_ms=response_time,
-                        message=f"Unexpected status code: {response.status_code}"
-                    )
         
         except Exception as e:
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             return ComponentHealth(
                 name="supabase",
                 status=HealthStatusEnum.UNHEALTHY,
@@ -215,7 +329,7 @@ class HealthChecker:
     
     async def check_pubmed(self) -> ComponentHealth:
         """Check PubMed API availability."""
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
         try:
             # Try a simple search
@@ -224,7 +338,7 @@ class HealthChecker:
                 max_results=1
             )
             
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             
             return ComponentHealth(
                 name="pubmed_api",
@@ -235,7 +349,7 @@ class HealthChecker:
             )
         
         except Exception as e:
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             return ComponentHealth(
                 name="pubmed_api",
                 status=HealthStatusEnum.UNHEALTHY,
@@ -245,7 +359,7 @@ class HealthChecker:
     
     async def check_crossref(self) -> ComponentHealth:
         """Check CrossRef API availability."""
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
         try:
             # Try a simple works query
@@ -254,7 +368,7 @@ class HealthChecker:
                 rows=1
             )
             
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             
             # Check circuit breaker status
             cb_status = self.crossref.get_circuit_breaker_status()
@@ -276,7 +390,7 @@ class HealthChecker:
             )
         
         except Exception as e:
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             return ComponentHealth(
                 name="crossref_api",
                 status=HealthStatusEnum.UNHEALTHY,
@@ -286,7 +400,7 @@ class HealthChecker:
     
     async def check_openai(self) -> ComponentHealth:
         """Check OpenAI API availability."""
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
         if not self.openai_api_key:
             return ComponentHealth(
@@ -297,32 +411,32 @@ class HealthChecker:
             )
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.openai.com/v1/models",
-                    headers={"Authorization": f"Bearer {self.openai_api_key}"},
-                    timeout=self.check_timeout
+            # A single model's metadata instead of the full model list
+            response = await self._get_client().get(
+                OPENAI_PROBE_URL,
+                headers={"Authorization": f"Bearer {self.openai_api_key}"},
+                timeout=self.check_timeout
+            )
+            
+            response_time = (time.monotonic() - start_time) * 1000
+            
+            if response.status_code == 200:
+                return ComponentHealth(
+                    name="openai_api",
+                    status=HealthStatusEnum.HEALTHY,
+                    response_time_ms=response_time,
+                    message="OpenAI API responding"
+                )
+            else:
+                return ComponentHealth(
+                    name="openai_api",
+                    status=HealthStatusEnum.UNHEALTHY,
+                    response_time_ms=response_time,
+                    message=f"OpenAI API error: {response.status_code}"
                 )
-                
-                response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-                
-                if response.status_code == 200:
-                    return ComponentHealth(
-                        name="openai_api",
-                        status=HealthStatusEnum.HEALTHY,
-                        response_time_ms=response_time,
-                        message="OpenAI API responding"
-                    )
-                else:
-                    return ComponentHealth(
-                        name="openai_api",
-                        status=HealthStatusEnum.UNHEALTHY,
-                        response_time_ms=response_time,
-                        message=f"OpenAI API error: {response.status_code}"
-                    )
         
         except Exception as e:
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             return ComponentHealth(
                 name="openai_api",
                 status=HealthStatusEnum.UNHEALTHY,
@@ -332,9 +446,9 @@ class HealthChecker:
     
     async def check_agents(self) -> ComponentHealth:
         """Check all registered agents' health."""
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
-        if not self.agents:
+        if not self._agent_probes:
             return ComponentHealth(
                 name="agents",
                 status=HealthStatusEnum.UNKNOWN,
@@ -344,20 +458,15 @@ class HealthChecker:
         
         agent_statuses = {}
         healthy_count = 0
-        total_count = len(self.agents)
+        total_count = len(self._agent_probes)
         
-        for name, agent in self.agents.items():
+        for name, (health_fn, stats_fn) in self._agent_probes.items():
             try:
-                # Check if agent has is_healthy method
-                if hasattr(agent, 'is_healthy'):
-                    is_healthy = agent.is_healthy()
-                else:
-                    # Fallback: check if running
-                    is_healthy = getattr(agent, 'is_running', False)
+                is_healthy = health_fn()
                 
                 agent_statuses[name] = {
                     'healthy': is_healthy,
-                    'stats': getattr(agent, 'get_stats', lambda: {})()
+                    'stats': stats_fn()
                 }
                 
                 if is_healthy:
@@ -369,7 +478,7 @@ class HealthChecker:
                     'error': str(e)
                 }
         
-        response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+        response_time = (time.monotonic() - start_time) * 1000
         
         # Determine overall status
         if healthy_count == total_count:
@@ -398,18 +507,31 @@ class HealthChecker:
         """
         Run health checks periodically.
         
+        Cycles are scheduled against fixed deadlines, so the period stays
+        close to interval_seconds however long a check takes, with a little
+        jitter so checkers started together don't probe APIs in lockstep.
+        
         Args:
             interval_seconds: Time between checks
             callback: Optional callback function to receive health status
+                (run in the background so it can't delay the next cycle)
         """
         self.logger.info(f"Starting periodic health checks (interval: {interval_seconds}s)")
         
+        next_deadline = time.monotonic()
         while True:
+            next_deadline = max(next_deadline + interval_seconds, time.monotonic())
+            
             try:
-                health = await self.check_all()
+                health = await asyncio.wait_for(
+                    self.check_all(),
+                    timeout=interval_seconds * 0.9
+                )
                 
                 if callback:
-                    await callback(health)
+                    task = asyncio.create_task(self._run_callback(callback, health))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_tasks.discard)
                 
                 # Log unhealthy states
                 if health.status != HealthStatusEnum.HEALTHY:
@@ -422,7 +544,18 @@ class HealthChecker:
                 else:
                     self.logger.debug(f"System health: {health.status.value}")
             
+            except asyncio.TimeoutError:
+                self.logger.error("Health check exceeded the check interval")
             except Exception as e:
                 self.logger.error(f"Health check error: {e}")
             
-            await asyncio.sleep(interval_seconds)
+            jitter = random.uniform(0, interval_seconds * 0.05)
+            await asyncio.sleep(max(0.0, next_deadline - time.monotonic()) + jitter)
+    
+    async def _run_callback(self, callback: callable, health: HealthStatus) -> None:
+        """Run a periodic-check callback, limiting how many run at once."""
+        async with self._callback_semaphore:
+            try:
+                await callback(health)
+            except Exception:
+                self.logger.exception("Health check callback failed")
@@ -5,27 +5,59 @@ Coordinates the execution of all agents with different intervals.
 """
 
 import asyncio
+import functools
+import heapq
+import importlib
 import logging
+import queue
 import signal
 import sys
 import os
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass, fields
 
-from config import Settings, get_settings, get_config_for_environment
+import httpx
+import orjson
+
+# uvloop is optional (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from config import Settings, LLM_PROVIDER_PRIORITY, get_settings, get_config_for_environment
 from services.supabase_client import SupabaseClient
-from services.llm_service import LLMService
-from services.fitness_scraper_service import FitnessScraperService
-from agents.research_agent import ResearchAgent
-from agents.extraction_agent import ExtractionAgent
-from agents.validation_agent import ValidationAgent
-from agents.kb_agent import KnowledgeBaseAgent
-from agents.conflict_agent import ConflictAgent
-from agents.prompt_engineering_agent import PromptEngineeringAgent
 from monitoring.alert_service import AlertService, AlertSeverity
 
+# Agent classes (and the LLM/scraping stacks behind them) are imported on
+# first use, so commands like `status` don't pay for them
+_AGENT_CLASSES = {
+    'research': ('agents.research_agent', 'ResearchAgent'),
+    'extraction': ('agents.extraction_agent', 'ExtractionAgent'),
+    'validation': ('agents.validation_agent', 'ValidationAgent'),
+    'kb': ('agents.kb_agent', 'KnowledgeBaseAgent'),
+    'conflict': ('agents.conflict_agent', 'ConflictAgent'),
+    'prompt_engineering': ('agents.prompt_engineering_agent', 'PromptEngineeringAgent'),
+}
+
+
+# Categories the prompt engineering agent maintains prompts for, in
+# processing order
+PROMPT_CATEGORIES = (
+    'strength_training', 'hypertrophy', 'nutrition', 'recovery', 'cardio', 'general'
+)
+
+
+@functools.cache
+def _load_agent_class(name: str) -> type:
+    """Import and return the agent class registered under name (cached)."""
+    module_name, class_name = _AGENT_CLASSES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an agent."""
     enabled: bool = True
@@ -33,6 +65,11 @@ class AgentConfig:
     batch_size: int = 10
 
 
+# Settable AgentConfig fields, and where they appear in get_status()
+_AGENT_CONFIG_FIELDS = frozenset(f.name for f in fields(AgentConfig))
+_STATUS_FIELDS = {'enabled': 'enabled', 'interval_seconds': 'interval'}
+
+
 class AgentScheduler:
     """
     Scheduler that manages and coordinates all agents.
@@ -52,7 +89,8 @@ class AgentScheduler:
         supabase_key: Optional[str] = None,
         openai_api_key: Optional[str] = None,
         anthropic_api_key: Optional[str] = None,
-        log_level: Optional[str] = None
+        log_level: Optional[str] = None,
+        load_agents: bool = True
     ):
         """
         Initialize the scheduler.
@@ -64,6 +102,8 @@ class AgentScheduler:
             openai_api_key: OpenAI API key (legacy, use settings)
             anthropic_api_key: Anthropic API key (legacy, use settings)
             log_level: Logging level (legacy, use settings)
+            load_agents: Build the LLM, scraper and agents; pass False for a
+                lightweight instance that only reports configuration
         """
         # Load settings
         if settings is not None:
@@ -80,10 +120,19 @@ class AgentScheduler:
         # Setup logging
         level = log_level or (self.settings.log_level if self.settings else 'INFO')
         log_format = self.settings.log_format if self.settings else '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        logging.basicConfig(
-            level=getattr(logging, level.upper()),
-            format=log_format
-        )
+        self._log_listener: Optional[QueueListener] = None
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            # Records are queued on the event loop thread and written to
+            # stderr by a listener thread, so slow writes can't block the loop
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(logging.Formatter(log_format))
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self._log_queue_handler = QueueHandler(log_queue)
+            root_logger.addHandler(self._log_queue_handler)
+            root_logger.setLevel(getattr(logging, level.upper()))
+            self._log_listener = QueueListener(log_queue, stream_handler)
+            self._log_listener.start()
         self.logger = logging.getLogger('AgentScheduler')
         
         # Get credentials from settings or legacy parameters
@@ -102,40 +151,70 @@ class AgentScheduler:
         if not supabase_url or not supabase_key:
             raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY are required")
         
+        # One pooled HTTP/2 client shared by every service, so connections
+        # and TLS sessions are reused across Supabase, scraping and alerts
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            ),
+            http2=True,
+            timeout=30.0
+        )
+        
         # Initialize services
-        self.supabase = SupabaseClient(supabase_url, supabase_key)
+        self.supabase = SupabaseClient(supabase_url, supabase_key, http_client=self._http)
         self.llm = None
 
-        # Determine LLM provider priority: DeepSeek > Kimi > OpenAI > Anthropic
-        if deepseek_api_key or kimi_api_key or openai_api_key or anthropic_api_key:
-            # Determine default provider
-            if deepseek_api_key:
-                default_provider = 'deepseek'
-                self.logger.info("Using DeepSeek as LLM provider")
-            elif kimi_api_key:
-                default_provider = 'kimi'
-                self.logger.info("Using Kimi (Moonshot AI) as LLM provider")
-            elif openai_api_key:
-                default_provider = 'openai'
-                self.logger.info("Using OpenAI as LLM provider")
-            else:
-                default_provider = 'anthropic'
-                self.logger.info("Using Anthropic as LLM provider")
+        # Default provider is the first one in priority order with a key
+        provider_keys = {
+            'deepseek': deepseek_api_key,
+            'kimi': kimi_api_key,
+            'openai': openai_api_key,
+            'anthropic': anthropic_api_key,
+        }
+        default_provider = next(
+            (p for p in LLM_PROVIDER_PRIORITY if provider_keys[p]), None
+        )
+        
+        if load_agents and default_provider is not None:
+            from services.llm_service import LLMService, ConcurrencyLimitedLLM
+            from services.llm_cache import CachedLLMService, InMemoryLRU
+            
+            self.logger.info("Using %s as LLM provider", default_provider)
             
-            self.llm = LLMService(
-                openai_api_key=openai_api_key,
-                anthropic_api_key=anthropic_api_key,
-                kimi_api_key=kimi_api_key,
-                deepseek_api_key=deepseek_api_key,
-                default_provider=default_provider
+            # Repeated prompts are answered from the cache; misses pass one
+            # admission gate shared by every agent, so parallel agents queue
+            # for a slot instead of tripping provider rate limits
+            self.llm = CachedLLMService(
+                ConcurrencyLimitedLLM(
+                    LLMService(
+                        openai_api_key=openai_api_key,
+                        anthropic_api_key=anthropic_api_key,
+                        kimi_api_key=kimi_api_key,
+                        deepseek_api_key=deepseek_api_key,
+                        default_provider=default_provider
+                    ),
+                    max_concurrency=self.settings.llm_max_concurrency if self.settings else 4
+                ),
+                cache=InMemoryLRU(max_size=2048, ttl=86400)
             )
 
         # Initialize fitness scraper with settings
         scraper_config = self.settings.get_scraper_config() if self.settings else {}
-        self.fitness_scraper = FitnessScraperService(
-            rate_limit_delay=scraper_config.get('rate_limit_delay', 2.0),
-            timeout=scraper_config.get('timeout', 30.0)
-        ) if scraper_config.get('enabled', True) else None
+        scraper_enabled = scraper_config.get('enabled', True)
+        self.fitness_scraper = None
+        if load_agents and scraper_enabled:
+            from services.fitness_scraper_service import FitnessScraperService
+            self.fitness_scraper = FitnessScraperService(
+                rate_limit_delay=scraper_config.get('rate_limit_delay', 2.0),
+                timeout=scraper_config.get('timeout', 30.0),
+                http_client=self._http
+            )
+
+        # CrossRef client for the research agent, created by _init_agents
+        self.crossref = None
 
         # Initialize alert service
         alert_config = self.settings.get_alert_config() if self.settings else {}
@@ -143,7 +222,8 @@ class AgentScheduler:
             telegram_bot_token=alert_config.get('telegram_bot_token'),
             telegram_chat_id=alert_config.get('telegram_chat_id'),
             slack_webhook_url=alert_config.get('slack_webhook_url'),
-            min_severity=AlertSeverity.WARNING
+            min_severity=AlertSeverity.WARNING,
+            http_client=self._http
         )
         
         # Agent configurations from settings or defaults
@@ -191,16 +271,49 @@ class AgentScheduler:
                 'prompt_engineering': AgentConfig(enabled=True, interval_seconds=86400),  # Daily
             }
         
-        # Initialize agents
-        self.agents: Dict[str, Any] = {}
-        self._init_agents()
+        # Initialize agents. Internal loops walk the fixed-order tuples;
+        # `agents` is a read-only name -> agent view for callers.
+        agents = self._init_agents() if load_agents else {}
+        self._agent_names: Tuple[str, ...] = tuple(agents)
+        self._agent_objs: Tuple[Any, ...] = tuple(agents.values())
+        self.agents: Mapping[str, Any] = MappingProxyType(agents)
         
         # Control flags
         self.running = False
         self.tasks: list = []
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stop_task: Optional[asyncio.Task] = None
+        # Agents whose enabled/interval changed; the driver re-slots them
+        self._rescheduled: Set[str] = set()
+        self._config_changed = asyncio.Event()
+        
+        # Status shape is built once; get_status() only refreshes values
+        self._status_template: Dict[str, Any] = {
+            'running': False,
+            'agents': {
+                name: {
+                    'enabled': self.configs[name].enabled,
+                    'interval': self.configs[name].interval_seconds,
+                    'stats': None
+                }
+                for name in self.configs
+            },
+            'llm': None,
+            'alert_service': None,
+            'scraper_enabled': scraper_enabled
+        }
+        # Per-agent status entries, aligned with _agent_objs
+        self._agent_status: Tuple[Dict[str, Any], ...] = tuple(
+            self._status_template['agents'][name] for name in self._agent_names
+        )
     
-    def _init_agents(self):
-        """Initialize all agents."""
+    def _init_agents(self) -> Dict[str, Any]:
+        """
+        Initialize all agents.
+        
+        Returns:
+            Dictionary of agent name to agent instance, in scheduling order
+        """
         batch_sizes = self.settings.get_agent_batch_sizes() if self.settings else {
             'research': 20,
             'extraction': 5,
@@ -209,43 +322,58 @@ class AgentScheduler:
             'conflict': 10
         }
         
-        self.agents['research'] = ResearchAgent(
+        agents: Dict[str, Any] = {}
+        
+        from services.crossref_service import CrossRefService
+        
+        # Kept on the scheduler so aclose() can close its response cache
+        self.crossref = CrossRefService(
+            http_client=self._http,
+            requests_per_second=self.settings.crossref_rate_limit if self.settings else 10.0,
+            cache_path=self.settings.crossref_cache_path if self.settings else None,
+            cache_ttl=self.settings.crossref_cache_ttl if self.settings else 86400.0
+        )
+        
+        agents['research'] = _load_agent_class('research')(
             supabase=self.supabase,
+            crossref_service=self.crossref,
             fitness_scraper=self.fitness_scraper,
             days_back=7,
             max_results_per_source=batch_sizes.get('research', 20),
             enable_web_scraping=self.fitness_scraper is not None
         )
         
-        self.agents['extraction'] = ExtractionAgent(
+        agents['extraction'] = _load_agent_class('extraction')(
             supabase=self.supabase,
             llm_service=self.llm,
             batch_size=self.configs['extraction'].batch_size
         )
         
-        self.agents['validation'] = ValidationAgent(
+        agents['validation'] = _load_agent_class('validation')(
             supabase=self.supabase,
             llm_service=self.llm,
             batch_size=self.configs['validation'].batch_size
         )
         
-        self.agents['kb'] = KnowledgeBaseAgent(
+        agents['kb'] = _load_agent_class('kb')(
             supabase=self.supabase,
             llm_service=self.llm,
             batch_size=self.configs['kb'].batch_size
         )
         
-        self.agents['conflict'] = ConflictAgent(
+        agents['conflict'] = _load_agent_class('conflict')(
             supabase=self.supabase,
             llm_service=self.llm,
             batch_size=self.configs['conflict'].batch_size
         )
         
-        self.agents['prompt_engineering'] = PromptEngineeringAgent(
+        agents['prompt_engineering'] = _load_agent_class('prompt_engineering')(
             supabase=self.supabase,
             llm_service=self.llm,
-            categories=['strength_training', 'hypertrophy', 'nutrition', 'recovery', 'cardio', 'general']
+            categories=PROMPT_CATEGORIES
         )
+        
+        return agents
     
     def configure_agent(self, name: str, **kwargs):
         """
@@ -255,66 +383,185 @@ class AgentScheduler:
             name: Agent name
             **kwargs: Configuration options (enabled, interval_seconds, batch_size)
         """
-        if name in self.configs:
-            for key, value in kwargs.items():
-                if hasattr(self.configs[name], key):
-                    setattr(self.configs[name], key, value)
-                    self.logger.info(f"Configured {name}: {key}={value}")
-    
-    async def _run_agent(self, name: str, agent: Any, config: AgentConfig):
-        """Run a single agent with its configuration."""
-        if not config.enabled:
-            self.logger.info(f"Agent {name} is disabled")
+        config = self.configs.get(name)
+        if config is None:
             return
-        
-        self.logger.info(
-            f"Starting agent {name} with interval {config.interval_seconds}s"
-        )
-        
+        status = self._status_template['agents'][name]
+        for key, value in kwargs.items():
+            if key in _AGENT_CONFIG_FIELDS:
+                setattr(config, key, value)
+                status_key = _STATUS_FIELDS.get(key)
+                if status_key is not None:
+                    status[status_key] = value
+                if key in ('enabled', 'interval_seconds'):
+                    self._rescheduled.add(name)
+                    self._config_changed.set()
+                self.logger.info("Configured %s: %s=%s", name, key, value)
+    
+    async def _run_agent(self, name: str, agent: Any):
+        """Run a single iteration of an agent."""
         try:
-            await agent.run(interval_seconds=config.interval_seconds)
+            await agent.run_iteration()
         except asyncio.CancelledError:
-            self.logger.info(f"Agent {name} cancelled")
+            self.logger.info("Agent %s cancelled", name)
             raise
         except Exception as e:
-            self.logger.error(f"Agent {name} error: {e}")
+            self.logger.error("Agent %s error: %s", name, e)
+    
+    async def _drive_agents(self):
+        """
+        Drive all agents from a single timer.
+        
+        Due times are kept in a heap of (next_run, agent index) so one sleep
+        covers every agent. Every agent keeps a slot, and enabled is checked
+        when the slot comes up, so agents can be enabled later. An agent whose
+        previous iteration is still running is not started again; it simply
+        moves on to its next slot. configure_agent() wakes the driver so
+        enabled/interval changes are re-slotted immediately.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        indexes = {name: index for index, name in enumerate(self._agent_names)}
+        last_run: Dict[int, float] = {}
+        heap = []
+        for index, name in enumerate(self._agent_names):
+            if not self.configs[name].enabled:
+                self.logger.info("Agent %s is disabled", name)
+            heap.append((now, index))
+        heapq.heapify(heap)
+        
+        try:
+            while self.running and heap:
+                if self._rescheduled:
+                    changed = {indexes[name] for name in self._rescheduled if name in indexes}
+                    self._rescheduled.clear()
+                    now = loop.time()
+                    heap = [entry for entry in heap if entry[1] not in changed]
+                    for index in changed:
+                        interval = self.configs[self._agent_names[index]].interval_seconds
+                        previous_run = last_run.get(index)
+                        due = now if previous_run is None else max(now, previous_run + interval)
+                        heap.append((due, index))
+                    heapq.heapify(heap)
+                
+                due, index = heap[0]
+                delay = due - loop.time()
+                if delay > 0:
+                    self._config_changed.clear()
+                    try:
+                        await asyncio.wait_for(self._config_changed.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                
+                heapq.heappop(heap)
+                name = self._agent_names[index]
+                agent = self._agent_objs[index]
+                config = self.configs[name]
+                previous = self._inflight.get(name)
+                if config.enabled and (previous is None or previous.done()):
+                    if not agent.is_running:
+                        self.logger.info(
+                            "Starting agent %s with interval %ss", name, config.interval_seconds
+                        )
+                        agent.is_running = True
+                    last_run[index] = due
+                    self._inflight[name] = asyncio.create_task(
+                        self._run_agent(name, agent),
+                        name=f"agent_{name}"
+                    )
+                
+                # Skip slots missed while the loop was busy instead of bursting
+                next_due = due + config.interval_seconds
+                now = loop.time()
+                if next_due <= now:
+                    next_due = now + config.interval_seconds
+                heapq.heappush(heap, (next_due, index))
+        
+        finally:
+            await self._close_agents()
+    
+    async def _close_agents(self):
+        """Cancel in-flight iterations and run each agent's shutdown hooks."""
+        inflight = list(self._inflight.values())
+        for task in inflight:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        self._inflight.clear()
+        
+        await asyncio.gather(
+            *(agent.close() for agent in self.agents.values() if agent.is_running),
+            return_exceptions=True
+        )
     
     async def start(self):
         """Start all agents."""
         self.logger.info("Starting Agent Scheduler...")
         self.running = True
         
-        # Setup signal handlers
-        loop = asyncio.get_event_loop()
+        # Setup signal handlers before any task exists, so an early signal
+        # can't miss tasks it should cancel
+        loop = asyncio.get_running_loop()
+        handled_signals = []
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, self.stop)
+            try:
+                loop.add_signal_handler(sig, self.stop)
+                handled_signals.append(sig)
+            except NotImplementedError:
+                # Not supported by the Windows event loops
+                pass
         
-        # Create tasks for each agent
-        self.tasks = []
-        for name, agent in self.agents.items():
-            config = self.configs[name]
-            task = asyncio.create_task(
-                self._run_agent(name, agent, config),
-                name=f"agent_{name}"
-            )
-            self.tasks.append(task)
+        driver = asyncio.create_task(self._drive_agents(), name="agent_driver")
+        self.tasks = [driver]
         
-        # Wait for all tasks
         try:
-            await asyncio.gather(*self.tasks, return_exceptions=True)
+            await driver
         except asyncio.CancelledError:
             self.logger.info("Scheduler cancelled")
-        
+        finally:
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+
+        # A stop() (e.g. from a signal) cancels the driver; wait for it to
+        # finish the alert, aclose() and log flush before returning, or the
+        # runner would cancel it as a leftover task
+        if self._stop_task is not None:
+            await asyncio.shield(self._stop_task)
+
         self.logger.info("Agent Scheduler stopped")
     
-    def stop(self, reason: Optional[str] = None):
-        """Stop all agents gracefully."""
+    def stop(self, reason: Optional[str] = None) -> asyncio.Task:
+        """
+        Schedule a graceful stop (safe to call from signal handlers).
+        
+        Args:
+            reason: Optional reason included in the stop alert
+            
+        Returns:
+            Task running stop_async(); repeated calls return the same task
+        """
+        if self._stop_task is None:
+            self._stop_task = asyncio.get_running_loop().create_task(
+                self.stop_async(reason), name="scheduler_stop"
+            )
+        return self._stop_task
+    
+    async def stop_async(self, reason: Optional[str] = None):
+        """
+        Stop all agents gracefully and release shared resources.
+        
+        Args:
+            reason: Optional reason included in the stop alert
+        """
         self.logger.info("Stopping Agent Scheduler...")
         self.running = False
 
-        # Send alert if alert service is configured
+        # Send alert if alert service is configured; it runs alongside the
+        # agent shutdown and is shielded so cancelling the stop can't drop it
+        alert_task = None
         if self.alert_service.is_configured():
-            asyncio.create_task(
+            alert_task = asyncio.create_task(
                 self.alert_service.alert_scheduler_stopped(reason)
             )
 
@@ -322,14 +569,49 @@ class AgentScheduler:
         for name, agent in self.agents.items():
             try:
                 agent.stop()
-                self.logger.info(f"Stopped agent {name}")
+                self.logger.info("Stopped agent %s", name)
             except Exception as e:
-                self.logger.error(f"Error stopping agent {name}: {e}")
+                self.logger.error("Error stopping agent %s: %s", name, e)
 
-        # Cancel all tasks
+        # Cancel the driver; it cancels in-flight iterations and closes
+        # agents on its way out
         for task in self.tasks:
             if not task.done():
                 task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+        if alert_task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(alert_task), timeout=5)
+            except asyncio.TimeoutError:
+                alert_task.cancel()
+                self.logger.warning("Timed out sending scheduler stopped alert")
+            except Exception as e:
+                self.logger.error("Error sending scheduler stopped alert: %s", e)
+
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the HTTP client shared by all services and flush logging."""
+        await self.alert_service.aclose()
+        await self.supabase.aclose()
+        if self.fitness_scraper is not None:
+            await self.fitness_scraper.aclose()
+        if self.crossref is not None:
+            await self.crossref.aclose()
+        await self._http.aclose()
+        self._stop_log_listener()
+
+    def _stop_log_listener(self):
+        """Drain queued log records and go back to writing them directly."""
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._log_queue_handler)
+        for handler in self._log_listener.handlers:
+            root_logger.addHandler(handler)
+        self._log_listener = None
     
     async def run_once(self, agent_name: Optional[str] = None):
         """
@@ -342,37 +624,55 @@ class AgentScheduler:
             if agent_name not in self.agents:
                 raise ValueError(f"Unknown agent: {agent_name}")
             
-            self.logger.info(f"Running agent {agent_name} once...")
+            self.logger.info("Running agent %s once...", agent_name)
             result = await self.agents[agent_name].process()
-            self.logger.info(f"Result: {result}")
+            self.logger.info("Result: %s", result)
             return result
-        else:
-            results = {}
-            for name, agent in self.agents.items():
-                if self.configs[name].enabled:
-                    self.logger.info(f"Running agent {name} once...")
-                    try:
-                        results[name] = await agent.process()
-                    except Exception as e:
-                        self.logger.error(f"Error running {name}: {e}")
-                        results[name] = {'error': str(e)}
-            return results
+        
+        # Agents are independent, so run them concurrently; LLM calls stay
+        # bounded by the shared concurrency limit
+        names = [name for name in self.agents if self.configs[name].enabled]
+        outcomes = await asyncio.gather(*(
+            self._process_once(name, self.agents[name]) for name in names
+        ))
+        return dict(zip(names, outcomes))
+    
+    async def _process_once(self, name: str, agent: Any) -> Any:
+        """Run one agent's process() with a timeout, returning errors as a dict."""
+        timeout = self.settings.run_once_timeout if self.settings else 600.0
+        self.logger.info("Running agent %s once...", name)
+        try:
+            return await asyncio.wait_for(agent.process(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.logger.error("Timed out running %s after %ss", name, timeout)
+            return {'error': f'Timed out after {timeout}s'}
+        except Exception as e:
+            self.logger.error("Error running %s: %s", name, e)
+            return {'error': str(e)}
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current status of all agents."""
-        return {
-            'running': self.running,
-            'agents': {
-                name: {
-                    'enabled': self.configs[name].enabled,
-                    'interval': self.configs[name].interval_seconds,
-                    'stats': agent.get_stats()
-                }
-                for name, agent in self.agents.items()
-            },
-            'alert_service': self.alert_service.get_status() if self.alert_service else None,
-            'scraper_enabled': self.fitness_scraper is not None
-        }
+        """
+        Get current status of all agents.
+        
+        The same dictionary is refreshed in place and returned on every
+        call; copy it if a snapshot is needed.
+        """
+        status = self._status_template
+        status['running'] = self.running
+        for entry, agent in zip(self._agent_status, self._agent_objs):
+            entry['stats'] = agent.get_stats()
+        status['llm'] = self.llm.get_status() if self.llm else None
+        status['alert_service'] = self.alert_service.get_status() if self.alert_service else None
+        return status
+
+    def status_json(self) -> bytes:
+        """
+        Serialize get_status() to JSON bytes with orjson.
+        
+        Values orjson can't encode natively are written with str(), and
+        non-string dict keys (e.g. in agent stats) are written as strings.
+        """
+        return orjson.dumps(self.get_status(), default=str, option=orjson.OPT_NON_STR_KEYS)
 
     async def check_error_rates(self) -> None:
         """Check error rates and send alerts if needed."""
@@ -381,19 +681,26 @@ class AgentScheduler:
 
         threshold = self.settings.alert_error_rate_threshold if self.settings else 0.5
 
-        for name, agent in self.agents.items():
-            stats = agent.get_stats()
-            total = stats.get('processed', 0)
-            errors = stats.get('errors', 0)
+        # Snapshot stats first, then send every alert concurrently
+        stats = [agent.get_stats() for agent in self._agent_objs]
+        alerts = []
+        for name, agent_stats in zip(self._agent_names, stats):
+            total = agent_stats.get('processed_count', 0)
+            errors = agent_stats.get('error_count', 0)
 
             if total > 0:
                 error_rate = errors / total
                 if error_rate > threshold:
-                    await self.alert_service.alert_high_error_rate(
+                    alerts.append(self.alert_service.alert_high_error_rate(
                         error_rate=error_rate,
                         threshold=threshold,
                         agent_name=name
-                    )
+                    ))
+
+        results = await asyncio.gather(*alerts, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("Error sending error rate alert: %s", result)
 
 
 async def main():
@@ -408,29 +715,33 @@ async def main():
         print(f"Error loading configuration: {e}")
         sys.exit(1)
     
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    
+    if command == 'status':
+        # Print configured status without importing or building agents
+        scheduler = AgentScheduler(settings=settings, load_agents=False)
+        print(scheduler.status_json().decode())
+        await scheduler.aclose()
+        return
+    
     # Create scheduler with settings
     scheduler = AgentScheduler(settings=settings)
     
-    # Check for command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        
-        if command == 'once':
-            # Run once and exit
-            agent_name = sys.argv[2] if len(sys.argv) > 2 else None
+    if command == 'once':
+        # Run once and exit
+        agent_name = sys.argv[2] if len(sys.argv) > 2 else None
+        try:
             results = await scheduler.run_once(agent_name)
-            print(results)
-            return
-        
-        elif command == 'status':
-            # Print status
-            status = scheduler.get_status()
-            print(status)
-            return
+        finally:
+            await scheduler.aclose()
+        print(results)
+        return
     
     # Start scheduler
     await scheduler.start()
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
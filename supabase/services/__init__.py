@@ -2,19 +2,47 @@
 Services for the Agent Swarm Knowledge System.
 """
 
+import importlib
+from typing import Any
+
 from .supabase_client import SupabaseClient
-from .pubmed_service import PubMedService
-from .crossref_service import CrossRefService
-from .rss_service import RSSService
-from .llm_service import LLMService
-from .fitness_scraper_service import FitnessScraperService, ScrapedArticle
+
+# Other services are imported lazily (PEP 562) so importing the Supabase
+# client doesn't load the LLM, feed and scraping stacks as well
+_LAZY_EXPORTS = {
+    'PubMedService': '.pubmed_service',
+    'CrossRefService': '.crossref_service',
+    'SQLiteResponseCache': '.crossref_cache',
+    'RSSService': '.rss_service',
+    'LLMService': '.llm_service',
+    'ConcurrencyLimitedLLM': '.llm_service',
+    'CachedLLMService': '.llm_cache',
+    'InMemoryLRU': '.llm_cache',
+    'FitnessScraperService': '.fitness_scraper_service',
+    'ScrapedArticle': '.fitness_scraper_service',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported service classes on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'SupabaseClient',
     'PubMedService',
     'CrossRefService',
+    'SQLiteResponseCache',
     'RSSService',
     'LLMService',
+    'ConcurrencyLimitedLLM',
+    'CachedLLMService',
+    'InMemoryLRU',
     'FitnessScraperService',
     'ScrapedArticle',
-]
\ No newline at end of file
+]
@@ -0,0 +1,113 @@
+"""
+Persistent response cache for CrossRef lookups.
+
+Works and journal records change rarely, and the research agent asks for
+the same DOIs and queries run after run, so JSON responses are kept in a
+local SQLite file keyed by URL and query parameters. Expired entries keep
+their ETag so they can be revalidated with a conditional request instead
+of being downloaded again.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+import sqlite3
+import time
+
+import orjson
+
+
+def response_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Build a cache key from a request URL and its query parameters.
+
+    Args:
+        url: Request URL
+        params: Query parameters (order does not matter)
+
+    Returns:
+        URL with the sorted, encoded parameters appended
+    """
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+class SQLiteResponseCache:
+    """SQLite-backed store of JSON responses with a TTL and ETag."""
+
+    def __init__(self, path: str = ':memory:', ttl: float = 86400.0):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (':memory:' keeps it in-process)
+            ttl: Seconds a stored response is served without revalidation
+        """
+        self.path = path
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+            "etag TEXT, body BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[str], bool]:
+        """
+        Look up a stored response.
+
+        Args:
+            key: Cache key from response_key()
+
+        Returns:
+            Tuple of (body, etag, fresh); body is None if nothing is stored
+        """
+        row = self._conn.execute(
+            "SELECT expires_at, etag, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None, None, False
+        expires_at, etag, body = row
+        return orjson.loads(body), etag, expires_at > time.time()
+
+    def set(self, key: str, body: Dict[str, Any], etag: Optional[str] = None) -> None:
+        """
+        Store a response, replacing any previous entry.
+
+        Args:
+            key: Cache key from response_key()
+            body: Decoded JSON response
+            etag: ETag header of the response, if any
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, expires_at, etag, body) "
+            "VALUES (?, ?, ?, ?)",
+            (key, time.time() + self.ttl, etag, orjson.dumps(body))
+        )
+        self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """
+        Mark a stored response as fresh again after a 304 revalidation.
+
+        Args:
+            key: Cache key from response_key()
+        """
+        self._conn.execute(
+            "UPDATE responses SET expires_at = ? WHERE key = ?",
+            (time.time() + self.ttl, key)
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
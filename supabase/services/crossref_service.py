@@ -2,28 +2,33 @@
 CrossRef REST API Service for Research Agent.
 
 Features:
-- Retry logic with exponential backoff
+- Retry logic with jittered exponential backoff
 - Circuit breaker pattern for resilience
-- Rate limiting handling (429 errors)
+- Proactive token-bucket rate limiting, plus 429 handling
 - Improved date parsing with validation
 """
 
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime, date
+import asyncio
 import httpx
 import logging
 
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log,
+    RetryCallState,
     RetryError
 )
 from pybreaker import CircuitBreaker
 
+from utils.rate_limiter import RateLimiter
+from .crossref_cache import SQLiteResponseCache, response_key
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,35 @@ logger = logging.getLogger(__name__)
 # After 5 failures, circuit opens for 60 seconds
 crossref_breaker = CircuitBreaker(fail_max=5, reset_timeout=60)
 
+# Longest Retry-After we are willing to sleep for before retrying
+MAX_RETRY_AFTER = 60.0
+
+
+class RateLimited(httpx.HTTPStatusError):
+    """429 response carrying the delay requested by the server."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        request: httpx.Request,
+        response: httpx.Response,
+        retry_after: float
+    ):
+        super().__init__(message, request=request, response=response)
+        self.retry_after = retry_after
+
+
+_backoff = wait_random_exponential(multiplier=1, min=2, max=10)
+
+
+def _compute_wait(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After on 429s, jittered backoff otherwise."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimited):
+        return exc.retry_after
+    return _backoff(retry_state)
+
 
 @dataclass
 class CrossRefWork:
@@ -51,6 +85,7 @@ class CrossRefService:
     """Service for interacting with CrossRef REST API with resilience patterns."""
     
     BASE_URL = "https://api.crossref.org"
+    PROJECT_URL = "https://github.com/Ageree/workout-tracker-app"
     
     # Fitness and exercise science related query terms
     DEFAULT_QUERIES = [
@@ -68,39 +103,84 @@ class CrossRefService:
         "weightlifting"
     ]
     
-    def __init__(self, mailto: Optional[str] = None):
+    def __init__(
+        self,
+        mailto: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = 5,
+        requests_per_second: float = 50.0,
+        cache_path: Optional[str] = None,
+        cache_ttl: float = 86400.0,
+        project_url: Optional[str] = None
+    ):
         """
         Initialize CrossRef service.
         
         Args:
             mailto: Email address for polite pool (recommended)
+            http_client: Shared HTTP client to use; one is created (and owned)
+                on first use if not given
+            max_concurrency: Maximum number of queries in flight at once
+            requests_per_second: Request rate kept below CrossRef's limit
+            cache_path: SQLite file for cached responses (no caching if None)
+            cache_ttl: Seconds a cached response is used before revalidation
+            project_url: URL identifying this client in the User-Agent
+                (defaults to PROJECT_URL)
         """
         self.mailto = mailto
+        # CrossRef etiquette: identify the client (and contact address, for
+        # the polite pool) in the User-Agent rather than a mailto parameter
+        project_url = project_url or self.PROJECT_URL
+        contact = f'{project_url}; mailto:{mailto}' if mailto else project_url
         self.headers = {
-            'User-Agent': 'FitnessAI-KnowledgeBot/1.0'
+            'User-Agent': f'FitnessAI-KnowledgeBot/1.0 ({contact})'
         }
-        if mailto:
-            self.headers['User-Agent'] += f' (mailto:{mailto})'
         
         self.logger = logging.getLogger(__name__)
+        
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._limiter = RateLimiter(requests_per_second)
+        self.cache = SQLiteResponseCache(cache_path, cache_ttl) if cache_path else None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it if needed."""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+                http2=True,
+                timeout=30.0
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the response cache and the HTTP client if this instance created it."""
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=_compute_wait,
         retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException)),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     async def _make_request(
         self,
-        client: httpx.AsyncClient,
         url: str,
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request with retry logic and rate limit handling.
         
+        Fresh cached responses are returned without a request; stale ones
+        are revalidated with If-None-Match when an ETag was stored.
+        
         Args:
-            client: HTTPX async client
             url: Request URL
             params: Query parameters
             
@@ -110,23 +190,41 @@ class CrossRefService:
         Raises:
             httpx.HTTPStatusError: On non-retryable HTTP errors
         """
-        response = await client.get(
-            url,
-            headers=self.headers,
-            params=params,
-            timeout=30.0
-        )
+        key = response_key(url, params)
+        cached, etag = None, None
+        if self.cache is not None:
+            cached, etag, fresh = self.cache.get(key)
+            if fresh:
+                return cached
+        
+        headers = self.headers
+        if etag:
+            headers = {**headers, 'If-None-Match': etag}
+        
+        # Throttle up front so bursts don't end in 429s and retry backoff
+        async with self._limiter:
+            response = await self._get_client().get(
+                url,
+                headers=headers,
+                params=params,
+                timeout=30.0
+            )
+        
+        if response.status_code == 304 and cached is not None:
+            self.cache.touch(key)
+            return cached
         
         # Handle rate limiting (429)
         if response.status_code == 429:
             retry_after = response.headers.get('retry-after', '10')
-            wait_time = int(retry_after) if retry_after.isdigit() else 10
+            wait_time = min(int(retry_after) if retry_after.isdigit() else 10, MAX_RETRY_AFTER)
             self.logger.warning(f"Rate limited by CrossRef. Waiting {wait_time}s")
-            # Raise exception to trigger retry
-            raise httpx.HTTPStatusError(
+            # Raise exception to trigger retry after the requested delay
+            raise RateLimited(
                 f"Rate limited: {response.status_code}",
                 request=response.request,
-                response=response
+                response=response,
+                retry_after=wait_time
             )
         
         # Handle server errors (5xx) - these will trigger retry
@@ -139,7 +237,10 @@ class CrossRefService:
             )
         
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        if self.cache is not None:
+            self.cache.set(key, data, response.headers.get('etag'))
+        return data
     
     @crossref_breaker
     async def search_works(
@@ -181,11 +282,7 @@ class CrossRefService:
         if filter_params:
             params['filter'] = ','.join([f"{k}:{v}" for k, v in filter_params.items()])
         
-        if self.mailto:
-            params['mailto'] = self.mailto
-        
-        async with httpx.AsyncClient() as client:
-            return await self._make_request(client, url, params)
+        return await self._make_request(url, params)
     
     async def search_recent(
         self,
@@ -211,35 +308,39 @@ class CrossRefService:
             'type': 'journal-article'
         }
         
-        all_works = []
-        seen_dois = set()
+        results_per_query = min(20, max_results // len(self.DEFAULT_QUERIES))
         
-        for query in self.DEFAULT_QUERIES:
-            try:
-                results_per_query = min(20, max_results // len(self.DEFAULT_QUERIES))
-                
-                data = await self.search_works(
+        async def _run(query: str) -> Dict[str, Any]:
+            async with self._sem:
+                return await self.search_works(
                     query=query,
                     filter_params=filter_params,
                     sort='published',
                     order='desc',
                     rows=results_per_query
                 )
-                
-                items = data.get('message', {}).get('items', [])
-                
-                for item in items:
-                    work = self._parse_work(item)
-                    if work and work.doi not in seen_dois:
-                        seen_dois.add(work.doi)
-                        all_works.append(work)
-                
-            except RetryError as e:
-                self.logger.error(f"Retry failed for query '{query}': {e}")
+        
+        results = await asyncio.gather(
+            *[_run(query) for query in self.DEFAULT_QUERIES],
+            return_exceptions=True
+        )
+        
+        all_works = []
+        seen_dois = set()
+        
+        for query, data in zip(self.DEFAULT_QUERIES, results):
+            if isinstance(data, RetryError):
+                self.logger.error(f"Retry failed for query '{query}': {data}")
                 continue
-            except Exception as e:
-                self.logger.error(f"Error searching CrossRef for '{query}': {e}")
+            if isinstance(data, BaseException):
+                self.logger.error(f"Error searching CrossRef for '{query}': {data}")
                 continue
+            
+            for item in data.get('message', {}).get('items', []):
+                work = self._parse_work(item)
+                if work and work.doi not in seen_dois:
+                    seen_dois.add(work.doi)
+                    all_works.append(work)
         
         return all_works[:max_results]
     
@@ -256,19 +357,14 @@ class CrossRefService:
         """
         url = f"{self.BASE_URL}/works/{doi}"
         
-        params = {}
-        if self.mailto:
-            params['mailto'] = self.mailto
-        
-        async with httpx.AsyncClient() as client:
-            try:
-                data = await self._make_request(client, url, params)
-                item = data.get('message', {})
-                return self._parse_work(item)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+        try:
+            data = await self._make_request(url)
+            item = data.get('message', {})
+            return self._parse_work(item)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
     
     def _parse_work(self, item: Dict[str, Any]) -> Optional[CrossRefWork]:
         """
@@ -400,17 +496,12 @@ class CrossRefService:
         """
         url = f"{self.BASE_URL}/journals/{issn}"
         
-        params = {}
-        if self.mailto:
-            params['mailto'] = self.mailto
-        
-        async with httpx.AsyncClient() as client:
-            try:
-                data = await self._make_request(client, url, params)
-                return data.get('message', {})
-            except Exception as e:
-                self.logger.error(f"Error fetching journal metrics for {issn}: {e}")
-                return None
+        try:
+            data = await self._make_request(url)
+            return data.get('message', {})
+        except Exception as e:
+            self.logger.error(f"Error fetching journal metrics for {issn}: {e}")
+            return None
     
     def get_circuit_breaker_status(self) -> Dict[str, Any]:
         """
@@ -2,28 +2,76 @@
 Fitness Website Scraper Service.
 
 Scrapes fitness websites that don't provide RSS feeds for articles and content.
-Uses BeautifulSoup for HTML parsing with rate limiting and retry logic.
+Uses BeautifulSoup (lxml parser) for HTML parsing with rate limiting and
+retry logic.
 """
 
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
-from datetime import datetime, date
+from datetime import date
+from urllib.parse import urljoin, urlparse
 import asyncio
+import functools
 import re
 import logging
+import time
 
 import httpx
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, FeatureNotFound
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log
 )
 
 logger = logging.getLogger(__name__)
 
+_MONTHS = {
+    name: number
+    for number, full in enumerate(
+        ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'),
+        start=1
+    )
+    for name in (full, full[:3])
+}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_MONTH_NAME = r'([a-z]+)'
+_NUMERIC_DMY = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+
+# Date formats commonly found on websites, tried in order. Each regex
+# replaces a strptime format, so a miss costs a failed match instead of
+# a raised ValueError; constructors raise ValueError for impossible dates.
+_DATE_PATTERNS = (
+    # January 15, 2024 / Jan 15, 2024
+    (re.compile(_MONTH_NAME + r'\s+(\d{1,2}),\s+(\d{4})', re.IGNORECASE),
+     lambda m: date(int(m[3]), _MONTHS[m[1].lower()], int(m[2]))),
+    # 2024-01-15
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'),
+     lambda m: date(int(m[1]), int(m[2]), int(m[3]))),
+    # 15/01/2024
+    (_NUMERIC_DMY, lambda m: date(int(m[3]), int(m[2]), int(m[1]))),
+    # 01/15/2024
+    (_NUMERIC_DMY, lambda m: date(int(m[3]), int(m[1]), int(m[2]))),
+    # 15 January 2024 / 15 Jan 2024
+    (re.compile(r'(\d{1,2})\s+' + _MONTH_NAME + r'\s+(\d{4})', re.IGNORECASE),
+     lambda m: date(int(m[3]), _MONTHS[m[2].lower()], int(m[1]))),
+    # 2024/01/15
+    (re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'),
+     lambda m: date(int(m[1]), int(m[2]), int(m[3]))),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once and reuse it for every page and element."""
+    return soupsieve.compile(selector)
+
 
 @dataclass
 class ScrapedArticle:
@@ -45,7 +93,7 @@ class FitnessScraperService:
     Features:
     - Configurable site definitions
     - Rate limiting per domain
-    - Retry logic with exponential backoff
+    - Retry logic with jittered exponential backoff
     - HTML parsing with BeautifulSoup
     - Content extraction and cleaning
     """
@@ -69,7 +117,8 @@ class FitnessScraperService:
         self,
         sites_config: Optional[Dict[str, Dict[str, Any]]] = None,
         rate_limit_delay: float = 2.0,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize the scraper service.
@@ -78,6 +127,8 @@ class FitnessScraperService:
             sites_config: Custom site configuration (optional, defaults to SITES)
             rate_limit_delay: Delay between requests to same domain (seconds)
             timeout: Request timeout (seconds)
+            http_client: Shared HTTP client to use; one is created (and owned)
+                on first use if not given
         """
         self.sites = sites_config or self.SITES
         self.rate_limit_delay = rate_limit_delay
@@ -90,24 +141,43 @@ class FitnessScraperService:
         # Track last request time per domain for rate limiting
         self._last_request: Dict[str, float] = {}
 
+        self._client = http_client
+        self._owns_client = http_client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it if needed."""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+                http2=True,
+                timeout=self.timeout
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def _rate_limit(self, domain: str) -> None:
         """Apply rate limiting for a domain."""
-        import time
-
         current_time = time.time()
         last_request = self._last_request.get(domain, 0)
-        elapsed = current_time - last_request
 
-        if elapsed < self.rate_limit_delay:
-            wait_time = self.rate_limit_delay - elapsed
+        # Reserve the slot before sleeping so concurrent requests to the
+        # same domain queue up behind each other instead of all firing at once
+        request_time = max(current_time, last_request + self.rate_limit_delay)
+        self._last_request[domain] = request_time
+
+        wait_time = request_time - current_time
+        if wait_time > 0:
             self.logger.debug(f"Rate limiting {domain}: waiting {wait_time:.2f}s")
             await asyncio.sleep(wait_time)
 
-        self._last_request[domain] = time.time()
-
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=wait_random_exponential(multiplier=1, min=2, max=10),
         retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException)),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
@@ -122,19 +192,17 @@ class FitnessScraperService:
             HTML content or None if failed
         """
         # Extract domain for rate limiting
-        from urllib.parse import urlparse
         domain = urlparse(url).netloc
         await self._rate_limit(domain)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout,
-                follow_redirects=True
-            )
-            response.raise_for_status()
-            return response.text
+        response = await self._get_client().get(
+            url,
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True
+        )
+        response.raise_for_status()
+        return response.text
 
     def _parse_date(self, date_str: str) -> Optional[date]:
         """
@@ -151,23 +219,13 @@ class FitnessScraperService:
 
         date_str = date_str.strip()
 
-        # Common date formats
-        formats = [
-            '%B %d, %Y',          # January 15, 2024
-            '%b %d, %Y',          # Jan 15, 2024
-            '%Y-%m-%d',           # 2024-01-15
-            '%d/%m/%Y',           # 15/01/2024
-            '%m/%d/%Y',           # 01/15/2024
-            '%d %B %Y',           # 15 January 2024
-            '%d %b %Y',           # 15 Jan 2024
-            '%Y/%m/%d',           # 2024/01/15
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt).date()
-            except ValueError:
-                continue
+        for pattern, build in _DATE_PATTERNS:
+            match = pattern.fullmatch(date_str)
+            if match:
+                try:
+                    return build(match)
+                except (KeyError, ValueError):
+                    continue
 
         # Try dateutil as fallback
         try:
@@ -183,11 +241,8 @@ class FitnessScraperService:
         if not text:
             return ""
 
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        return text
+        # Collapse runs of whitespace and trim the ends
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
     def _extract_articles_from_page(
         self,
@@ -207,15 +262,23 @@ class FitnessScraperService:
             List of ScrapedArticle objects
         """
         articles = []
-        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+        except FeatureNotFound:
+            soup = BeautifulSoup(html, 'html.parser')
+
+        title_selector = _compile_selector(site_config['title_selector'])
+        link_selector = _compile_selector(site_config['link_selector'])
+        description_selector = _compile_selector(site_config['description_selector'])
+        date_selector = _compile_selector(site_config['date_selector'])
 
         # Find all article elements
-        article_elements = soup.select(site_config['article_selector'])
+        article_elements = _compile_selector(site_config['article_selector']).select(soup)
 
         for elem in article_elements:
             try:
                 # Extract title
-                title_elem = elem.select_one(site_config['title_selector'])
+                title_elem = title_selector.select_one(elem)
                 if not title_elem:
                     continue
 
@@ -224,18 +287,17 @@ class FitnessScraperService:
                     continue
 
                 # Extract link
-                link_elem = elem.select_one(site_config['link_selector'])
+                link_elem = link_selector.select_one(elem)
                 link = ""
                 if link_elem:
                     link = link_elem.get('href', '')
                     # Handle relative URLs
                     if link and not link.startswith('http'):
-                        from urllib.parse import urljoin
                         link = urljoin(base_url, link)
 
                 # Extract description
                 description = None
-                desc_elem = elem.select_one(site_config['description_selector'])
+                desc_elem = description_selector.select_one(elem)
                 if desc_elem:
                     description = self._clean_text(desc_elem.get_text())
                     # Limit description length
@@ -244,7 +306,7 @@ class FitnessScraperService:
 
                 # Extract date
                 pub_date = None
-                date_elem = elem.select_one(site_config['date_selector'])
+                date_elem = date_selector.select_one(elem)
                 if date_elem:
                     date_text = date_elem.get_text() or date_elem.get('datetime', '')
                     pub_date = self._parse_date(self._clean_text(date_text))
@@ -320,13 +382,17 @@ class FitnessScraperService:
         sites_to_scrape = site_ids or list(self.sites.keys())
         all_articles = []
 
-        for site_id in sites_to_scrape:
-            try:
-                articles = await self.scrape_site(site_id)
-                all_articles.extend(articles)
-            except Exception as e:
-                self.logger.error(f"Error scraping site {site_id}: {e}")
+        # Rate limiting is per domain, so different sites can be fetched at once
+        results = await asyncio.gather(
+            *(self.scrape_site(site_id) for site_id in sites_to_scrape),
+            return_exceptions=True
+        )
+
+        for site_id, articles in zip(sites_to_scrape, results):
+            if isinstance(articles, BaseException):
+                self.logger.error(f"Error scraping site {site_id}: {articles}")
                 continue
+            all_articles.extend(articles)
 
         self.logger.info(f"Total articles scraped: {len(all_articles)}")
         return all_articles
@@ -364,19 +430,18 @@ class FitnessScraperService:
         site_config = self.sites[site_id]
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.head(
-                    site_config['base_url'],
-                    headers=self.headers,
-                    timeout=10.0,
-                    follow_redirects=True
-                )
+            response = await self._get_client().head(
+                site_config['base_url'],
+                headers=self.headers,
+                timeout=10.0,
+                follow_redirects=True
+            )
 
-                return {
-                    'available': response.status_code == 200,
-                    'status_code': response.status_code,
-                    'url': site_config['base_url']
-                }
+            return {
+                'available': response.status_code == 200,
+                'status_code': response.status_code,
+                'url': site_config['base_url']
+            }
 
         except Exception as e:
             return {
@@ -0,0 +1,167 @@
+"""
+Response cache for LLM calls.
+
+Agents re-send identical prompts across cycles (the same claim validated
+again, the same pair checked for conflicts), so completions and embeddings
+are cached in-process keyed by provider, model and request parameters.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+import hashlib
+import json
+import time
+
+from .llm_service import LLMServiceProxy
+
+V = TypeVar('V')
+
+
+def completion_key(*parts: Any) -> str:
+    """
+    Build a cache key from request parameters.
+
+    Args:
+        *parts: Provider, model, prompt, sampling parameters, ...
+
+    Returns:
+        Hex SHA-256 digest of the '|'-joined parts
+    """
+    return hashlib.sha256('|'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+class InMemoryLRU(Generic[V]):
+    """Size-bounded LRU mapping whose entries expire after a TTL."""
+
+    def __init__(self, max_size: int = 2048, ttl: float = 86400.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+            ttl: Entry lifetime in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, Tuple[float, V]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[V]:
+        """
+        Get a live entry and mark it most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+class CachedLLMService(LLMServiceProxy):
+    """
+    LLMService proxy that serves repeated requests from a cache.
+
+    Only usable provider responses are stored: failures raise out of
+    _call_llm, completions that don't parse as JSON (what every caller
+    expects) and empty embeddings are not cached, so the error fallbacks of
+    the public methods are recomputed on the next call.
+    """
+
+    def __init__(self, inner: Any, cache: Optional[InMemoryLRU] = None):
+        """
+        Initialize the proxy.
+
+        Args:
+            inner: Service (or proxy) that performs the actual calls
+            cache: Cache backend (defaults to a 2048-entry, 24h LRU)
+        """
+        super().__init__(inner)
+        self.cache = cache if cache is not None else InMemoryLRU()
+        self.hits = 0
+        self.misses = 0
+
+    def _is_parseable(self, response: str) -> bool:
+        """Check that a completion parses the way the public methods parse it."""
+        try:
+            json.loads(self._clean_json_response(response))
+        except ValueError:
+            return False
+        return True
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        value = self.cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def _call_llm(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000
+    ) -> str:
+        key = completion_key(
+            self.default_provider, self.model, prompt, temperature, max_tokens
+        )
+        response = self._lookup(key)
+        if response is None:
+            response = await self._inner._call_llm(prompt, temperature, max_tokens)
+            if self._is_parseable(response):
+                self.cache.set(key, response)
+        return response
+
+    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+        key = completion_key('embedding', text)
+        embedding = self._lookup(key)
+        if embedding is None:
+            embedding = await self._inner.generate_embedding(text)
+            if embedding is not None:
+                self.cache.set(key, embedding)
+        return embedding
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache size, hits, misses and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            **super().get_status(),
+            'cache_size': len(self.cache),
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_hit_rate': self.hits / lookups if lookups else 0.0,
+        }
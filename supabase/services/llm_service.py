@@ -3,8 +3,9 @@ LLM Service for Extraction and Validation Agents.
 Supports OpenAI GPT-4o, Anthropic Claude, and Kimi (Moonshot AI).
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Mapping, Sequence
 from dataclasses import dataclass
+import asyncio
 import json
 import httpx
 import os
@@ -427,7 +428,7 @@ Respond with JSON:
         study_design: str,
         sample_size: Optional[int],
         effect_size: Optional[str],
-        similar_claims: List[Dict[str, Any]]
+        similar_claims: Sequence[Mapping[str, Any]]
     ) -> Dict[str, Any]:
         """
         Validate a scientific claim.
@@ -582,4 +583,122 @@ Respond with JSON:
         elif provider == 'openai':
             self.model = 'gpt-4o'
         else:
-            self.model = 'claude-3-sonnet-20240229'
\ No newline at end of file
+            self.model = 'claude-3-sonnet-20240229'
+
+
+class LLMServiceProxy:
+    """
+    Base for wrappers that intercept the provider calls of an LLMService.
+    
+    The prompt-building methods below run against the proxy itself, so
+    their provider calls go through the proxy's _call_llm. Subclasses
+    override _call_llm and generate_embedding; anything else is forwarded
+    to the wrapped service. Proxies can be stacked.
+    """
+    
+    extract_claims = LLMService.extract_claims
+    validate_claim = LLMService.validate_claim
+    detect_conflict = LLMService.detect_conflict
+    
+    def __init__(self, inner: Any):
+        """
+        Initialize the proxy.
+        
+        Args:
+            inner: LLMService or another proxy to wrap
+        """
+        self._inner = inner
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+    
+    async def _call_llm(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000
+    ) -> str:
+        return await self._inner._call_llm(prompt, temperature, max_tokens)
+    
+    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+        return await self._inner.generate_embedding(text)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get status of this proxy and any proxies it wraps.
+        
+        Returns:
+            Status dictionary (empty for a bare LLMService)
+        """
+        if isinstance(self._inner, LLMServiceProxy):
+            return self._inner.get_status()
+        return {}
+
+
+class ConcurrencyLimitedLLM(LLMServiceProxy):
+    """
+    LLMService proxy that caps concurrent provider calls.
+    
+    All agents share one instance, so the semaphore bounds total in-flight
+    LLM requests. Waiters are served in arrival order. Only the network
+    call holds a slot; prompt building and JSON parsing do not.
+    """
+    
+    def __init__(self, inner: Any, max_concurrency: int = 4):
+        """
+        Initialize the proxy.
+        
+        Args:
+            inner: Service that performs the actual calls
+            max_concurrency: Maximum number of calls in flight at once
+        """
+        super().__init__(inner)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._active = 0
+        self._waiting = 0
+    
+    async def _acquire(self) -> None:
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._active += 1
+    
+    def _release(self) -> None:
+        self._active -= 1
+        self._semaphore.release()
+    
+    async def _call_llm(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000
+    ) -> str:
+        await self._acquire()
+        try:
+            return await self._inner._call_llm(prompt, temperature, max_tokens)
+        finally:
+            self._release()
+    
+    async def generate_embedding(self, text: str) -> Optional[List[float]]:
+        await self._acquire()
+        try:
+            return await self._inner.generate_embedding(text)
+        finally:
+            self._release()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get current admission state.
+        
+        Returns:
+            Dictionary with capacity, active calls and queue depth
+        """
+        return {
+            **super().get_status(),
+            'max_concurrency': self.max_concurrency,
+            'active': self._active,
+            'queue_depth': self._waiting,
+        }
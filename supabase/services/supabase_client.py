@@ -7,9 +7,10 @@ Features:
 - Proper type conversions
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Set, Tuple, TypedDict
 from dataclasses import dataclass
 from datetime import date
+import asyncio
 import httpx
 import logging
 
@@ -83,10 +84,127 @@ class PromptVersion:
     metadata: Dict[str, Any]
 
 
+class SimilarClaim(TypedDict):
+    """Row returned by the match_scientific_knowledge RPC."""
+    id: str
+    claim: str
+    category: str
+    evidence_level: int
+    confidence_score: float
+    source_title: Optional[str]
+    source_doi: Optional[str]
+    similarity: float
+
+
+def _in_filter(values: Sequence[Any]) -> str:
+    """Build a PostgREST in.(...) filter with each value double-quoted."""
+    quoted = (
+        '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for value in values
+    )
+    return f"in.({','.join(quoted)})"
+
+
+class BatchLoader:
+    """
+    Coalesces single-key row lookups into batched queries.
+    
+    Lookups on the same (table, column) made within a short window are
+    sent as one `column=in.(...)` request per max_batch_size keys, and
+    each caller gets back the rows matching its own key.
+    """
+    
+    def __init__(self, client: 'SupabaseClient', delay: float = 0.005, max_batch_size: int = 100):
+        """
+        Initialize the loader.
+        
+        Args:
+            client: Supabase client used to run the batched queries
+            delay: Seconds to wait for more lookups before querying
+            max_batch_size: Maximum keys per query
+        """
+        self.client = client
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Tuple[str, str], Dict[str, List[asyncio.Future]]] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+    
+    async def load(self, table: str, column: str, value: Any) -> List[Dict[str, Any]]:
+        """
+        Get the rows of table whose column equals value.
+        
+        Args:
+            table: Table name
+            column: Column to match
+            value: Value to match
+            
+        Returns:
+            List of matching rows
+        """
+        loop = asyncio.get_running_loop()
+        key = (table, column)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = {}
+            loop.call_later(self.delay, self._start_flush, key)
+        future = loop.create_future()
+        pending.setdefault(str(value), []).append(future)
+        return await future
+    
+    def _start_flush(self, key: Tuple[str, str]) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush(key))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, key: Tuple[str, str]) -> None:
+        """Run the batched queries for one (table, column) and resolve waiters."""
+        pending = self._pending.pop(key, {})
+        values = list(pending)
+        await asyncio.gather(*(
+            self._load_chunk(key, values[start:start + self.max_batch_size], pending)
+            for start in range(0, len(values), self.max_batch_size)
+        ))
+    
+    async def _load_chunk(
+        self,
+        key: Tuple[str, str],
+        chunk: List[str],
+        pending: Dict[str, List[asyncio.Future]]
+    ) -> None:
+        table, column = key
+        try:
+            rows = await self.client.get_rows_in(table, column, chunk)
+        except Exception as e:
+            for value in chunk:
+                for future in pending[value]:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        grouped: Dict[str, List[Dict[str, Any]]] = {value: [] for value in chunk}
+        for row in rows:
+            matches = grouped.get(str(row.get(column)))
+            if matches is not None:
+                matches.append(row)
+        for value in chunk:
+            for future in pending[value]:
+                if not future.done():
+                    future.set_result(grouped[value])
+
+
 class SupabaseClient:
     """Client for Supabase REST API with agent-specific operations."""
     
-    def __init__(self, url: str, service_key: str):
+    def __init__(self, url: str, service_key: str, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the client.
+        
+        Args:
+            url: Supabase project URL
+            service_key: Supabase service role key
+            http_client: Shared HTTP client to use; one is created (and owned)
+                on first use if not given
+        """
         self.url = url.rstrip('/')
         self.service_key = service_key
         self.headers = {
@@ -95,40 +213,105 @@ class SupabaseClient:
             'Content-Type': 'application/json',
             'Prefer': 'return=representation'
         }
+        self._client = http_client
+        self._owns_client = http_client is None
+        # Shared by all agents so concurrent lookups are coalesced
+        self.loader = BatchLoader(self)
     
-    # ==================== Research Queue Operations ====================
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it if needed."""
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = httpx.AsyncClient()
+        return self._client
     
-    async def get_pending_queue_items(self, limit: int = 10) -> List[ResearchQueueItem]:
-        """Fetch pending items from research queue."""
-        async with httpx.AsyncClient() as client:
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def get_rows_in(
+        self,
+        table: str,
+        column: str,
+        values: Sequence[Any],
+        select: str = '*',
+        order: str = 'id',
+        page_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all rows of table whose column is one of values.
+        
+        PostgREST silently truncates responses at the server's max-rows
+        setting, so rows are read in pages of page_size until a short page
+        comes back. page_size must not exceed max-rows (1000 on Supabase).
+        
+        Args:
+            table: Table name
+            column: Column to match
+            values: Values to match
+            select: PostgREST select expression
+            order: Unique ordering that keeps pages stable
+            page_size: Rows requested per page
+            
+        Returns:
+            List of matching rows
+        """
+        if not values:
+            return []
+        client = self._get_client()
+        rows: List[Dict[str, Any]] = []
+        while True:
             response = await client.get(
-                f"{self.url}/rest/v1/research_queue",
+                f"{self.url}/rest/v1/{table}",
                 headers=self.headers,
                 params={
-                    'status': 'eq.pending',
-                    'order': 'priority.desc,created_at.asc',
-                    'limit': limit
+                    'select': select,
+                    column: _in_filter(values),
+                    'order': order,
+                    'limit': page_size,
+                    'offset': len(rows)
                 }
             )
             response.raise_for_status()
-            data = response.json()
-            
-            return [
-                ResearchQueueItem(
-                    id=item['id'],
-                    title=item['title'],
-                    authors=item.get('authors', []),
-                    abstract=item.get('abstract'),
-                    doi=item.get('doi'),
-                    url=item.get('url'),
-                    publication_date=item.get('publication_date'),
-                    source_type=item['source_type'],
-                    status=item['status'],
-                    priority=item.get('priority', 5),
-                    raw_data=item.get('raw_data', {})
-                )
-                for item in data
-            ]
+            page = response.json()
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+    
+    # ==================== Research Queue Operations ====================
+    
+    async def get_pending_queue_items(self, limit: int = 10) -> List[ResearchQueueItem]:
+        """Fetch pending items from research queue."""
+        client = self._get_client()
+        response = await client.get(
+            f"{self.url}/rest/v1/research_queue",
+            headers=self.headers,
+            params={
+                'status': 'eq.pending',
+                'order': 'priority.desc,created_at.asc',
+                'limit': limit
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        return [
+            ResearchQueueItem(
+                id=item['id'],
+                title=item['title'],
+                authors=item.get('authors', []),
+                abstract=item.get('abstract'),
+                doi=item.get('doi'),
+                url=item.get('url'),
+                publication_date=item.get('publication_date'),
+                source_type=item['source_type'],
+                status=item['status'],
+                priority=item.get('priority', 5),
+                raw_data=item.get('raw_data', {})
+            )
+            for item in data
+        ]
     
     async def update_queue_status(
         self, 
@@ -137,130 +320,130 @@ class SupabaseClient:
         error_message: Optional[str] = None
     ) -> bool:
         """Update the status of a queue item."""
-        async with httpx.AsyncClient() as client:
-            payload = {'status': status}
-            if error_message:
-                payload['error_message'] = error_message
-            if status in ['completed', 'rejected', 'failed']:
-                payload['processed_at'] = 'now()'
-            
-            response = await client.patch(
-                f"{self.url}/rest/v1/research_queue",
-                headers=self.headers,
-                params={'id': f'eq.{item_id}'},
-                json=payload
-            )
-            return response.status_code in [200, 204]
+        client = self._get_client()
+        payload = {'status': status}
+        if error_message:
+            payload['error_message'] = error_message
+        if status in ['completed', 'rejected', 'failed']:
+            payload['processed_at'] = 'now()'
+        
+        response = await client.patch(
+            f"{self.url}/rest/v1/research_queue",
+            headers=self.headers,
+            params={'id': f'eq.{item_id}'},
+            json=payload
+        )
+        return response.status_code in [200, 204]
     
     async def add_to_queue(self, item: ResearchQueueItem) -> Optional[str]:
         """Add a new item to the research queue."""
-        async with httpx.AsyncClient() as client:
-            # Use unified date formatting
-            pub_date = format_date_for_db(item.publication_date)
-            
-            payload = {
-                'title': item.title,
-                'authors': item.authors,
-                'abstract': item.abstract,
-                'doi': item.doi,
-                'url': item.url,
-                'publication_date': pub_date,
-                'source_type': item.source_type,
-                'status': 'pending',
-                'priority': item.priority,
-                'raw_data': item.raw_data
-            }
-            
-            response = await client.post(
-                f"{self.url}/rest/v1/research_queue",
-                headers=self.headers,
-                json=payload
-            )
-            
-            if response.status_code in [200, 201]:
-                data = response.json()
-                return data[0]['id'] if data else None
-            return None
+        client = self._get_client()
+        # Use unified date formatting
+        pub_date = format_date_for_db(item.publication_date)
+        
+        payload = {
+            'title': item.title,
+            'authors': item.authors,
+            'abstract': item.abstract,
+            'doi': item.doi,
+            'url': item.url,
+            'publication_date': pub_date,
+            'source_type': item.source_type,
+            'status': 'pending',
+            'priority': item.priority,
+            'raw_data': item.raw_data
+        }
+        
+        response = await client.post(
+            f"{self.url}/rest/v1/research_queue",
+            headers=self.headers,
+            json=payload
+        )
+        
+        if response.status_code in [200, 201]:
+            data = response.json()
+            return data[0]['id'] if data else None
+        return None
     
     # ==================== Scientific Knowledge Operations ====================
     
     async def get_claims_by_category(self, category: str, limit: int = 100) -> List[ScientificClaim]:
         """Fetch claims by category."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={
-                    'category': f'eq.{category}',
-                    'status': 'eq.active',
-                    'limit': limit
-                }
-            )
-            response.raise_for_status()
-            return [self._parse_claim(item) for item in response.json()]
+        client = self._get_client()
+        response = await client.get(
+            f"{self.url}/rest/v1/scientific_knowledge",
+            headers=self.headers,
+            params={
+                'category': f'eq.{category}',
+                'status': 'eq.active',
+                'limit': limit
+            }
+        )
+        response.raise_for_status()
+        return [self._parse_claim(item) for item in response.json()]
     
     async def get_all_active_claims(self, limit: int = 1000) -> List[ScientificClaim]:
         """Fetch all active claims."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={
-                    'status': 'eq.active',
-                    'limit': limit
-                }
-            )
-            response.raise_for_status()
-            return [self._parse_claim(item) for item in response.json()]
+        client = self._get_client()
+        response = await client.get(
+            f"{self.url}/rest/v1/scientific_knowledge",
+            headers=self.headers,
+            params={
+                'status': 'eq.active',
+                'limit': limit
+            }
+        )
+        response.raise_for_status()
+        return [self._parse_claim(item) for item in response.json()]
     
     async def insert_claim(self, claim: ScientificClaim) -> Optional[str]:
         """Insert a new scientific claim."""
-        async with httpx.AsyncClient() as client:
-            # Use unified date formatting
-            pub_date = format_date_for_db(claim.publication_date)
-            
-            payload = {
-                'claim': claim.claim,
-                'claim_summary': claim.claim_summary,
-                'category': claim.category,
-                'evidence_level': claim.evidence_level,
-                'confidence_score': claim.confidence_score,
-                'status': claim.status,
-                'source_doi': claim.source_doi,
-                'source_url': claim.source_url,
-                'source_title': claim.source_title,
-                'source_authors': claim.source_authors,
-                'publication_date': pub_date,
-                'sample_size': claim.sample_size,
-                'study_design': claim.study_design,
-                'population': claim.population,
-                'effect_size': claim.effect_size,
-                'key_findings': claim.key_findings,
-                'limitations': claim.limitations,
-                'conflicting_evidence': claim.conflicting_evidence
-            }
-            
-            response = await client.post(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                json=payload
-            )
-            
-            if response.status_code in [200, 201]:
-                data = response.json()
-                return data[0]['id'] if data else None
-            return None
+        client = self._get_client()
+        # Use unified date formatting
+        pub_date = format_date_for_db(claim.publication_date)
+        
+        payload = {
+            'claim': claim.claim,
+            'claim_summary': claim.claim_summary,
+            'category': claim.category,
+            'evidence_level': claim.evidence_level,
+            'confidence_score': claim.confidence_score,
+            'status': claim.status,
+            'source_doi': claim.source_doi,
+            'source_url': claim.source_url,
+            'source_title': claim.source_title,
+            'source_authors': claim.source_authors,
+            'publication_date': pub_date,
+            'sample_size': claim.sample_size,
+            'study_design': claim.study_design,
+            'population': claim.population,
+            'effect_size': claim.effect_size,
+            'key_findings': claim.key_findings,
+            'limitations': claim.limitations,
+            'conflicting_evidence': claim.conflicting_evidence
+        }
+        
+        response = await client.post(
+            f"{self.url}/rest/v1/scientific_knowledge",
+            headers=self.headers,
+            json=payload
+        )
+        
+        if response.status_code in [200, 201]:
+            data = response.json()
+            return data[0]['id'] if data else None
+        return None
     
     async def update_claim(self, claim_id: str, updates: Dict[str, Any]) -> bool:
         """Update a claim."""
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={'id': f'eq.{claim_id}'},
-                json=updates
-            )
-            return response.status_code in [200, 204]
+        client = self._get_client()
+        response = await client.patch(
+            f"{self.url}/rest/v1/scientific_knowledge",
+            headers=self.headers,
+            params={'id': f'eq.{claim_id}'},
+            json=updates
+        )
+        return response.status_code in [200, 204]
     
     async def find_similar_claims(
         self,
@@ -269,7 +452,7 @@ class SupabaseClient:
         limit: int = 5,
         category: Optional[str] = None,
         min_evidence_level: int = 1
-    ) -> List[Dict[str, Any]]:
+    ) -> List[SimilarClaim]:
         """
         Find claims with similar embeddings using pgvector.
         
@@ -283,20 +466,20 @@ class SupabaseClient:
         Returns:
             List of similar claims with similarity scores
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/match_scientific_knowledge",
-                headers=self.headers,
-                json={
-                    'query_embedding': embedding,
-                    'match_threshold': threshold,
-                    'match_count': limit,
-                    'filter_category': category,
-                    'min_evidence_level': min_evidence_level
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/match_scientific_knowledge",
+            headers=self.headers,
+            json={
+                'query_embedding': embedding,
+                'match_threshold': threshold,
+                'match_count': limit,
+                'filter_category': category,
+                'min_evidence_level': min_evidence_level
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def find_similar_claims_detailed(
         self,
@@ -319,20 +502,20 @@ class SupabaseClient:
         Returns:
             List of claims with detailed fields
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/match_scientific_knowledge_detailed",
-                headers=self.headers,
-                json={
-                    'query_embedding': embedding,
-                    'match_threshold': threshold,
-                    'match_count': limit,
-                    'filter_category': category,
-                    'min_evidence_level': min_evidence_level
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/match_scientific_knowledge_detailed",
+            headers=self.headers,
+            json={
+                'query_embedding': embedding,
+                'match_threshold': threshold,
+                'match_count': limit,
+                'filter_category': category,
+                'min_evidence_level': min_evidence_level
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def find_similar_to_claim(
         self,
@@ -351,18 +534,18 @@ class SupabaseClient:
         Returns:
             List of similar claims
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/find_similar_claims",
-                headers=self.headers,
-                json={
-                    'claim_id': claim_id,
-                    'match_threshold': threshold,
-                    'match_count': limit
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/find_similar_claims",
+            headers=self.headers,
+            json={
+                'claim_id': claim_id,
+                'match_threshold': threshold,
+                'match_count': limit
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     def _parse_claim(self, item: Dict[str, Any]) -> ScientificClaim:
         """Parse a claim from database response."""
@@ -395,83 +578,87 @@ class SupabaseClient:
     
     async def create_relationship(self, relationship: KnowledgeRelationship) -> Optional[str]:
         """Create a relationship between claims."""
-        async with httpx.AsyncClient() as client:
-            payload = {
-                'source_claim_id': relationship.source_claim_id,
-                'target_claim_id': relationship.target_claim_id,
-                'relationship_type': relationship.relationship_type,
-                'confidence': relationship.confidence,
-                'notes': relationship.notes
-            }
-            
-            response = await client.post(
-                f"{self.url}/rest/v1/knowledge_relationships",
-                headers=self.headers,
-                json=payload
-            )
-            
-            if response.status_code in [200, 201]:
-                data = response.json()
-                return data[0]['id'] if data else None
-            return None
+        client = self._get_client()
+        payload = {
+            'source_claim_id': relationship.source_claim_id,
+            'target_claim_id': relationship.target_claim_id,
+            'relationship_type': relationship.relationship_type,
+            'confidence': relationship.confidence,
+            'notes': relationship.notes
+        }
+        
+        response = await client.post(
+            f"{self.url}/rest/v1/knowledge_relationships",
+            headers=self.headers,
+            json=payload
+        )
+        
+        if response.status_code in [200, 201]:
+            data = response.json()
+            return data[0]['id'] if data else None
+        return None
     
     async def get_relationships_for_claim(self, claim_id: str) -> List[KnowledgeRelationship]:
-        """Get all relationships for a claim."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.url}/rest/v1/knowledge_relationships",
-                headers=self.headers,
-                params={
-                    'or': f'(source_claim_id.eq.{claim_id},target_claim_id.eq.{claim_id})'
-                }
-            )
-            response.raise_for_status()
-            
-            return [
-                KnowledgeRelationship(
-                    id=item['id'],
-                    source_claim_id=item['source_claim_id'],
-                    target_claim_id=item['target_claim_id'],
-                    relationship_type=item['relationship_type'],
-                    confidence=item['confidence'],
-                    notes=item.get('notes')
-                )
-                for item in response.json()
-            ]
+        """
+        Get all relationships for a claim.
+        
+        Lookups go through the batch loader, so concurrent calls for many
+        claims share a few queries.
+        """
+        as_source, as_target = await asyncio.gather(
+            self.loader.load('knowledge_relationships', 'source_claim_id', claim_id),
+            self.loader.load('knowledge_relationships', 'target_claim_id', claim_id)
+        )
+        
+        relationships = []
+        seen = set()
+        for item in (*as_source, *as_target):
+            if item['id'] in seen:
+                continue
+            seen.add(item['id'])
+            relationships.append(KnowledgeRelationship(
+                id=item['id'],
+                source_claim_id=item['source_claim_id'],
+                target_claim_id=item['target_claim_id'],
+                relationship_type=item['relationship_type'],
+                confidence=item['confidence'],
+                notes=item.get('notes')
+            ))
+        return relationships
     
     # ==================== Evidence Hierarchy ====================
     
     async def update_evidence_hierarchy(self, topic: str, category: str, score: float) -> bool:
         """Update or insert evidence hierarchy score."""
-        async with httpx.AsyncClient() as client:
-            # Try to update existing
-            response = await client.patch(
-                f"{self.url}/rest/v1/evidence_hierarchy",
-                headers=self.headers,
-                params={
-                    'topic': f'eq.{topic}',
-                    'category': f'eq.{category}'
-                },
-                json={
-                    'total_score': score,
-                    'updated_at': 'now()'
-                }
-            )
-            
-            if response.status_code == 204:
-                return True
-            
-            # If no update, insert new
-            response = await client.post(
-                f"{self.url}/rest/v1/evidence_hierarchy",
-                headers=self.headers,
-                json={
-                    'topic': topic,
-                    'category': category,
-                    'total_score': score
-                }
-            )
-            return response.status_code in [200, 201]
+        client = self._get_client()
+        # Try to update existing
+        response = await client.patch(
+            f"{self.url}/rest/v1/evidence_hierarchy",
+            headers=self.headers,
+            params={
+                'topic': f'eq.{topic}',
+                'category': f'eq.{category}'
+            },
+            json={
+                'total_score': score,
+                'updated_at': 'now()'
+            }
+        )
+        
+        if response.status_code == 204:
+            return True
+        
+        # If no update, insert new
+        response = await client.post(
+            f"{self.url}/rest/v1/evidence_hierarchy",
+            headers=self.headers,
+            json={
+                'topic': topic,
+                'category': category,
+                'total_score': score
+            }
+        )
+        return response.status_code in [200, 201]
     
     # ==================== Prompt Version Operations ====================
     
@@ -483,107 +670,107 @@ class SupabaseClient:
         limit: int = 50
     ) -> List[ScientificClaim]:
         """Fetch claims by category with filters."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params={
-                    'category': f'eq.{category}',
-                    'evidence_level': f'gte.{min_evidence_level}',
-                    'confidence_score': f'gte.{min_confidence}',
-                    'status': 'eq.validated',
-                    'limit': limit,
-                    'order': 'evidence_level.desc,confidence_score.desc'
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [self._parse_claim(item) for item in data]
+        client = self._get_client()
+        response = await client.get(
+            f"{self.url}/rest/v1/scientific_knowledge",
+            headers=self.headers,
+            params={
+                'category': f'eq.{category}',
+                'evidence_level': f'gte.{min_evidence_level}',
+                'confidence_score': f'gte.{min_confidence}',
+                'status': 'eq.validated',
+                'limit': limit,
+                'order': 'evidence_level.desc,confidence_score.desc'
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
+        return [self._parse_claim(item) for item in data]
     
     async def get_active_prompt(self, category: str) -> Optional[PromptVersion]:
         """Get active prompt for category."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/get_active_system_prompt",
-                headers=self.headers,
-                json={'p_category': category}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            if not data:
-                return None
-            
-            return PromptVersion(
-                id=data['id'],
-                category=category,
-                prompt_text=data['prompt_text'],
-                version=data['version'],
-                knowledge_snapshot=data['knowledge_snapshot'],
-                performance_score=None,
-                is_active=True,
-                created_at=parse_date_safe(data['created_at']),
-                metadata={}
-            )
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/get_active_system_prompt",
+            headers=self.headers,
+            json={'p_category': category}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        if not data:
+            return None
+        
+        return PromptVersion(
+            id=data['id'],
+            category=category,
+            prompt_text=data['prompt_text'],
+            version=data['version'],
+            knowledge_snapshot=data['knowledge_snapshot'],
+            performance_score=None,
+            is_active=True,
+            created_at=parse_date_safe(data['created_at']),
+            metadata={}
+        )
     
     async def get_latest_prompt_version(self, category: str) -> Optional[PromptVersion]:
         """Get latest prompt version for category."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/get_system_prompt_version",
-                headers=self.headers,
-                json={'p_category': category}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            if not data:
-                return None
-            
-            return PromptVersion(
-                id=data['id'],
-                category=category,
-                prompt_text=data['prompt_text'],
-                version=data['version'],
-                knowledge_snapshot=data['knowledge_snapshot'],
-                performance_score=None,
-                is_active=data['is_active'],
-                created_at=parse_date_safe(data['created_at']),
-                metadata={}
-            )
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/get_system_prompt_version",
+            headers=self.headers,
+            json={'p_category': category}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        if not data:
+            return None
+        
+        return PromptVersion(
+            id=data['id'],
+            category=category,
+            prompt_text=data['prompt_text'],
+            version=data['version'],
+            knowledge_snapshot=data['knowledge_snapshot'],
+            performance_score=None,
+            is_active=data['is_active'],
+            created_at=parse_date_safe(data['created_at']),
+            metadata={}
+        )
     
     async def save_prompt_version(self, prompt: PromptVersion) -> PromptVersion:
         """Save new prompt version."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/system_prompt_versions",
-                headers=self.headers,
-                json={
-                    'category': prompt.category,
-                    'prompt_text': prompt.prompt_text,
-                    'version': prompt.version,
-                    'knowledge_snapshot': prompt.knowledge_snapshot,
-                    'performance_score': prompt.performance_score,
-                    'is_active': prompt.is_active,
-                    'metadata': prompt.metadata
-                }
-            )
-            response.raise_for_status()
-            data = response.json()[0]
-            
-            prompt.id = data['id']
-            prompt.created_at = parse_date_safe(data['created_at'])
-            return prompt
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/system_prompt_versions",
+            headers=self.headers,
+            json={
+                'category': prompt.category,
+                'prompt_text': prompt.prompt_text,
+                'version': prompt.version,
+                'knowledge_snapshot': prompt.knowledge_snapshot,
+                'performance_score': prompt.performance_score,
+                'is_active': prompt.is_active,
+                'metadata': prompt.metadata
+            }
+        )
+        response.raise_for_status()
+        data = response.json()[0]
+        
+        prompt.id = data['id']
+        prompt.created_at = parse_date_safe(data['created_at'])
+        return prompt
     
     async def activate_prompt_version(self, prompt_id: str):
         """Activate a prompt version."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/activate_prompt_version",
-                headers=self.headers,
-                json={'p_prompt_id': prompt_id}
-            )
-            response.raise_for_status()
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/activate_prompt_version",
+            headers=self.headers,
+            json={'p_prompt_id': prompt_id}
+        )
+        response.raise_for_status()
     
     # ==================== AI Coach Functions ====================
     
@@ -598,39 +785,39 @@ class SupabaseClient:
         Returns:
             List of claims with pending embedding status
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/get_pending_embeddings",
-                headers=self.headers,
-                json={'max_results': limit}
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/get_pending_embeddings",
+            headers=self.headers,
+            json={'max_results': limit}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        return [
+            ScientificClaim(
+                id=item['id'],
+                claim=item['claim'],
+                claim_summary=item.get('claim_summary'),
+                category=item['category'],
+                evidence_level=item['evidence_level'],
+                confidence_score=0.5,  # Default for pending claims
+                status='active',
+                source_doi=None,
+                source_url=None,
+                source_title=None,
+                source_authors=[],
+                publication_date=None,
+                sample_size=None,
+                study_design=None,
+                population=None,
+                effect_size=None,
+                key_findings=[],
+                limitations=None,
+                conflicting_evidence=False
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            return [
-                ScientificClaim(
-                    id=item['id'],
-                    claim=item['claim'],
-                    claim_summary=item.get('claim_summary'),
-                    category=item['category'],
-                    evidence_level=item['evidence_level'],
-                    confidence_score=0.5,  # Default for pending claims
-                    status='active',
-                    source_doi=None,
-                    source_url=None,
-                    source_title=None,
-                    source_authors=[],
-                    publication_date=None,
-                    sample_size=None,
-                    study_design=None,
-                    population=None,
-                    effect_size=None,
-                    key_findings=[],
-                    limitations=None,
-                    conflicting_evidence=False
-                )
-                for item in data
-            ]
+            for item in data
+        ]
     
     async def update_embedding_status(
         self,
@@ -651,21 +838,21 @@ class SupabaseClient:
         Returns:
             True if successful
         """
-        async with httpx.AsyncClient() as client:
-            payload = {
-                'p_claim_id': claim_id,
-                'p_status': status
-            }
-            
-            if embedding is not None:
-                payload['p_embedding'] = embedding
-            
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/update_embedding_status",
-                headers=self.headers,
-                json=payload
-            )
-            return response.status_code in [200, 204]
+        client = self._get_client()
+        payload = {
+            'p_claim_id': claim_id,
+            'p_status': status
+        }
+        
+        if embedding is not None:
+            payload['p_embedding'] = embedding
+        
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/update_embedding_status",
+            headers=self.headers,
+            json=payload
+        )
+        return response.status_code in [200, 204]
     
     async def get_knowledge_context(
         self,
@@ -684,18 +871,18 @@ class SupabaseClient:
         Returns:
             Dictionary with context_text, knowledge_ids, avg_evidence_level
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/get_knowledge_context",
-                headers=self.headers,
-                json={
-                    'query_text': query_text,
-                    'max_results': max_results,
-                    'min_evidence_level': min_evidence_level
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/get_knowledge_context",
+            headers=self.headers,
+            json={
+                'query_text': query_text,
+                'max_results': max_results,
+                'min_evidence_level': min_evidence_level
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def save_message_knowledge(
         self,
@@ -714,17 +901,17 @@ class SupabaseClient:
         Returns:
             True if successful
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/save_message_knowledge",
-                headers=self.headers,
-                json={
-                    'p_message_id': message_id,
-                    'p_knowledge_ids': knowledge_ids,
-                    'p_evidence_level': evidence_level
-                }
-            )
-            return response.status_code in [200, 204]
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/save_message_knowledge",
+            headers=self.headers,
+            json={
+                'p_message_id': message_id,
+                'p_knowledge_ids': knowledge_ids,
+                'p_evidence_level': evidence_level
+            }
+        )
+        return response.status_code in [200, 204]
     
     async def get_relevant_knowledge_for_query(
         self,
@@ -745,23 +932,23 @@ class SupabaseClient:
         Returns:
             List of knowledge records with relevance scores
         """
-        async with httpx.AsyncClient() as client:
-            payload = {
-                'query_text': query_text,
-                'max_results': max_results,
-                'min_evidence_level': min_evidence_level
-            }
-            
-            if filter_categories is not None:
-                payload['filter_categories'] = filter_categories
-            
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/get_relevant_knowledge_for_query",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        payload = {
+            'query_text': query_text,
+            'max_results': max_results,
+            'min_evidence_level': min_evidence_level
+        }
+        
+        if filter_categories is not None:
+            payload['filter_categories'] = filter_categories
+        
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/get_relevant_knowledge_for_query",
+            headers=self.headers,
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json()
 
     # ==================== Trusted Sources Operations ====================
 
@@ -775,19 +962,19 @@ class SupabaseClient:
         Returns:
             List of trusted author records
         """
-        async with httpx.AsyncClient() as client:
-            params = {}
-            if active_only:
-                params['is_active'] = 'eq.true'
+        client = self._get_client()
+        params = {}
+        if active_only:
+            params['is_active'] = 'eq.true'
 
-            response = await client.get(
-                f"{self.url}/rest/v1/trusted_authors",
-                headers=self.headers,
-                params=params
-            )
-            if response.status_code == 200:
-                return response.json()
-            return []
+        response = await client.get(
+            f"{self.url}/rest/v1/trusted_authors",
+            headers=self.headers,
+            params=params
+        )
+        if response.status_code == 200:
+            return response.json()
+        return []
 
     async def get_trusted_journals(self, active_only: bool = True) -> List[Dict[str, Any]]:
         """
@@ -799,19 +986,19 @@ class SupabaseClient:
         Returns:
             List of trusted journal records
         """
-        async with httpx.AsyncClient() as client:
-            params = {}
-            if active_only:
-                params['is_active'] = 'eq.true'
+        client = self._get_client()
+        params = {}
+        if active_only:
+            params['is_active'] = 'eq.true'
 
-            response = await client.get(
-                f"{self.url}/rest/v1/trusted_journals",
-                headers=self.headers,
-                params=params
-            )
-            if response.status_code == 200:
-                return response.json()
-            return []
+        response = await client.get(
+            f"{self.url}/rest/v1/trusted_journals",
+            headers=self.headers,
+            params=params
+        )
+        if response.status_code == 200:
+            return response.json()
+        return []
 
     async def check_trusted_author(self, author_name: str) -> Dict[str, Any]:
         """
@@ -823,17 +1010,17 @@ class SupabaseClient:
         Returns:
             Dictionary with is_trusted, priority_boost, author_id
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/is_trusted_author",
-                headers=self.headers,
-                json={'author_name': author_name}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    return data[0] if isinstance(data, list) else data
-            return {'is_trusted': False, 'priority_boost': 0, 'author_id': None}
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/is_trusted_author",
+            headers=self.headers,
+            json={'author_name': author_name}
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if data:
+                return data[0] if isinstance(data, list) else data
+        return {'is_trusted': False, 'priority_boost': 0, 'author_id': None}
 
     async def check_trusted_journal(self, journal_name: str) -> Dict[str, Any]:
         """
@@ -845,17 +1032,17 @@ class SupabaseClient:
         Returns:
             Dictionary with is_trusted, priority_boost, journal_id
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/rest/v1/rpc/is_trusted_journal",
-                headers=self.headers,
-                json={'journal_name': journal_name}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    return data[0] if isinstance(data, list) else data
-            return {'is_trusted': False, 'priority_boost': 0, 'journal_id': None}
+        client = self._get_client()
+        response = await client.post(
+            f"{self.url}/rest/v1/rpc/is_trusted_journal",
+            headers=self.headers,
+            json={'journal_name': journal_name}
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if data:
+                return data[0] if isinstance(data, list) else data
+        return {'is_trusted': False, 'priority_boost': 0, 'journal_id': None}
 
     async def get_trusted_knowledge(
         self,
@@ -872,21 +1059,21 @@ class SupabaseClient:
         Returns:
             List of trusted ScientificClaim objects
         """
-        async with httpx.AsyncClient() as client:
-            params = {
-                'trusted_source': 'eq.true',
-                'status': 'eq.active',
-                'limit': limit,
-                'order': 'evidence_level.desc'
-            }
-            if category:
-                params['category'] = f'eq.{category}'
+        client = self._get_client()
+        params = {
+            'trusted_source': 'eq.true',
+            'status': 'eq.active',
+            'limit': limit,
+            'order': 'evidence_level.desc'
+        }
+        if category:
+            params['category'] = f'eq.{category}'
 
-            response = await client.get(
-                f"{self.url}/rest/v1/scientific_knowledge",
-                headers=self.headers,
-                params=params
-            )
-            if response.status_code == 200:
-                return [self._parse_claim(item) for item in response.json()]
-            return []
\ No newline at end of file
+        response = await client.get(
+            f"{self.url}/rest/v1/scientific_knowledge",
+            headers=self.headers,
+            params=params
+        )
+        if response.status_code == 200:
+            return [self._parse_claim(item) for item in response.json()]
+        return []
\ No newline at end of file
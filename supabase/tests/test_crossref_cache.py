@@ -0,0 +1,53 @@
+"""
+Tests for the CrossRef response cache.
+"""
+
+from unittest.mock import patch
+
+from services.crossref_cache import SQLiteResponseCache, response_key
+
+
+class TestResponseKey:
+    """Test response_key function."""
+
+    def test_param_order_is_ignored(self):
+        """Test that the same parameters in any order give the same key."""
+        url = 'https://api.crossref.org/works'
+        assert response_key(url, {'query': 'a', 'rows': 5}) == response_key(url, {'rows': 5, 'query': 'a'})
+
+    def test_no_params(self):
+        """Test that a request without parameters is keyed by its URL."""
+        assert response_key('https://api.crossref.org/works/10.1/x') == 'https://api.crossref.org/works/10.1/x'
+
+
+class TestSQLiteResponseCache:
+    """Test SQLiteResponseCache class."""
+
+    def test_get_missing_key(self):
+        """Test that a missing key returns no body."""
+        assert SQLiteResponseCache().get('missing') == (None, None, False)
+
+    def test_round_trip(self):
+        """Test that a stored response is returned fresh with its ETag."""
+        cache = SQLiteResponseCache()
+        cache.set('k', {'message': {'DOI': '10.1/x'}}, etag='"abc"')
+        assert cache.get('k') == ({'message': {'DOI': '10.1/x'}}, '"abc"', True)
+        assert len(cache) == 1
+
+    def test_expired_entry_is_stale_until_touched(self):
+        """Test that expired entries are kept for revalidation and refreshed by touch."""
+        cache = SQLiteResponseCache(ttl=10)
+        with patch('services.crossref_cache.time.time', return_value=100.0):
+            cache.set('k', {'a': 1}, etag='"abc"')
+        with patch('services.crossref_cache.time.time', return_value=111.0):
+            assert cache.get('k') == ({'a': 1}, '"abc"', False)
+            cache.touch('k')
+            assert cache.get('k')[2] is True
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that responses survive reopening the database file."""
+        path = str(tmp_path / 'crossref.sqlite')
+        cache = SQLiteResponseCache(path)
+        cache.set('k', {'a': 1})
+        cache.close()
+        assert SQLiteResponseCache(path).get('k')[0] == {'a': 1}
@@ -25,7 +25,13 @@ class TestCrossRefServiceInitialization:
         service = CrossRefService(mailto="test@example.com")
         assert service.mailto == "test@example.com"
         assert 'mailto:test@example.com' in service.headers['User-Agent']
-    
+
+    def test_init_with_project_url(self):
+        """Test that project_url replaces the default in the User-Agent."""
+        service = CrossRefService(project_url="https://example.com/bot")
+        assert '(https://example.com/bot)' in service.headers['User-Agent']
+        assert CrossRefService.PROJECT_URL not in service.headers['User-Agent']
+
     def test_default_queries(self):
         """Test that default queries are set."""
         service = CrossRefService()
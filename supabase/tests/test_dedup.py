@@ -0,0 +1,76 @@
+"""
+Tests for near-duplicate detection utilities.
+"""
+
+from utils.dedup import (
+    shingles,
+    MinHasher,
+    estimate_jaccard,
+    cluster_near_duplicates
+)
+
+
+class TestShingles:
+    """Test shingles function."""
+
+    def test_shingles_normalizes_case_and_whitespace(self):
+        """Test that case and whitespace differences are ignored."""
+        assert shingles('Protein  Intake') == shingles('protein intake')
+
+    def test_shingles_short_text(self):
+        """Test text shorter than shingle size."""
+        assert shingles('abc', size=5) == {'abc'}
+
+    def test_shingles_empty_text(self):
+        """Test empty text returns no shingles."""
+        assert shingles('   ') == set()
+
+
+class TestMinHasher:
+    """Test MinHasher class."""
+
+    def test_signature_length(self):
+        """Test signature has num_perm values."""
+        hasher = MinHasher(num_perm=64)
+        assert len(hasher.signature(shingles('creatine improves strength'))) == 64
+
+    def test_identical_texts_have_identical_signatures(self):
+        """Test identical shingle sets produce the same signature."""
+        hasher = MinHasher()
+        text = 'resistance training increases muscle hypertrophy'
+        sig_a = hasher.signature(shingles(text))
+        sig_b = hasher.signature(shingles(text))
+        assert estimate_jaccard(sig_a, sig_b) == 1.0
+
+    def test_different_texts_have_low_similarity(self):
+        """Test unrelated texts have low estimated similarity."""
+        hasher = MinHasher()
+        sig_a = hasher.signature(shingles('resistance training increases muscle hypertrophy'))
+        sig_b = hasher.signature(shingles('sleep deprivation impairs glucose metabolism'))
+        assert estimate_jaccard(sig_a, sig_b) < 0.3
+
+
+class TestClusterNearDuplicates:
+    """Test cluster_near_duplicates function."""
+
+    def test_empty_input(self):
+        """Test empty batch."""
+        assert cluster_near_duplicates([]) == []
+
+    def test_unique_texts_map_to_themselves(self):
+        """Test that distinct texts each form their own cluster."""
+        texts = [
+            'Creatine supplementation increases maximal strength in trained men.',
+            'Sleep deprivation impairs recovery after high intensity exercise.',
+            'Higher protein intake supports lean mass retention during a deficit.',
+        ]
+        assert cluster_near_duplicates(texts) == [0, 1, 2]
+
+    def test_near_duplicates_are_grouped(self):
+        """Test that near-identical texts share the first member's index."""
+        texts = [
+            'Creatine supplementation increases maximal strength in resistance-trained men.',
+            'Sleep deprivation impairs recovery after high intensity exercise.',
+            'Creatine supplementation increases maximal strength in resistance trained men.',
+        ]
+        assert cluster_near_duplicates(texts) == [0, 1, 0]
@@ -0,0 +1,78 @@
+"""
+Tests for the fitness website scraper.
+"""
+
+import pytest
+from datetime import date
+
+from services.fitness_scraper_service import FitnessScraperService
+
+
+class TestParseDate:
+    """Test _parse_date method."""
+
+    @pytest.fixture
+    def scraper(self):
+        return FitnessScraperService()
+
+    @pytest.mark.parametrize('text, expected', [
+        ('January 15, 2024', date(2024, 1, 15)),
+        ('Jan 5, 2024', date(2024, 1, 5)),
+        ('2024-01-15', date(2024, 1, 15)),
+        ('15 January 2024', date(2024, 1, 15)),
+        ('15 jan 2024', date(2024, 1, 15)),
+        ('2024/01/15', date(2024, 1, 15)),
+        ('  2024-01-15  ', date(2024, 1, 15)),
+    ])
+    def test_common_formats(self, scraper, text, expected):
+        """Test the formats commonly found on websites."""
+        assert scraper._parse_date(text) == expected
+
+    def test_numeric_dates_prefer_day_first(self, scraper):
+        """Test that ambiguous numeric dates are read as day/month."""
+        assert scraper._parse_date('02/03/2024') == date(2024, 3, 2)
+
+    def test_numeric_dates_fall_back_to_month_first(self, scraper):
+        """Test that month/day is used when day/month is impossible."""
+        assert scraper._parse_date('01/15/2024') == date(2024, 1, 15)
+
+    def test_unusual_format_uses_dateutil(self, scraper):
+        """Test that unmatched strings still go through dateutil."""
+        assert scraper._parse_date('Sept 5, 2024') == date(2024, 9, 5)
+
+    @pytest.mark.parametrize('text', ['', 'Feb 30, 2024', '3 days ago'])
+    def test_invalid_dates(self, scraper, text):
+        """Test that empty, impossible and relative dates return None."""
+        assert scraper._parse_date(text) is None
+
+
+class TestExtractArticlesFromPage:
+    """Test _extract_articles_from_page method."""
+
+    SITE = {
+        'name': 'Example',
+        'article_selector': 'article, .blog-post',
+        'title_selector': 'h2 a, h3 a',
+        'link_selector': 'h2 a, h3 a',
+        'description_selector': '.excerpt',
+        'date_selector': 'time',
+        'categories': ['nutrition'],
+    }
+
+    def test_extracts_fields(self):
+        """Test that title, link, description and date are extracted."""
+        html = (
+            '<article><h2><a href="/posts/1">Protein  timing</a></h2>'
+            '<p class="excerpt">Spread   intake</p><time>Jan 5, 2024</time></article>'
+            '<div class="blog-post"><h3><a href="https://other.com/2">Sleep</a></h3></div>'
+        )
+        articles = FitnessScraperService()._extract_articles_from_page(
+            html, self.SITE, 'https://example.com/blog/'
+        )
+
+        assert [a.title for a in articles] == ['Protein timing', 'Sleep']
+        assert articles[0].link == 'https://example.com/posts/1'
+        assert articles[0].description == 'Spread intake'
+        assert articles[0].publication_date == date(2024, 1, 5)
+        assert articles[1].link == 'https://other.com/2'
+        assert articles[1].categories == ['nutrition']
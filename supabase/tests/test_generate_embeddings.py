@@ -0,0 +1,75 @@
+"""
+Tests for the embedding generation script.
+"""
+
+import asyncio
+import base64
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+from generate_embeddings import (
+    EmbeddingGenerator,
+    KnowledgeClaim,
+    generate_embeddings_for_all
+)
+
+
+class FakeEmbeddings:
+    """Stands in for client.embeddings, tracking concurrent create() calls."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def create(self, model, input, encoding_format):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            encoded = base64.b64encode(array('f', [0.5]).tobytes()).decode()
+            return SimpleNamespace(data=[SimpleNamespace(embedding=encoded) for _ in input])
+        finally:
+            self.in_flight -= 1
+
+
+class FakeSupabase:
+    """Serves pages of claims and records bulk updates."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.updated = []
+
+    async def iter_claims_without_embeddings(self, page_size):
+        for page in self.pages:
+            yield page
+
+    async def bulk_update_embeddings(self, updates):
+        self.updated.extend(updates)
+        return len(updates)
+
+
+class TestGenerateEmbeddingsForAll:
+    """Test generate_embeddings_for_all function."""
+
+    @pytest.mark.asyncio
+    async def test_page_is_embedded_in_concurrent_chunks(self):
+        """Test that one page is split into requests that run at the same time."""
+        claims = [
+            KnowledgeClaim(id=str(i), claim=f'claim {i}', category='c',
+                           evidence_level=2, has_embedding=False)
+            for i in range(50)
+        ]
+        supabase = FakeSupabase([claims])
+        generator = EmbeddingGenerator('sk-test', requests_per_minute=60000)
+        embeddings = FakeEmbeddings()
+        generator.client = SimpleNamespace(embeddings=embeddings)
+
+        await generate_embeddings_for_all(supabase, generator, batch_size=50, embed_chunk_size=10)
+
+        assert embeddings.calls == 5
+        assert embeddings.max_in_flight > 1
+        assert len(supabase.updated) == 50
@@ -0,0 +1,36 @@
+"""
+Tests for the health check system.
+"""
+
+from datetime import datetime, timezone
+
+import orjson
+
+from monitoring.health_check import ComponentHealth, HealthStatus, HealthStatusEnum
+
+
+class TestHealthStatus:
+    """Test HealthStatus class."""
+
+    def test_to_json_non_str_detail_keys(self):
+        """Test that details keyed by ints serialize with string keys."""
+        now = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        status = HealthStatus(
+            status=HealthStatusEnum.HEALTHY,
+            timestamp=now,
+            components={
+                'agents': ComponentHealth(
+                    name='agents',
+                    status=HealthStatusEnum.HEALTHY,
+                    response_time_ms=1.5,
+                    details={200: 3, 503: 1},
+                    timestamp=now
+                )
+            },
+            overall_response_time_ms=1.5
+        )
+
+        data = orjson.loads(status.to_json())
+
+        assert data['status'] == 'healthy'
+        assert data['components']['agents']['details'] == {'200': 3, '503': 1}
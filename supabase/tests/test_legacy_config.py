@@ -0,0 +1,33 @@
+"""
+Tests for the deprecated Config class.
+"""
+
+import pytest
+
+from config import Config
+from config import legacy
+
+
+@pytest.fixture(autouse=True)
+def reset_warnings():
+    """Let every test see the once-per-process deprecation warnings."""
+    legacy._emitted_warnings.clear()
+    yield
+    legacy._emitted_warnings.clear()
+
+
+class TestConfig:
+    """Test Config class."""
+
+    def test_from_settings_reads_through(self, test_settings):
+        """Test that a Config built from settings reads its fields from them."""
+        with pytest.warns(DeprecationWarning):
+            config = Config.from_settings(test_settings)
+        assert config.supabase_url == test_settings.supabase_url
+        assert config.to_settings() is test_settings
+
+    def test_warning_points_at_caller(self):
+        """Test that the deprecation warning names the line that built Config."""
+        with pytest.warns(DeprecationWarning) as record:
+            Config(supabase_url='http://localhost:54321')
+        assert record[0].filename == __file__
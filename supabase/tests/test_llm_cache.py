@@ -0,0 +1,117 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from services.llm_service import LLMService
+from services.llm_cache import CachedLLMService, InMemoryLRU, completion_key
+
+
+class TestInMemoryLRU:
+    """Test InMemoryLRU cache."""
+
+    def test_get_missing_key(self):
+        """Test that a missing key returns None."""
+        assert InMemoryLRU().get('missing') is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted when full."""
+        cache = InMemoryLRU(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after their TTL."""
+        cache = InMemoryLRU(ttl=10)
+        with patch('services.llm_cache.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+        with patch('services.llm_cache.time.monotonic', return_value=111.0):
+            assert cache.get('a') is None
+        assert len(cache) == 0
+
+
+class TestCompletionKey:
+    """Test completion_key function."""
+
+    def test_key_depends_on_all_parts(self):
+        """Test that changing any part changes the key."""
+        base = completion_key('openai', 'gpt-4o', 'prompt', 0.1)
+        assert base == completion_key('openai', 'gpt-4o', 'prompt', 0.1)
+        assert base != completion_key('openai', 'gpt-4o', 'prompt', 0.2)
+        assert base != completion_key('kimi', 'gpt-4o', 'prompt', 0.1)
+
+
+class TestCachedLLMService:
+    """Test CachedLLMService proxy."""
+
+    @pytest.fixture
+    def llm(self):
+        """LLMService whose provider call is counted instead of sent."""
+        service = LLMService(openai_api_key='sk-test', default_provider='openai')
+        service.calls = 0
+
+        async def fake_call(prompt, temperature=0.1, max_tokens=2000):
+            service.calls += 1
+            return '{"conflict_detected": true, "conflict_type": "direct"}'
+
+        service._call_llm = fake_call
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_hits_cache(self, llm):
+        """Test that an identical request is served without a provider call."""
+        cached = CachedLLMService(llm)
+        args = ('claim a', 2, 'rct', 'claim b', 3, 'cohort')
+
+        first = await cached.detect_conflict(*args)
+        second = await cached.detect_conflict(*args)
+
+        assert first == second
+        assert first['conflict_detected'] is True
+        assert llm.calls == 1
+        assert cached.get_status()['cache_hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, llm):
+        """Test that a failed provider call is retried on the next request."""
+        cached = CachedLLMService(llm)
+
+        async def failing_call(prompt, temperature=0.1, max_tokens=2000):
+            llm.calls += 1
+            raise RuntimeError("provider down")
+
+        llm._call_llm = failing_call
+        args = ('claim a', 2, 'rct', 'claim b', 3, 'cohort')
+
+        result = await cached.detect_conflict(*args)
+        await cached.detect_conflict(*args)
+
+        assert result['conflict_detected'] is False
+        assert llm.calls == 2
+        assert len(cached.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_unparseable_responses_are_not_cached(self, llm):
+        """Test that malformed output is re-requested instead of cached."""
+        cached = CachedLLMService(llm)
+
+        async def malformed_call(prompt, temperature=0.1, max_tokens=2000):
+            llm.calls += 1
+            return 'Sorry, I cannot help with that.'
+
+        llm._call_llm = malformed_call
+        args = ('claim a', 2, 'rct', 'claim b', 3, 'cohort')
+
+        result = await cached.detect_conflict(*args)
+        await cached.detect_conflict(*args)
+
+        assert result['conflict_detected'] is False
+        assert llm.calls == 2
+        assert len(cached.cache) == 0
@@ -0,0 +1,69 @@
+"""
+Tests for the validation agent.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from agents.validation_agent import ValidationAgent
+from services.supabase_client import ScientificClaim
+
+
+def make_claim(claim_id: str, evidence_level: int) -> ScientificClaim:
+    return ScientificClaim(
+        id=claim_id,
+        claim='Creatine supplementation increases lean body mass in resistance-trained adults',
+        claim_summary=None,
+        category='supplements',
+        evidence_level=evidence_level,
+        confidence_score=0.6,
+        status='draft',
+        source_doi=None,
+        source_url=None,
+        source_title=None,
+        source_authors=[],
+        publication_date=None,
+        sample_size=None,
+        study_design=None,
+        population=None,
+        effect_size=None,
+        key_findings=[],
+        limitations=None,
+        conflicting_evidence=False
+    )
+
+
+def make_agent(claims):
+    supabase = Mock()
+    supabase.get_trusted_journals = AsyncMock(return_value=[])
+    supabase.get_all_active_claims = AsyncMock(return_value=claims)
+    supabase.update_claim = AsyncMock()
+    return ValidationAgent(supabase=supabase), supabase
+
+
+def updated_statuses(supabase):
+    return {call.args[0]: call.args[1]['status'] for call in supabase.update_claim.call_args_list}
+
+
+class TestBatchDuplicates:
+    """Test handling of near-duplicate claims within one batch."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_rejected_after_canonical_approved(self):
+        """Test that duplicates are rejected once the canonical claim passes."""
+        agent, supabase = make_agent([make_claim('dup', 3), make_claim('canonical', 5)])
+
+        results = await agent.process()
+
+        assert updated_statuses(supabase) == {'canonical': 'active', 'dup': 'deprecated'}
+        assert results['batch_duplicates'] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicates_stay_draft_when_canonical_rejected(self):
+        """Test that duplicates are left for the next run if the canonical claim fails."""
+        agent, supabase = make_agent([make_claim('canonical', 1), make_claim('dup', 1)])
+
+        results = await agent.process()
+
+        assert updated_statuses(supabase) == {'canonical': 'deprecated'}
+        assert results['batch_duplicates'] == 0
@@ -3,6 +3,7 @@ Utility functions for Agent Swarm Knowledge System.
 """
 
 from .date_utils import parse_date_safe, format_date_for_db, datetime_to_date
+from .dedup import cluster_near_duplicates
 
 # Retry system - simplified imports
 from .retry import (
@@ -33,4 +34,7 @@ __all__ = [
     'LinearBackoffStrategy', 'FibonacciBackoffStrategy', 'CustomStrategy',
     'AdaptiveBackoffStrategy', 'JitterType',
     'RateLimiter',
+
+    # Deduplication
+    'cluster_near_duplicates',
 ]
@@ -0,0 +1,142 @@
+"""
+Near-duplicate detection for short texts (claims, abstracts).
+
+Uses MinHash signatures over character shingles with LSH banding, so a
+batch of N texts is clustered in roughly O(N) instead of comparing every
+pair. Candidates sharing a band are confirmed by estimated Jaccard
+similarity before being grouped.
+"""
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import random
+import re
+import zlib
+
+# Largest Mersenne prime below 2^64, used for universal hashing
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    """
+    Split text into overlapping character shingles.
+
+    Args:
+        text: Text to shingle (case and whitespace are normalized)
+        size: Shingle length in characters
+
+    Returns:
+        Set of shingles (the whole text if shorter than size)
+    """
+    normalized = _WHITESPACE_RE.sub(' ', text.lower()).strip()
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick (bands, rows) whose LSH threshold (1/b)^(1/r) is closest to threshold."""
+    best = (1, num_perm)
+    best_error = float('inf')
+    for bands in range(1, num_perm + 1):
+        if num_perm % bands:
+            continue
+        rows = num_perm // bands
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """Computes fixed-size MinHash signatures for shingle sets."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        """
+        Initialize the hasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            seed: Seed for the permutation parameters
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Set[str]) -> Tuple[int, ...]:
+        """
+        Compute the MinHash signature of a shingle set.
+
+        Args:
+            shingle_set: Shingles to hash
+
+        Returns:
+            Tuple of num_perm minimum hash values
+        """
+        if not shingle_set:
+            return (_MAX_HASH,) * self.num_perm
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingle_set]
+        prime = _MERSENNE_PRIME
+        return tuple(
+            min(((a * h + b) % prime) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+
+def estimate_jaccard(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    if not sig_a:
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def cluster_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = 0.85,
+    num_perm: int = 128,
+    shingle_size: int = 5
+) -> List[int]:
+    """
+    Group near-duplicate texts.
+
+    Args:
+        texts: Texts to cluster
+        threshold: Minimum estimated Jaccard similarity to count as duplicate
+        num_perm: MinHash signature length
+        shingle_size: Character shingle length
+
+    Returns:
+        For each text, the index of the first text in its cluster
+        (texts that are not duplicates map to their own index)
+    """
+    hasher = MinHasher(num_perm=num_perm)
+    bands, rows = _optimal_bands(threshold, num_perm)
+    buckets: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+    signatures: List[Tuple[int, ...]] = []
+    clusters: List[int] = []
+
+    for index, text in enumerate(texts):
+        signature = hasher.signature(shingles(text, shingle_size))
+        signatures.append(signature)
+
+        cluster: Optional[int] = None
+        band_keys = [
+            (band, signature[band * rows:(band + 1) * rows])
+            for band in range(bands)
+        ]
+        for key in band_keys:
+            candidate = buckets.get(key)
+            if candidate is not None and estimate_jaccard(signature, signatures[candidate]) >= threshold:
+                cluster = clusters[candidate]
+                break
+
+        clusters.append(index if cluster is None else cluster)
+        for key in band_keys:
+            buckets.setdefault(key, index)
+
+    return clusters